@@ -1,8 +1,8 @@
 """Configuration management and language definitions."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, Tuple
 
 
 class LanguageCode(str, Enum):
@@ -21,7 +21,7 @@ class LanguageCode(str, Enum):
     ITALIAN = "it"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Language:
     """Language configuration with ISO code and display information."""
 
@@ -35,75 +35,95 @@ class Language:
         return self.display_name
 
 
-# Language registry
-SUPPORTED_LANGUAGES: Dict[LanguageCode, Language] = {
-    LanguageCode.AUTO: Language(
+# Language registry, in LanguageCode declaration order
+_LANGUAGES: Tuple[Language, ...] = (
+    Language(
         code=LanguageCode.AUTO,
         name="Auto Detect",
         display_name="자동 감지",
         is_supported=True,
     ),
-    LanguageCode.KOREAN: Language(
+    Language(
         code=LanguageCode.KOREAN,
         name="Korean",
         display_name="한국어",
         is_supported=True,
     ),
-    LanguageCode.ENGLISH: Language(
+    Language(
         code=LanguageCode.ENGLISH,
         name="English",
         display_name="English",
         is_supported=True,
     ),
-    LanguageCode.JAPANESE: Language(
+    Language(
         code=LanguageCode.JAPANESE,
         name="Japanese",
         display_name="日本語",
         is_supported=True,
     ),
-    LanguageCode.CHINESE: Language(
+    Language(
         code=LanguageCode.CHINESE,
         name="Chinese",
         display_name="中文",
         is_supported=True,
     ),
-    LanguageCode.SPANISH: Language(
+    Language(
         code=LanguageCode.SPANISH,
         name="Spanish",
         display_name="Español",
         is_supported=True,
     ),
-    LanguageCode.FRENCH: Language(
+    Language(
         code=LanguageCode.FRENCH,
         name="French",
         display_name="Français",
         is_supported=True,
     ),
-    LanguageCode.GERMAN: Language(
+    Language(
         code=LanguageCode.GERMAN,
         name="German",
         display_name="Deutsch",
         is_supported=True,
     ),
-    LanguageCode.RUSSIAN: Language(
+    Language(
         code=LanguageCode.RUSSIAN,
         name="Russian",
         display_name="Русский",
         is_supported=True,
     ),
-    LanguageCode.PORTUGUESE: Language(
+    Language(
         code=LanguageCode.PORTUGUESE,
         name="Portuguese",
         display_name="Português",
         is_supported=True,
     ),
-    LanguageCode.ITALIAN: Language(
+    Language(
         code=LanguageCode.ITALIAN,
         name="Italian",
         display_name="Italiano",
         is_supported=True,
     ),
-}
+)
+
+# ISO code string -> position in _LANGUAGES
+_CODE_INDEX: Dict[str, int] = {lang.code.value: i for i, lang in enumerate(_LANGUAGES)}
+
+# Mapping view kept for callers that iterate or look up by LanguageCode
+SUPPORTED_LANGUAGES: Dict[LanguageCode, Language] = {lang.code: lang for lang in _LANGUAGES}
+
+# get_supported_languages() results, built once at import
+_ALL_LANGS: Tuple[Language, ...] = tuple(lang for lang in _LANGUAGES if lang.is_supported)
+_NON_AUTO_LANGS: Tuple[Language, ...] = tuple(
+    lang for lang in _ALL_LANGS if lang.code != LanguageCode.AUTO
+)
+
+# Selectable languages (all but AUTO) ordered by display name, for dropdowns
+SORTED_LANGUAGES: Tuple[Language, ...] = tuple(
+    sorted(
+        (lang for lang in _LANGUAGES if lang.code != LanguageCode.AUTO),
+        key=lambda lang: lang.display_name,
+    )
+)
 
 
 def get_language(code: LanguageCode) -> Language:
@@ -119,41 +139,46 @@ def get_language(code: LanguageCode) -> Language:
     Raises:
         KeyError: If language code is not supported
     """
-    return SUPPORTED_LANGUAGES[code]
+    # Plain strings have no .value; they are looked up as-is
+    return _LANGUAGES[_CODE_INDEX[getattr(code, "value", code)]]
 
 
-def get_supported_languages(exclude_auto: bool = False) -> List[Language]:
+def get_supported_languages(exclude_auto: bool = False) -> Tuple[Language, ...]:
     """
-    Get list of all supported languages.
+    Get all supported languages.
 
     Args:
         exclude_auto: If True, exclude auto-detection option
 
     Returns:
-        List of supported languages
+        Shared, immutable tuple of supported languages
     """
-    languages = [lang for lang in SUPPORTED_LANGUAGES.values() if lang.is_supported]
+    return _NON_AUTO_LANGS if exclude_auto else _ALL_LANGS
 
-    if exclude_auto:
-        languages = [lang for lang in languages if lang.code != LanguageCode.AUTO]
 
-    return languages
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelConfig:
     """Translation model configuration."""
 
     model_id: str = "yanolja/YanoljaNEXT-Rosetta-4B"
     device: str = "auto"  # auto, mps, cpu
-    quantization: str = "none"  # int8, int4, none - using "none" for MPS compatibility
+    quantization: str = "auto"  # auto, int8, int4, none - auto: int4 on CUDA under 16 GB
+    force_quantization: bool = False  # Quantize on MPS/CPU despite the slower kernels
     max_new_tokens: int = 512
     dtype: str = "bfloat16"
-    repetition_penalty: float = 1.2
-    no_repeat_ngram_size: int = 3
-
-
-@dataclass(frozen=True)
+    # Repetition controls run as per-step Python logits processors during
+    # decoding; translation prompts rarely loop, so both are off by default
+    repetition_penalty: float = 1.0  # 1.0 disables
+    no_repeat_ngram_size: int = 0  # 0 disables
+    compile_model: bool = True  # torch.compile the forward pass on CUDA
+    # Opt-in: load unquantized weights straight onto the GPU, bypassing
+    # from_pretrained's key renaming, weight tying and device_map placement
+    fast_load: bool = False
+    prompt_lookup_num_tokens: int = 0  # Draft length for prompt lookup decoding, 0 disables
+    use_executorch: bool = False  # Export to ExecuTorch on CPU/MPS (needs optimum-executorch)
+
+
+@dataclass(frozen=True, slots=True)
 class PerformanceConfig:
     """Performance thresholds and limits."""
 
@@ -170,12 +195,13 @@ class PerformanceConfig:
 
     # UI responsiveness
     debounce_delay_ms: int = 500  # Debounce delay for text input
+    text_changed_delay_ms: int = 80  # Delay before edits update the counter and buttons
 
     # Model loading
     model_load_timeout: int = 30  # seconds
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ErrorHandlingConfig:
     """Error handling and retry configuration."""
 
@@ -192,16 +218,17 @@ class ErrorHandlingConfig:
     memory_error_max_retries: int = 1  # Only retry once for memory errors
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HistoryConfig:
     """Translation history configuration."""
 
     max_entries: int = 50  # Maximum number of history entries
     preview_length: int = 100  # Characters to show in preview
     search_debounce_ms: int = 150  # Search debounce delay
+    save_debounce_ms: int = 500  # Delay before pending changes are written
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Application-wide configuration."""
 
@@ -222,16 +249,16 @@ class AppConfig:
     window_default_height: int = 700
 
     # Model Configuration
-    model: ModelConfig = ModelConfig()
+    model: ModelConfig = field(default_factory=ModelConfig)
 
     # Performance Configuration
-    performance: PerformanceConfig = PerformanceConfig()
+    performance: PerformanceConfig = field(default_factory=PerformanceConfig)
 
     # Error Handling Configuration
-    error_handling: ErrorHandlingConfig = ErrorHandlingConfig()
+    error_handling: ErrorHandlingConfig = field(default_factory=ErrorHandlingConfig)
 
     # History Configuration
-    history: HistoryConfig = HistoryConfig()
+    history: HistoryConfig = field(default_factory=HistoryConfig)
 
     # Logging
     log_level: str = "INFO"  # DEBUG, INFO, WARNING, ERROR
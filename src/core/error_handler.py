@@ -2,6 +2,7 @@
 
 from dataclasses import dataclass
 from enum import Enum, auto
+from functools import lru_cache
 from typing import Optional
 import re
 
@@ -17,7 +18,7 @@ class ErrorType(Enum):
     UNKNOWN = auto()  # 알 수 없는 에러
 
 
-@dataclass
+@dataclass(slots=True)
 class TranslationError:
     """Structured translation error information."""
 
@@ -65,6 +66,18 @@ ERROR_MESSAGES: dict[ErrorType, dict] = {
 }
 
 
+# ERROR_MESSAGES flattened to (cause, solution, is_retryable) tuples indexed
+# by ErrorType.value - 1, so classification does one tuple index per error
+_ERROR_INFO: tuple[tuple[str, str, bool], ...] = tuple(
+    (
+        ERROR_MESSAGES[error_type]["cause"],
+        ERROR_MESSAGES[error_type]["solution"],
+        ERROR_MESSAGES[error_type]["is_retryable"],
+    )
+    for error_type in ErrorType
+)
+
+
 class ErrorClassifier:
     """Classifies exceptions into structured TranslationError."""
 
@@ -102,6 +115,14 @@ class ErrorClassifier:
         r"deadline exceeded",
     ]
 
+    # 카테고리별 패턴을 하나의 소문자 정규식으로 미리 컴파일
+    # (메시지를 한 번 소문자로 바꿔 검색하므로 IGNORECASE 불필요;
+    # 패턴에 대소문자 구분 이스케이프(\S, \W 등)가 없어야 함)
+    NETWORK_RE = re.compile("|".join(NETWORK_PATTERNS).lower())
+    MEMORY_RE = re.compile("|".join(MEMORY_PATTERNS).lower())
+    MODEL_RE = re.compile("|".join(MODEL_PATTERNS).lower())
+    TIMEOUT_RE = re.compile("|".join(TIMEOUT_PATTERNS).lower())
+
     @classmethod
     def classify(
         cls,
@@ -121,14 +142,14 @@ class ErrorClassifier:
             TranslationError with classified type and user-friendly messages
         """
         error_type = cls._determine_type(exception, message)
-        error_info = ERROR_MESSAGES[error_type]
+        cause, solution, is_retryable = _ERROR_INFO[error_type.value - 1]
 
         return TranslationError(
             error_type=error_type,
             message=message,
-            cause=error_info["cause"],
-            solution=error_info["solution"],
-            is_retryable=error_info["is_retryable"],
+            cause=cause,
+            solution=solution,
+            is_retryable=is_retryable,
             original_exception=exception,
             traceback=traceback_str,
         )
@@ -153,57 +174,75 @@ class ErrorClassifier:
         exception = Exception(message)
         return cls.classify(exception, message, traceback_str)
 
+    @classmethod
+    def classify_from_exception(cls, exception: Exception) -> TranslationError:
+        """
+        Classify a raised exception by its type and message.
+
+        Args:
+            exception: The raised exception
+
+        Returns:
+            TranslationError with classified type and user-friendly messages
+        """
+        return cls.classify(exception, str(exception))
+
     @classmethod
     def create_timeout_error(cls) -> TranslationError:
         """Create a timeout error."""
-        error_info = ERROR_MESSAGES[ErrorType.TIMEOUT]
+        cause, solution, is_retryable = _ERROR_INFO[ErrorType.TIMEOUT.value - 1]
         return TranslationError(
             error_type=ErrorType.TIMEOUT,
             message="Translation timed out",
-            cause=error_info["cause"],
-            solution=error_info["solution"],
-            is_retryable=error_info["is_retryable"],
+            cause=cause,
+            solution=solution,
+            is_retryable=is_retryable,
         )
 
     @classmethod
     def _determine_type(cls, exception: Exception, message: str) -> ErrorType:
         """Determine error type from exception and message."""
-        message_lower = message.lower()
+        return _determine_type(type(exception), message)
+
+
+@lru_cache(maxsize=256)
+def _determine_type(exception_type: type[BaseException], message: str) -> ErrorType:
+    """
+    Determine error type from exception class and message.
+
+    Classification is pure over its arguments, so results are memoized;
+    repeated failures (e.g. during retries) skip the regex searches.
+    """
+    # Check for specific exception types first
+    if issubclass(exception_type, ValueError):
+        return ErrorType.VALIDATION
 
-        # Check for specific exception types first
-        if isinstance(exception, ValueError):
-            return ErrorType.VALIDATION
+    if issubclass(exception_type, MemoryError):
+        return ErrorType.MEMORY
 
-        if isinstance(exception, MemoryError):
-            return ErrorType.MEMORY
+    if issubclass(exception_type, TimeoutError):
+        return ErrorType.TIMEOUT
 
-        if isinstance(exception, TimeoutError):
+    # Patterns are compiled lowercase; fold the message once for all searches
+    message_lower = message.lower()
+
+    if issubclass(exception_type, (ConnectionError, OSError)):
+        # Check if it's a timeout-related OSError
+        if ErrorClassifier.TIMEOUT_RE.search(message_lower):
             return ErrorType.TIMEOUT
+        return ErrorType.NETWORK
+
+    # Pattern matching on message - check in priority order
+    if ErrorClassifier.TIMEOUT_RE.search(message_lower):
+        return ErrorType.TIMEOUT
+
+    if ErrorClassifier.MEMORY_RE.search(message_lower):
+        return ErrorType.MEMORY
+
+    if ErrorClassifier.NETWORK_RE.search(message_lower):
+        return ErrorType.NETWORK
+
+    if ErrorClassifier.MODEL_RE.search(message_lower):
+        return ErrorType.MODEL
 
-        if isinstance(exception, (ConnectionError, OSError)):
-            # Check if it's a timeout-related OSError
-            if any(
-                re.search(pattern, message, re.IGNORECASE)
-                for pattern in cls.TIMEOUT_PATTERNS
-            ):
-                return ErrorType.TIMEOUT
-            return ErrorType.NETWORK
-
-        # Pattern matching on message - check in priority order
-        for pattern in cls.TIMEOUT_PATTERNS:
-            if re.search(pattern, message_lower, re.IGNORECASE):
-                return ErrorType.TIMEOUT
-
-        for pattern in cls.MEMORY_PATTERNS:
-            if re.search(pattern, message, re.IGNORECASE):
-                return ErrorType.MEMORY
-
-        for pattern in cls.NETWORK_PATTERNS:
-            if re.search(pattern, message, re.IGNORECASE):
-                return ErrorType.NETWORK
-
-        for pattern in cls.MODEL_PATTERNS:
-            if re.search(pattern, message, re.IGNORECASE):
-                return ErrorType.MODEL
-
-        return ErrorType.UNKNOWN
+    return ErrorType.UNKNOWN
@@ -4,26 +4,99 @@ This module provides functionality for storing and retrieving translation histor
 including persistence using QSettings and search capabilities.
 """
 
+import time
 import uuid
-from dataclasses import dataclass
-from datetime import datetime
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, TypeVar
 
-from PySide6.QtCore import QObject, QSettings, Signal
+from PySide6.QtCore import QObject, QSettings, QTimer, Signal
 
 from core.config import config
+from utils.logger import get_logger
 
+logger = get_logger(__name__)
 
-@dataclass(frozen=True)
+_T = TypeVar("_T")
+
+# Config is immutable, so the default preview length is read once
+_DEFAULT_PREVIEW_LEN = config.history.preview_length
+
+# Joins the texts in the search blob; it never occurs in typed queries, so
+# a match cannot span the source and translated text
+_SEARCH_SEPARATOR = "\0"
+
+
+def _truncate(text: str, max_length: int) -> str:
+    """Truncate text to max_length characters, ending in an ellipsis if cut."""
+    if len(text) <= max_length:
+        return text
+    return text[: max_length - 3] + "..."
+
+
+def fast_frozen_dataclass(cls: type[_T]) -> type[_T]:
+    """Turn a class into a slotted, hashable dataclass without frozen=True.
+
+    Frozen dataclasses assign every field through object.__setattr__ in
+    __init__. Instances built here are immutable by convention only: fields
+    are plain slot assignments, and the hash is computed once in
+    __post_init__ and cached in a ``_hash`` slot. A __post_init__ defined on
+    the class runs first.
+
+    Args:
+        cls: Class to decorate
+
+    Returns:
+        The decorated dataclass
+    """
+    cls.__annotations__["_hash"] = int
+    setattr(cls, "_hash", field(init=False, repr=False, compare=False))
+
+    compare_names: tuple[str, ...] = ()
+    user_post_init = cls.__dict__.get("__post_init__")
+
+    def __post_init__(self: Any) -> None:
+        if user_post_init is not None:
+            user_post_init(self)
+        self._hash = hash(tuple([getattr(self, name) for name in compare_names]))
+
+    def __hash__(self: Any) -> int:
+        return int(self._hash)
+
+    setattr(cls, "__post_init__", __post_init__)
+    new_cls = dataclass(slots=True, eq=True)(cls)
+    new_cls.__hash__ = __hash__  # type: ignore[assignment]
+
+    compare_names = tuple(f.name for f in fields(new_cls) if f.compare)
+    return new_cls
+
+
+@dataclass(slots=True)
+class _PendingChanges:
+    """Snapshot of the changes one save writes to QSettings."""
+
+    deleted_ids: list[str]
+    entries: list["HistoryEntry"]  # Added or changed since the last save
+    order: list[str]
+    drop_legacy: bool
+
+
+@fast_frozen_dataclass
 class HistoryEntry:
     """Represents a single translation history entry.
 
+    Entries are treated as immutable; do not assign to fields after creation.
+
     Attributes:
         id: Unique identifier (8-character hex string from UUID4)
         source_text: Original text that was translated
         translated_text: Resulting translated text
         source_lang: Source language code
         target_lang: Target language code
-        created_at: Timestamp when translation was performed (UTC)
+        created_at_ts: POSIX timestamp (seconds) when translation was performed
     """
 
     id: str
@@ -31,7 +104,20 @@ class HistoryEntry:
     translated_text: str
     source_lang: str
     target_lang: str
-    created_at: datetime
+    created_at_ts: float
+
+    # Case-folded source and translated text, computed once for search()
+    _search_blob: str = field(init=False, repr=False, compare=False)
+    # Default-length preview, computed once for the history list
+    _preview: str = field(init=False, repr=False, compare=False)
+    # Display timestamp, formatted on first use by the history list
+    _formatted_time: str = field(init=False, default="", repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._search_blob = (
+            f"{self.source_text}{_SEARCH_SEPARATOR}{self.translated_text}".casefold()
+        )
+        self._preview = _truncate(self.source_text, _DEFAULT_PREVIEW_LEN)
 
     @staticmethod
     def create(
@@ -57,9 +143,25 @@ class HistoryEntry:
             translated_text=translated_text,
             source_lang=source_lang,
             target_lang=target_lang,
-            created_at=datetime.utcnow(),
+            created_at_ts=time.time(),
         )
 
+    @property
+    def created_at(self) -> datetime:
+        """Get the creation time as a local datetime."""
+        return datetime.fromtimestamp(self.created_at_ts)
+
+    @property
+    def formatted_time(self) -> str:
+        """Get the creation time formatted for display ("%Y-%m-%d %H:%M")."""
+        if not self._formatted_time:
+            # Formatting the fields directly skips strftime's format parsing
+            t = self.created_at
+            self._formatted_time = (
+                f"{t.year:04d}-{t.month:02d}-{t.day:02d} {t.hour:02d}:{t.minute:02d}"
+            )
+        return self._formatted_time
+
     def preview(self, max_length: int | None = None) -> str:
         """Get a preview of the source text, truncated if necessary.
 
@@ -70,11 +172,8 @@ class HistoryEntry:
             Source text, truncated with ellipsis if longer than max_length
         """
         if max_length is None:
-            max_length = config.history.preview_length
-
-        if len(self.source_text) <= max_length:
-            return self.source_text
-        return self.source_text[: max_length - 3] + "..."
+            return self._preview
+        return _truncate(self.source_text, max_length)
 
 
 class HistoryStore(QObject):
@@ -84,7 +183,7 @@ class HistoryStore(QObject):
         entryAdded: Emitted when a new entry is added (HistoryEntry)
         entryRemoved: Emitted when an entry is removed (entry_id: str)
         entriesCleared: Emitted when all entries are cleared
-        entriesLoaded: Emitted when entries are loaded from storage
+        entriesLoaded: Emitted when entries are loaded from storage or trimmed
     """
 
     entryAdded = Signal(object)  # HistoryEntry
@@ -92,6 +191,12 @@ class HistoryStore(QObject):
     entriesCleared = Signal()
     entriesLoaded = Signal()
 
+    # QSettings layout: one group per entry keyed by id, plus the id order
+    _ORDER_KEY = "history/order"
+    _ITEMS_GROUP = "history/items"
+    # Array layout used before entries were keyed by id (migrated on load)
+    _LEGACY_ARRAY = "history/entries"
+
     def __init__(self, settings: QSettings, parent: QObject | None = None):
         """Initialize the history store.
 
@@ -101,31 +206,78 @@ class HistoryStore(QObject):
         """
         super().__init__(parent)
         self._settings = settings
-        self._entries: list[HistoryEntry] = []
         self._max_entries = config.history.max_entries
+        self._entries: deque[HistoryEntry] = deque(maxlen=self._max_entries)
+        self._by_id: dict[str, HistoryEntry] = {}
+
+        # Deferred persistence: mutations mark the store dirty and restart
+        # a single-shot timer, so bursts of changes share one write.
+        self._dirty = False
+        self._dirty_ids: set[str] = set()
+        self._deleted_ids: set[str] = set()
+        self._drop_legacy = False
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(config.history.save_debounce_ms)
+        self._save_timer.timeout.connect(self._save_in_background)
+
+        # Timer-driven saves are written and synced to disk on this thread,
+        # so the file write never stalls the GUI thread. One worker keeps
+        # the saves in order.
+        self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history-save")
+        self._background_save: Future[None] | None = None
 
     @property
     def entries(self) -> list[HistoryEntry]:
         """Get a copy of all history entries (newest first)."""
-        return self._entries.copy()
+        return list(self._entries)
 
     @property
     def count(self) -> int:
         """Get the number of history entries."""
         return len(self._entries)
 
+    @property
+    def max_entries(self) -> int:
+        """Get the maximum number of entries kept in history."""
+        return self._max_entries
+
+    @max_entries.setter
+    def max_entries(self, value: int) -> None:
+        """Set the maximum number of entries, dropping the oldest if needed."""
+        self._max_entries = value
+        self._entries = deque(islice(self._entries, value), maxlen=value)
+        dropped_ids = self._by_id.keys() - {entry.id for entry in self._entries}
+        if not dropped_ids:
+            return
+        for entry_id in dropped_ids:
+            self._mark_deleted(entry_id)
+        self._by_id = {entry.id: entry for entry in self._entries}
+        self._schedule_save()
+        self.entriesLoaded.emit()
+
     def add(self, entry: HistoryEntry) -> None:
         """Add a new entry to history.
 
         If the maximum number of entries is exceeded, the oldest entry is removed.
+        The change is persisted on the next flush().
 
         Args:
             entry: HistoryEntry to add
         """
-        self._entries.insert(0, entry)
-        if len(self._entries) > self._max_entries:
-            self._entries.pop()
-        self.save()
+        if self._max_entries == 0:
+            # History is disabled; a zero-length deque keeps nothing
+            return
+        if self._entries and len(self._entries) == self._max_entries:
+            # appendleft() on a full deque drops the oldest entry
+            evicted_id = self._entries[-1].id
+            self._by_id.pop(evicted_id, None)
+            self._mark_deleted(evicted_id)
+        self._entries.appendleft(entry)
+        self._by_id[entry.id] = entry
+        self._deleted_ids.discard(entry.id)
+        self._dirty_ids.add(entry.id)
+        self._schedule_save()
         self.entryAdded.emit(entry)
 
     def get(self, entry_id: str) -> HistoryEntry | None:
@@ -137,10 +289,7 @@ class HistoryStore(QObject):
         Returns:
             HistoryEntry if found, None otherwise
         """
-        for entry in self._entries:
-            if entry.id == entry_id:
-                return entry
-        return None
+        return self._by_id.get(entry_id)
 
     def remove(self, entry_id: str) -> bool:
         """Remove an entry by ID.
@@ -151,18 +300,22 @@ class HistoryStore(QObject):
         Returns:
             True if entry was removed, False if not found
         """
-        for i, entry in enumerate(self._entries):
-            if entry.id == entry_id:
-                self._entries.pop(i)
-                self.save()
-                self.entryRemoved.emit(entry_id)
-                return True
-        return False
+        entry = self._by_id.pop(entry_id, None)
+        if entry is None:
+            return False
+        self._entries.remove(entry)
+        self._mark_deleted(entry_id)
+        self._schedule_save()
+        self.entryRemoved.emit(entry_id)
+        return True
 
     def clear(self) -> None:
         """Remove all history entries."""
+        for entry_id in self._by_id:
+            self._mark_deleted(entry_id)
         self._entries.clear()
-        self.save()
+        self._by_id.clear()
+        self._schedule_save()
         self.entriesCleared.emit()
 
     def search(self, query: str) -> list[HistoryEntry]:
@@ -179,59 +332,199 @@ class HistoryStore(QObject):
         if not query:
             return self.entries
 
-        query_lower = query.lower()
-        return [
-            e
-            for e in self._entries
-            if query_lower in e.source_text.lower()
-            or query_lower in e.translated_text.lower()
-        ]
+        query_folded = query.casefold()
+        return [e for e in self._entries if query_folded in e._search_blob]
+
+    def _mark_deleted(self, entry_id: str) -> None:
+        """Record that an entry must be removed from QSettings on save."""
+        self._dirty_ids.discard(entry_id)
+        self._deleted_ids.add(entry_id)
+
+    def _schedule_save(self) -> None:
+        """Mark entries as dirty and (re)start the deferred save timer."""
+        self._dirty = True
+        self._save_timer.start()
+
+    @property
+    def is_dirty(self) -> bool:
+        """Check if there are changes not yet written to QSettings."""
+        return self._dirty
+
+    def flush(self) -> None:
+        """Write pending changes to QSettings immediately, if any.
+
+        Waits for a background save still in progress, so writes stay in
+        order.
+        """
+        self._save_timer.stop()
+        if self._background_save is not None:
+            self._background_save.result()
+            self._background_save = None
+        if self._dirty:
+            self.save()
 
     def save(self) -> None:
-        """Persist entries to QSettings."""
-        self._settings.beginWriteArray("history/entries")
-        for i, entry in enumerate(self._entries):
-            self._settings.setArrayIndex(i)
-            self._settings.setValue("id", entry.id)
-            self._settings.setValue("source_text", entry.source_text)
-            self._settings.setValue("translated_text", entry.translated_text)
-            self._settings.setValue("source_lang", entry.source_lang)
-            self._settings.setValue("target_lang", entry.target_lang)
-            self._settings.setValue("created_at", entry.created_at.isoformat())
-        self._settings.endArray()
-        self._settings.sync()
+        """Persist pending changes to QSettings.
+
+        Only entries added since the last save are written and only removed
+        entries are deleted; the id order is rewritten in full.
+        """
+        self._write_changes(self._settings, self._take_changes())
+
+    def _save_in_background(self) -> None:
+        """Hand pending changes to the save thread (deferred save timer)."""
+        if not self._dirty:
+            return
+        self._background_save = self._save_executor.submit(
+            self._write_changes_to_file, self._take_changes()
+        )
+
+    def _take_changes(self) -> _PendingChanges:
+        """Collect pending changes for a save and mark the store clean."""
+        changes = _PendingChanges(
+            deleted_ids=list(self._deleted_ids),
+            entries=[self._by_id[i] for i in self._dirty_ids if i in self._by_id],
+            order=[entry.id for entry in self._entries],
+            drop_legacy=self._drop_legacy,
+        )
+        self._dirty_ids.clear()
+        self._deleted_ids.clear()
+        self._drop_legacy = False
+        self._dirty = False
+        return changes
+
+    def _write_changes_to_file(self, changes: _PendingChanges) -> None:
+        """Write changes through a QSettings object owned by the save thread.
+
+        QSettings objects must not be shared between threads, but separate
+        objects for the same file can be used concurrently.
+        """
+        try:
+            settings = QSettings(self._settings.fileName(), self._settings.format())
+            self._write_changes(settings, changes)
+        except Exception as e:
+            logger.error(f"Failed to save history: {e}", exc_info=True)
+
+    @classmethod
+    def _write_changes(cls, settings: QSettings, changes: _PendingChanges) -> None:
+        """Apply changes to settings and sync them to disk."""
+        for entry_id in changes.deleted_ids:
+            settings.remove(f"{cls._ITEMS_GROUP}/{entry_id}")
+
+        for entry in changes.entries:
+            settings.beginGroup(f"{cls._ITEMS_GROUP}/{entry.id}")
+            settings.setValue("source_text", entry.source_text)
+            settings.setValue("translated_text", entry.translated_text)
+            settings.setValue("source_lang", entry.source_lang)
+            settings.setValue("target_lang", entry.target_lang)
+            settings.setValue("created_at_ts", entry.created_at_ts)
+            settings.endGroup()
+
+        settings.setValue(cls._ORDER_KEY, changes.order)
+
+        if changes.drop_legacy:
+            settings.remove(cls._LEGACY_ARRAY)
+
+        settings.sync()
 
     def load(self) -> None:
         """Load entries from QSettings."""
-        count = self._settings.beginReadArray("history/entries")
-        self._entries = []
+        self._entries = deque(maxlen=self._max_entries)
+        self._by_id = {}
+        self._dirty_ids.clear()
+        self._deleted_ids.clear()
+
+        if self._settings.contains(self._ORDER_KEY):
+            self._load_by_id()
+        else:
+            self._load_legacy_array()
+
+        self.entriesLoaded.emit()
+
+    def _load_by_id(self) -> None:
+        """Load entries stored in per-id groups."""
+        order = self._settings.value(self._ORDER_KEY, [], type=list)
+        for entry_id in order:
+            self._settings.beginGroup(f"{self._ITEMS_GROUP}/{entry_id}")
+            entry = self._read_entry(entry_id)
+            self._settings.endGroup()
+            if entry is not None:
+                self._append_loaded(entry)
+
+    def _load_legacy_array(self) -> None:
+        """Load entries from the legacy array layout and schedule migration."""
+        count = self._settings.beginReadArray(self._LEGACY_ARRAY)
         for i in range(count):
             self._settings.setArrayIndex(i)
-            try:
-                entry_id = self._settings.value("id", "")
-                source_text = self._settings.value("source_text", "")
-                translated_text = self._settings.value("translated_text", "")
-                source_lang = self._settings.value("source_lang", "")
-                target_lang = self._settings.value("target_lang", "")
-                created_at_str = self._settings.value(
-                    "created_at", datetime.utcnow().isoformat()
-                )
-
-                # Skip invalid entries
-                if not entry_id or not source_text:
-                    continue
-
-                entry = HistoryEntry(
-                    id=entry_id,
-                    source_text=source_text,
-                    translated_text=translated_text,
-                    source_lang=source_lang,
-                    target_lang=target_lang,
-                    created_at=datetime.fromisoformat(created_at_str),
-                )
-                self._entries.append(entry)
-            except (ValueError, TypeError):
-                # Skip entries with invalid data
-                continue
+            entry = self._read_entry(self._settings.value("id", ""))
+            if entry is not None:
+                self._append_loaded(entry)
         self._settings.endArray()
-        self.entriesLoaded.emit()
+
+        if count:
+            # Rewrite everything in the per-id layout on the next save
+            self._dirty_ids.update(self._by_id)
+            self._drop_legacy = True
+            self._schedule_save()
+
+    def _append_loaded(self, entry: HistoryEntry) -> None:
+        """Append a loaded entry (oldest last) and index it."""
+        if len(self._entries) == self._max_entries:
+            # Over the limit (e.g. max_entries was lowered): drop from storage
+            self._mark_deleted(entry.id)
+            return
+        self._entries.append(entry)
+        self._by_id[entry.id] = entry
+
+    def _read_entry(self, entry_id: str) -> HistoryEntry | None:
+        """Read entry fields at the current QSettings group or array index.
+
+        Args:
+            entry_id: ID of the entry being read
+
+        Returns:
+            HistoryEntry, or None if the stored data is missing or invalid
+        """
+        try:
+            source_text = self._settings.value("source_text", "")
+            translated_text = self._settings.value("translated_text", "")
+            source_lang = self._settings.value("source_lang", "")
+            target_lang = self._settings.value("target_lang", "")
+
+            # Skip invalid entries
+            if not entry_id or not source_text:
+                return None
+
+            if self._settings.contains("created_at_ts"):
+                created_at_ts = float(self._settings.value("created_at_ts", 0.0, type=float))
+            else:
+                created_at_ts = self._read_legacy_created_at()
+
+            return HistoryEntry(
+                id=entry_id,
+                source_text=source_text,
+                translated_text=translated_text,
+                source_lang=source_lang,
+                target_lang=target_lang,
+                created_at_ts=created_at_ts,
+            )
+        except (ValueError, TypeError):
+            # Skip entries with invalid data
+            return None
+
+    def _read_legacy_created_at(self) -> float:
+        """Read an ISO-8601 UTC "created_at" value written by older versions.
+
+        Returns:
+            POSIX timestamp; the current time if no value is stored
+
+        Raises:
+            ValueError: If the stored value is not a valid ISO-8601 string
+        """
+        created_at_str = self._settings.value("created_at", "")
+        if not created_at_str:
+            return time.time()
+        created_at = datetime.fromisoformat(created_at_str)
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        return created_at.timestamp()
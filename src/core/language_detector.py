@@ -1,6 +1,8 @@
 """Language detection using lingua-py."""
 
+import threading
 from lingua import Language, LanguageDetectorBuilder
+from lingua import LanguageDetector as LinguaDetector
 from typing import Optional, Tuple
 from functools import lru_cache
 
@@ -9,6 +11,56 @@ from core.config import LanguageCode
 
 logger = get_logger(__name__)
 
+# Script fast path: only the leading characters are inspected, and a script
+# must cover this share of letters to skip the statistical model
+_SCRIPT_SCAN_CHARS = 200
+_SCRIPT_DOMINANCE = 0.8
+
+
+def _detect_dominant_script(text: str) -> Optional[str]:
+    """
+    Detect language from Unicode script when one script dominates the text.
+
+    Hangul, kana, Han and Cyrillic each map to a single supported language,
+    so no model is needed for them. Latin text returns None and is left to
+    lingua.
+
+    Args:
+        text: Input text
+
+    Returns:
+        ISO 639-1 language code, or None if no unambiguous script dominates
+    """
+    letters = hangul = kana = han = cyrillic = 0
+    for ch in text[:_SCRIPT_SCAN_CHARS]:
+        if not ch.isalpha():
+            continue
+        letters += 1
+        cp = ord(ch)
+        if 0xAC00 <= cp <= 0xD7AF or 0x1100 <= cp <= 0x11FF or 0x3130 <= cp <= 0x318F:
+            hangul += 1
+        elif 0x3040 <= cp <= 0x30FF:
+            kana += 1
+        elif 0x4E00 <= cp <= 0x9FFF:
+            han += 1
+        elif 0x0400 <= cp <= 0x04FF:
+            cyrillic += 1
+
+    if not letters:
+        return None
+
+    threshold = letters * _SCRIPT_DOMINANCE
+    if hangul >= threshold:
+        return LanguageCode.KOREAN.value
+    # Japanese mixes kana with kanji; Han without any kana is Chinese
+    if kana and kana + han >= threshold:
+        return LanguageCode.JAPANESE.value
+    if han >= threshold:
+        return LanguageCode.CHINESE.value
+    if cyrillic >= threshold:
+        return LanguageCode.RUSSIAN.value
+    return None
+
 
 class LanguageDetector:
     """Detects language of input text using lingua-py."""
@@ -27,26 +79,45 @@ class LanguageDetector:
         Language.ITALIAN: LanguageCode.ITALIAN,
     }
 
+    # Maximum number of distinct texts memoized per detection method
+    CACHE_SIZE = 256
+
     def __init__(self):
         """Initialize language detector with supported languages."""
         logger.info("Initializing LanguageDetector...")
 
-        # Build detector with only supported languages
-        self.detector = LanguageDetectorBuilder.from_languages(
-            Language.KOREAN,
-            Language.ENGLISH,
-            Language.JAPANESE,
-            Language.CHINESE,
-            Language.SPANISH,
-            Language.FRENCH,
-            Language.GERMAN,
-            Language.RUSSIAN,
-            Language.PORTUGUESE,
-            Language.ITALIAN,
-        ).with_preloaded_language_models().build()
+        # The lingua detector is built on first use, and lingua loads each
+        # language model lazily, so construction stays cheap at startup
+        self._detector: Optional[LinguaDetector] = None
+        self._detector_lock = threading.Lock()
+
+        # Detection is pure over the input text, so repeated lookups of the
+        # same buffer are served from a per-instance cache
+        self._detect_cached = lru_cache(maxsize=self.CACHE_SIZE)(self._detect_uncached)
+        self._detect_with_confidence_cached = lru_cache(maxsize=self.CACHE_SIZE)(
+            self._detect_with_confidence_uncached
+        )
 
         logger.info("LanguageDetector initialized with 10 languages")
 
+    @property
+    def detector(self) -> LinguaDetector:
+        """Get the lingua detector, building it on first access."""
+        if self._detector is None:
+            with self._detector_lock:
+                if self._detector is None:
+                    # Build detector with only supported languages
+                    self._detector = LanguageDetectorBuilder.from_languages(
+                        *self.LINGUA_TO_CODE
+                    ).build()
+                    logger.info("Lingua detector built")
+        return self._detector
+
+    @detector.setter
+    def detector(self, value: LinguaDetector) -> None:
+        """Replace the lingua detector."""
+        self._detector = value
+
     def detect(self, text: str) -> Optional[str]:
         """
         Detect language of text.
@@ -61,6 +132,15 @@ class LanguageDetector:
             logger.warning("Text too short for reliable detection")
             return None
 
+        script_code = _detect_dominant_script(text)
+        if script_code is not None:
+            logger.debug(f"Detected language by script: {script_code}")
+            return script_code
+
+        return self._detect_cached(text)
+
+    def _detect_uncached(self, text: str) -> Optional[str]:
+        """Run lingua detection on text (see detect())."""
         try:
             detected = self.detector.detect_language_of(text)
 
@@ -69,8 +149,8 @@ class LanguageDetector:
                 return None
 
             # Convert to our language code
-            if detected in self.LINGUA_TO_CODE:
-                code = self.LINGUA_TO_CODE[detected].value
+            code = _CODE_TABLE[int(detected)]
+            if code is not None:
                 logger.debug(f"Detected language: {code} for text: '{text[:50]}...'")
                 return code
             else:
@@ -95,6 +175,10 @@ class LanguageDetector:
         if not text or len(text.strip()) < 3:
             return None, 0.0
 
+        return self._detect_with_confidence_cached(text)
+
+    def _detect_with_confidence_uncached(self, text: str) -> Tuple[Optional[str], float]:
+        """Run lingua confidence computation on text (see detect_with_confidence())."""
         try:
             confidence_values = self.detector.compute_language_confidence_values(text)
 
@@ -105,8 +189,8 @@ class LanguageDetector:
             # Get highest confidence result
             best = confidence_values[0]
 
-            if best.language in self.LINGUA_TO_CODE:
-                code = self.LINGUA_TO_CODE[best.language].value
+            code = _CODE_TABLE[int(best.language)]
+            if code is not None:
                 confidence = best.value
                 logger.debug(
                     f"Detected {code} with {confidence:.2%} confidence for: '{text[:50]}...'"
@@ -131,22 +215,49 @@ class LanguageDetector:
         Returns:
             True if detected language matches expected with sufficient confidence
         """
-        detected_lang, confidence = self.detect_with_confidence(text)
+        if not text or len(text.strip()) < 3:
+            return False
 
-        if detected_lang is None:
+        lingua_lang = _CODE_TO_LINGUA.get(expected_lang)
+        if lingua_lang is None:
+            logger.warning(f"Unsupported expected language: {expected_lang}")
             return False
 
-        is_match = detected_lang == expected_lang and confidence >= threshold
+        try:
+            # Score only the expected language instead of ranking all of them
+            confidence = self.detector.compute_language_confidence(text, lingua_lang)
+        except Exception as e:
+            logger.error(f"Language confidence error: {e}", exc_info=True)
+            return False
+
+        is_match = confidence >= threshold
 
         if not is_match:
             logger.debug(
-                f"Language mismatch: expected {expected_lang}, "
-                f"detected {detected_lang} ({confidence:.2%})"
+                f"Language mismatch: expected {expected_lang} "
+                f"with {confidence:.2%} confidence"
             )
 
         return is_match
 
 
+def _build_code_table() -> Tuple[Optional[str], ...]:
+    """Build the int(Language) -> ISO code lookup table for LanguageDetector."""
+    table: list[Optional[str]] = [None] * (max(int(lang) for lang in Language.all()) + 1)
+    for lingua_lang, code in LanguageDetector.LINGUA_TO_CODE.items():
+        table[int(lingua_lang)] = code.value
+    return tuple(table)
+
+
+# LINGUA_TO_CODE flattened into a tuple indexed by int(Language)
+_CODE_TABLE = _build_code_table()
+
+# Reverse of LINGUA_TO_CODE, keyed by ISO code string
+_CODE_TO_LINGUA = {
+    code.value: lingua_lang for lingua_lang, code in LanguageDetector.LINGUA_TO_CODE.items()
+}
+
+
 @lru_cache(maxsize=1)
 def get_language_detector() -> LanguageDetector:
     """
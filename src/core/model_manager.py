@@ -1,15 +1,88 @@
 """Model manager for loading and managing the Rosetta-4B translation model."""
 
+import copy
+import importlib.util
+import threading
+
 import torch
-from transformers import AutoModelForCausalLM, AutoTokenizer, QuantoConfig
-from typing import Optional, Callable
+from transformers import (
+    AutoModelForCausalLM,
+    AutoTokenizer,
+    BatchEncoding,
+    DynamicCache,
+    QuantoConfig,
+    StoppingCriteria,
+    StoppingCriteriaList,
+)
+from typing import Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
 from utils.logger import get_logger
-from core.config import ModelConfig, config
+from core.config import ModelConfig, config, get_supported_languages
 
 logger = get_logger(__name__)
 
+# CUDA GPUs with less memory than this default to int4 weights
+_INT4_MEMORY_THRESHOLD = 16 * 1024**3
+
+# Placeholder rendered in place of the user text to split the chat template
+_USER_SENTINEL = "\x00USER\x00"
+
+# Sample user text used to check a split chat template against a full render
+_TEMPLATE_CHECK_TEXT = "Hello, world."
+
+# Smallest prompt bucket when padding inputs to static shapes
+_MIN_PROMPT_BUCKET = 32
+
+# Decoding steps each compile warm-up runs: the prefill plus cached decoding
+_WARMUP_STEPS = 2
+
+# Text tokens past the prompt template that the compile warm-up covers, about
+# a paragraph; longer prompts compile their bucket on first use
+_WARMUP_TEXT_TOKENS = 200
+
+
+# Generation budgets; each call uses the smallest one covering three tokens
+# per prompt token, so the static KV cache only ever takes a few sizes
+_NEW_TOKEN_BUCKETS = (128, 512, 2048)
+
+
+def _prompt_bucket(length: int) -> int:
+    """Round a prompt length up to the next power-of-two bucket."""
+    return max(_MIN_PROMPT_BUCKET, 1 << (length - 1).bit_length())
+
+
+class _CancelCriteria(StoppingCriteria):
+    """Stops generation once a cancellation event is set."""
+
+    def __init__(self, cancel_event: threading.Event):
+        self.cancel_event = cancel_event
+
+    def __call__(self, input_ids: torch.Tensor, scores: torch.Tensor, **kwargs) -> torch.Tensor:
+        return torch.full(
+            (input_ids.shape[0],),
+            self.cancel_event.is_set(),
+            dtype=torch.bool,
+            device=input_ids.device,
+        )
+
+
+class _StepLimitCriteria(StoppingCriteria):
+    """Stops generation after a fixed number of decoding steps."""
+
+    def __init__(self, steps: int):
+        self.steps = steps
+        self._calls = 0
+
+    def __call__(self, input_ids: torch.Tensor, scores: torch.Tensor, **kwargs) -> torch.Tensor:
+        self._calls += 1
+        return torch.full(
+            (input_ids.shape[0],),
+            self._calls >= self.steps,
+            dtype=torch.bool,
+            device=input_ids.device,
+        )
+
 
 class ModelManager:
     """Manages the Rosetta-4B translation model with lazy loading and quantization."""
@@ -25,7 +98,21 @@ class ModelManager:
         self.model = None
         self.tokenizer = None
         self.device = None
+        self.effective_dtype: Optional[torch.dtype] = None
+        self.effective_quantization: Optional[str] = None
         self._is_loaded = False
+        self._use_static_cache = False
+        self._et_model = None
+        # Side stream for host-to-device input copies, created on first CUDA use
+        self._copy_stream: Optional["torch.cuda.Stream"] = None
+        # target_lang -> (text before, text after) the user turn in the rendered
+        # chat template, or None when the template cannot be split
+        self._chat_templates: Dict[str, Optional[Tuple[str, str]]] = {}
+        # target_lang -> (prefix token ids, template text after the user turn),
+        # or None when splitting the prompt changes its tokenization
+        self._prompt_parts: Dict[str, Optional[Tuple[torch.Tensor, str]]] = {}
+        # target_lang -> KV cache after prefilling the cached prompt prefix
+        self._prefix_kv: Dict[str, DynamicCache] = {}
         self._progress_callback: Optional[Callable[[int, str], None]] = None
 
         logger.info(f"ModelManager initialized with model: {self.config.model_id}")
@@ -79,29 +166,66 @@ class ModelManager:
             # Step 2: Load tokenizer
             self.tokenizer = AutoTokenizer.from_pretrained(self.config.model_id)
             logger.info("Tokenizer loaded successfully")
+            self._prerender_chat_templates()
 
             self._report_progress(30, "Configuring model quantization...")
 
             # Step 3: Configure quantization
-            quantization_config = None
-            if self.config.quantization == "int8":
-                quantization_config = QuantoConfig(weights="int8", activations=None)
-                logger.info("INT8 quantization enabled")
-            elif self.config.quantization == "int4":
-                quantization_config = QuantoConfig(weights="int4", activations=None)
-                logger.info("INT4 quantization enabled")
+            quantization_config = self._get_quantization_config()
+            self.effective_quantization = (
+                quantization_config.weights if quantization_config else "none"
+            )
 
             self._report_progress(40, "Loading model (this may take a while)...")
 
+            # ExecuTorch programs replace the PyTorch model on CPU/MPS
+            if self.config.use_executorch and self.device in ("cpu", "mps"):
+                self._et_model = self._load_executorch_model()
+                if self._et_model is not None:
+                    self._is_loaded = True
+                    self._report_progress(100, "Model ready!")
+                    logger.info(
+                        f"Model initialization complete. Device: {self.device} (ExecuTorch)"
+                    )
+                    return True
+
             # Step 4: Load model with lazy loading
-            dtype = getattr(torch, self.config.dtype)
-            self.model = AutoModelForCausalLM.from_pretrained(
-                self.config.model_id,
-                quantization_config=quantization_config,
-                device_map="auto" if self.config.device == "auto" else self.device,
-                low_cpu_mem_usage=True,
-                torch_dtype=dtype,
-            )
+            self.effective_dtype = self._get_dtype()
+            logger.info(f"Using dtype: {self.effective_dtype}")
+            attn_implementation = self._get_attn_implementation()
+
+            self.model = None
+            if (
+                self.config.fast_load
+                and quantization_config is None
+                and self.device in ("cuda", "mps")
+            ):
+                self.model = self._fast_load_model(attn_implementation)
+
+            if self.model is None:
+                load_kwargs = dict(
+                    quantization_config=quantization_config,
+                    device_map="auto" if self.config.device == "auto" else self.device,
+                    low_cpu_mem_usage=True,
+                    torch_dtype=self.effective_dtype,
+                )
+                try:
+                    self.model = AutoModelForCausalLM.from_pretrained(
+                        self.config.model_id,
+                        attn_implementation=attn_implementation,
+                        **load_kwargs,
+                    )
+                except (ValueError, ImportError) as e:
+                    # The architecture or installed kernels may not support the
+                    # fused attention; eager attention always works
+                    logger.warning(
+                        f"{attn_implementation} attention unavailable, using eager: {e}"
+                    )
+                    self.model = AutoModelForCausalLM.from_pretrained(
+                        self.config.model_id,
+                        attn_implementation="eager",
+                        **load_kwargs,
+                    )
 
             logger.info(f"Model loaded on device: {self.model.device}")
             self._report_progress(90, "Finalizing model setup...")
@@ -109,12 +233,17 @@ class ModelManager:
             # Step 5: Set to evaluation mode
             self.model.eval()
 
+            # Step 6: Compile the forward pass (CUDA graphs need a CUDA device)
+            if self.config.compile_model and self.device == "cuda":
+                self._report_progress(95, "Compiling model (first run only)...")
+                self._compile_model()
+
             self._is_loaded = True
             self._report_progress(100, "Model ready!")
 
             logger.info(
                 f"Model initialization complete. Device: {self.device}, "
-                f"Quantization: {self.config.quantization}"
+                f"Quantization: {self.effective_quantization}"
             )
             return True
 
@@ -123,6 +252,307 @@ class ModelManager:
             self._is_loaded = False
             raise RuntimeError(f"Failed to load translation model: {e}") from e
 
+    def _fast_load_model(self, attn_implementation: str):
+        """
+        Load full-precision weights straight from safetensors onto the device.
+
+        The model skeleton is built on the meta device and every tensor is
+        read from the memory-mapped shards directly into device memory,
+        avoiding the intermediate CPU copy of from_pretrained. Opt-in through
+        ModelConfig.fast_load: unlike from_pretrained it does not rename
+        checkpoint keys or apply a device_map, so the result is only used
+        if every parameter and buffer ended up on the device.
+
+        Args:
+            attn_implementation: Attention kernel to build the model with
+
+        Returns:
+            The loaded model, or None if the checkpoint cannot be fast-loaded
+        """
+        try:
+            from accelerate import init_empty_weights
+            from accelerate.utils import set_module_tensor_to_device
+            from huggingface_hub import snapshot_download
+            from safetensors import safe_open
+            from transformers import AutoConfig, GenerationConfig
+
+            model_dir = Path(
+                snapshot_download(
+                    self.config.model_id, allow_patterns=["*.json", "*.safetensors"]
+                )
+            )
+            shards = sorted(model_dir.glob("*.safetensors"))
+            if not shards:
+                raise FileNotFoundError(f"No safetensors shards in {model_dir}")
+
+            model_config = AutoConfig.from_pretrained(model_dir)
+            with init_empty_weights():
+                model = AutoModelForCausalLM.from_config(
+                    model_config,
+                    torch_dtype=self.effective_dtype,
+                    attn_implementation=attn_implementation,
+                )
+
+            for shard in shards:
+                with safe_open(str(shard), framework="pt", device=self.device) as f:
+                    for name in f.keys():
+                        set_module_tensor_to_device(
+                            model,
+                            name,
+                            self.device,
+                            value=f.get_tensor(name),
+                            dtype=self.effective_dtype,
+                        )
+            model.tie_weights()
+            if (model_dir / "generation_config.json").exists():
+                model.generation_config = GenerationConfig.from_pretrained(model_dir)
+
+            # init_empty_weights leaves buffers computed at construction (e.g.
+            # rotary inv_freq) on the CPU; meta tensors stay where they are
+            model.to(self.device)
+            misplaced = self._tensors_off_device(model)
+            if misplaced:
+                raise KeyError(
+                    f"{len(misplaced)} parameters/buffers not loaded onto {self.device}, "
+                    f"e.g. {misplaced[0]}"
+                )
+
+            logger.info("Model weights fast-loaded from safetensors")
+            return model
+
+        except Exception as e:
+            logger.warning(f"Fast model loading unavailable, using from_pretrained: {e}")
+            return None
+
+    def _tensors_off_device(self, model: torch.nn.Module) -> List[str]:
+        """
+        Get the parameters and buffers of a model that are not on the device.
+
+        Checkpoint names that did not match a parameter leave it on the meta
+        device, which counts as missing too.
+
+        Args:
+            model: Model to check
+
+        Returns:
+            Names of the misplaced tensors, empty if all are on the device
+        """
+        device_type = torch.device(self.device).type
+        tensors = [*model.named_parameters(), *model.named_buffers()]
+        return [name for name, tensor in tensors if tensor.device.type != device_type]
+
+    def _load_executorch_model(self):
+        """
+        Export the model to an ExecuTorch program for CPU or Apple Silicon.
+
+        Uses the CoreML backend on MPS and XNNPACK on CPU. The export runs
+        once per launch and requires the optional optimum-executorch package.
+
+        Returns:
+            ExecuTorchModelForCausalLM instance, or None if unavailable
+        """
+        try:
+            from optimum.executorch import ExecuTorchModelForCausalLM
+        except ImportError:
+            logger.warning("optimum-executorch not installed, using PyTorch model")
+            return None
+
+        recipe = "coreml" if self.device == "mps" else "xnnpack"
+        try:
+            et_model = ExecuTorchModelForCausalLM.from_pretrained(
+                self.config.model_id, export=True, recipe=recipe
+            )
+            logger.info(f"Model exported to ExecuTorch ({recipe})")
+            return et_model
+        except Exception as e:
+            logger.warning(f"ExecuTorch export failed, using PyTorch model: {e}")
+            return None
+
+    def _compile_model(self) -> None:
+        """
+        Compile the model forward pass with torch.compile and warm it up.
+
+        The shapes of common, paragraph-sized prompts are generated once
+        during loading, so their compilation cost is not paid on a first
+        translation. If compilation fails (e.g. for quantized weights that
+        Dynamo cannot trace), the eager forward and cache settings are
+        restored and loading continues.
+        """
+        eager_forward = self.model.forward
+        cache_implementation = self.model.generation_config.cache_implementation
+        try:
+            # A static KV cache plus bucketed prompt lengths keep shapes fixed,
+            # so the captured CUDA graphs are reused across translations
+            self.model.generation_config.cache_implementation = "static"
+            self._use_static_cache = True
+            self.model.forward = torch.compile(
+                eager_forward, mode="reduce-overhead", fullgraph=False
+            )
+
+            shapes = self._warmup_shapes()
+            for i, (prompt_bucket, max_new_tokens) in enumerate(shapes, 1):
+                self._report_progress(95, f"Compiling model ({i}/{len(shapes)})...")
+                warmup_inputs = self.tokenizer("Hello", return_tensors="pt")
+                warmup_inputs = self._pad_to_bucket(warmup_inputs, prompt_bucket)
+                warmup_inputs = self._to_device(warmup_inputs)
+                # The static cache is sized from max_new_tokens, so the budget
+                # must match; a few steps are enough to compile prefill and decode
+                with torch.inference_mode():
+                    self.model.generate(
+                        **warmup_inputs,
+                        max_new_tokens=max_new_tokens,
+                        do_sample=False,
+                        eos_token_id=self.tokenizer.eos_token_id,
+                        stopping_criteria=StoppingCriteriaList(
+                            [_StepLimitCriteria(_WARMUP_STEPS)]
+                        ),
+                    )
+            logger.info(
+                f"Model forward compiled with torch.compile ({len(shapes)} shapes warmed up)"
+            )
+
+        except Exception as e:
+            logger.warning(f"torch.compile unavailable, using eager model: {e}")
+            self.model.forward = eager_forward
+            self.model.generation_config.cache_implementation = cache_implementation
+            self._use_static_cache = False
+
+    def _warmup_shapes(self) -> List[Tuple[int, int]]:
+        """
+        Get the (prompt bucket, max_new_tokens) pairs to warm up.
+
+        Buckets run from the one holding the bare prompt template to the one
+        holding it plus _WARMUP_TEXT_TOKENS of text. Each extra bucket costs
+        a compilation and the memory of its CUDA graphs, so longer prompts
+        compile when first translated.
+
+        Returns:
+            Pairs of padded prompt length and generation budget
+        """
+        template = self.tokenizer(self._render_prompt("", "English"), return_tensors="pt")
+        template_length = template["input_ids"].shape[1]
+        longest = _prompt_bucket(template_length + _WARMUP_TEXT_TOKENS)
+
+        shapes = []
+        bucket = _prompt_bucket(template_length)
+        while bucket <= longest:
+            shapes.append((bucket, self._max_new_tokens(bucket)))
+            bucket *= 2
+        return shapes
+
+    def _pad_to_bucket(self, inputs, bucket: Optional[int] = None):
+        """
+        Left-pad tokenized inputs to their power-of-two length bucket.
+
+        Args:
+            inputs: Tokenizer output with input_ids and attention_mask
+            bucket: Padded length, defaulting to the bucket of the input length
+
+        Returns:
+            The same inputs, padded in place
+        """
+        input_ids = inputs["input_ids"]
+        if bucket is None:
+            bucket = _prompt_bucket(input_ids.shape[1])
+        pad_length = bucket - input_ids.shape[1]
+        if pad_length:
+            pad_token_id = self.tokenizer.pad_token_id
+            if pad_token_id is None:
+                pad_token_id = self.tokenizer.eos_token_id
+            inputs["input_ids"] = torch.nn.functional.pad(
+                input_ids, (pad_length, 0), value=pad_token_id
+            )
+            inputs["attention_mask"] = torch.nn.functional.pad(
+                inputs["attention_mask"], (pad_length, 0), value=0
+            )
+        return inputs
+
+    def _prerender_chat_templates(self) -> None:
+        """Render the chat template for every supported target language."""
+        try:
+            # The UI passes native display names as the target language
+            for language in get_supported_languages(exclude_auto=True):
+                self._chat_template(language.display_name)
+        except Exception as e:
+            # Templates are rendered lazily on first use instead
+            self._chat_templates.clear()
+            logger.warning(f"Chat template pre-rendering failed: {e}")
+
+    def _get_quantization(self) -> str:
+        """
+        Resolve the configured quantization mode for the current device.
+
+        Returns:
+            "int8", "int4" or "none"
+        """
+        if self.config.quantization != "auto":
+            quantization = self.config.quantization
+            # Quanto has no accelerated int8/int4 matmul on MPS or CPU, where
+            # quantized weights decode several times slower than half precision
+            if (
+                quantization in ("int8", "int4")
+                and self.device in ("mps", "cpu")
+                and not self.config.force_quantization
+            ):
+                logger.warning(
+                    f"{quantization.upper()} quantization disabled on {self.device}; "
+                    "set force_quantization to override"
+                )
+                return "none"
+            return quantization
+
+        # Decode streams every weight per token, so 4-bit weights pay off
+        # most on GPUs where the bf16 model barely fits
+        if self.device == "cuda":
+            total_memory = torch.cuda.get_device_properties(0).total_memory
+            if total_memory < _INT4_MEMORY_THRESHOLD:
+                return "int4"
+        return "none"
+
+    def _get_quantization_config(self) -> Optional[QuantoConfig]:
+        """
+        Build the Quanto weight quantization config.
+
+        Returns:
+            QuantoConfig for int8/int4 weights, or None for full precision
+        """
+        quantization = self._get_quantization()
+        if quantization not in ("int8", "int4"):
+            return None
+
+        logger.info(f"{quantization.upper()} quantization enabled")
+        # transformers freezes the quantized weights while loading; the
+        # output projection stays in full precision
+        return QuantoConfig(
+            weights=quantization, activations=None, modules_to_not_convert=["lm_head"]
+        )
+
+    def _get_dtype(self) -> torch.dtype:
+        """
+        Choose the half-precision dtype for GPU devices.
+
+        Returns:
+            bfloat16 on CUDA when supported, float16 on older CUDA and MPS,
+            otherwise the configured dtype
+        """
+        if self.device == "cuda":
+            return torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+        if self.device == "mps":
+            return torch.float16
+        return getattr(torch, self.config.dtype)
+
+    def _get_attn_implementation(self) -> str:
+        """
+        Choose the fused attention kernel for the current device.
+
+        Returns:
+            "flash_attention_2" on CUDA when flash-attn is installed, else "sdpa"
+        """
+        if self.device == "cuda" and importlib.util.find_spec("flash_attn") is not None:
+            return "flash_attention_2"
+        # flash-attn has no MPS/CPU build; SDPA picks the best fused kernel
+        return "sdpa"
+
     def _get_device(self) -> str:
         """
         Determine the best available device.
@@ -153,6 +583,7 @@ class ModelManager:
         source_lang: str = "auto",
         target_lang: str = "Korean",
         progress_callback: Optional[Callable[[int, str], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
     ) -> str:
         """
         Translate text using the model.
@@ -162,6 +593,7 @@ class ModelManager:
             source_lang: Source language (not used, auto-detected by model)
             target_lang: Target language name
             progress_callback: Optional progress callback
+            cancel_event: Optional event that stops decoding early when set
 
         Returns:
             Translated text
@@ -176,60 +608,33 @@ class ModelManager:
         if not text or not text.strip():
             raise ValueError("Text cannot be empty")
 
-        if len(text) > 2000:
-            raise ValueError(f"Text too long: {len(text)} chars (max 2000)")
+        max_length = config.performance.max_text_length
+        if len(text) > max_length:
+            raise ValueError(f"Text too long: {len(text)} chars (max {max_length})")
 
         try:
             if progress_callback:
                 progress_callback(10, "Preparing translation...")
 
-            # Prepare messages for chat template
-            messages = [
-                {
-                    "role": "system",
-                    "content": (
-                        f"Translate the user's text to {target_lang}. "
-                        "Output only one sentence of the final translation. "
-                        "Do not print explanations, thought processes, or examples."
-                    ),
-                },
-                {"role": "user", "content": text},
-            ]
-
-            # Apply chat template
-            prompt = self.tokenizer.apply_chat_template(
-                messages, tokenize=False, add_generation_prompt=True
-            )
-
             if progress_callback:
                 progress_callback(30, "Tokenizing input...")
 
-            # Tokenize
-            inputs = self.tokenizer(prompt, return_tensors="pt").to(self.model.device)
-            input_length = inputs["input_ids"].shape[1]
+            # Tokenize (the chat-template prefix is cached per target language)
+            inputs = self._tokenize_prompt(text, target_lang)
 
             if progress_callback:
                 progress_callback(50, "Translating...")
 
             # Generate translation
-            # 입력 길이에 비례한 동적 max_new_tokens (최소 50, 최대 config값)
-            dynamic_max_tokens = max(50, min(input_length * 3, self.config.max_new_tokens))
-
-            with torch.inference_mode():
-                outputs = self.model.generate(
-                    **inputs,
-                    max_new_tokens=dynamic_max_tokens,
-                    do_sample=False,
-                    eos_token_id=self.tokenizer.eos_token_id,
-                    repetition_penalty=self.config.repetition_penalty,
-                    no_repeat_ngram_size=self.config.no_repeat_ngram_size,
-                )
+            if self._et_model is not None:
+                generated_tokens = self._generate_executorch(inputs)
+            else:
+                generated_tokens = self._generate(inputs, target_lang, cancel_event)
 
             if progress_callback:
                 progress_callback(90, "Decoding output...")
 
-            # Extract and decode translation
-            generated_tokens = outputs[0][input_length:]
+            # Decode translation
             translation = self.tokenizer.decode(generated_tokens, skip_special_tokens=True)
 
             if progress_callback:
@@ -242,13 +647,308 @@ class ModelManager:
             logger.error(f"Translation failed: {e}", exc_info=True)
             raise RuntimeError(f"Translation error: {e}") from e
 
+    def _to_device(self, inputs: BatchEncoding) -> BatchEncoding:
+        """
+        Move tokenized inputs to the model device.
+
+        On CUDA the tensors are pinned and copied asynchronously on a side
+        stream; the compute stream waits on it before the model reads them.
+
+        Args:
+            inputs: Tokenized inputs on the CPU
+
+        Returns:
+            Inputs on the model device
+        """
+        device = self.model.device
+        if device.type != "cuda":
+            return inputs.to(device)
+
+        if self._copy_stream is None:
+            self._copy_stream = torch.cuda.Stream(device=device)
+
+        with torch.cuda.stream(self._copy_stream):
+            moved = BatchEncoding(
+                {
+                    key: tensor.pin_memory().to(device, non_blocking=True)
+                    for key, tensor in inputs.items()
+                }
+            )
+        compute_stream = torch.cuda.current_stream(device)
+        compute_stream.wait_stream(self._copy_stream)
+        for tensor in moved.values():
+            # Keep the allocator from reusing the memory before compute is done
+            tensor.record_stream(compute_stream)
+        return moved
+
+    def _generate(
+        self,
+        inputs: BatchEncoding,
+        target_lang: str,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> torch.Tensor:
+        """
+        Run greedy generation with the PyTorch model.
+
+        Args:
+            inputs: Tokenized prompt on the CPU
+            target_lang: Target language name, used to look up the prefix cache
+            cancel_event: Optional event checked after every decoding step
+
+        Returns:
+            Generated token ids, without the prompt
+        """
+        if self._use_static_cache:
+            inputs = self._pad_to_bucket(inputs)
+        inputs = self._to_device(inputs)
+        input_length = inputs["input_ids"].shape[1]
+
+        generate_kwargs = self._repetition_kwargs()
+        prefix_kv = self._get_prefix_kv(target_lang)
+        if prefix_kv is not None:
+            # generate() only prefills tokens past the cached prefix; the
+            # copy keeps the stored prefix cache unchanged
+            generate_kwargs["past_key_values"] = copy.deepcopy(prefix_kv)
+        if self.config.prompt_lookup_num_tokens and not self._use_static_cache:
+            # Draft tokens by matching n-grams from the prompt (names,
+            # numbers, code); greedy verification keeps the output exact
+            generate_kwargs["prompt_lookup_num_tokens"] = self.config.prompt_lookup_num_tokens
+        if cancel_event is not None:
+            generate_kwargs["stopping_criteria"] = StoppingCriteriaList(
+                [_CancelCriteria(cancel_event)]
+            )
+
+        max_new_tokens = self._max_new_tokens(input_length)
+
+        with torch.inference_mode():
+            outputs = self.model.generate(
+                **inputs,
+                max_new_tokens=max_new_tokens,
+                do_sample=False,
+                use_cache=True,
+                eos_token_id=self.tokenizer.eos_token_id,
+                **generate_kwargs,
+            )
+
+        return outputs[0][input_length:]
+
+    def _max_new_tokens(self, input_length: int) -> int:
+        """
+        Get the generation budget for a prompt of input_length tokens.
+
+        Budgets come from _NEW_TOKEN_BUCKETS rather than scaling with the
+        prompt, so static caches and compiled graphs see a fixed set of
+        shapes. Generation still ends early at EOS.
+
+        Args:
+            input_length: Prompt length in tokens
+
+        Returns:
+            max_new_tokens for generate(), at most config.max_new_tokens
+        """
+        wanted = input_length * 3
+        for bucket in _NEW_TOKEN_BUCKETS:
+            if bucket >= wanted:
+                return min(bucket, self.config.max_new_tokens)
+        return self.config.max_new_tokens
+
+    def _repetition_kwargs(self) -> dict:
+        """
+        Get repetition control arguments for generate().
+
+        Only enabled settings are passed, so generate() does not add their
+        logits processors to the decoding loop.
+
+        Returns:
+            Keyword arguments for generate()
+        """
+        kwargs = {}
+        if self.config.repetition_penalty != 1.0:
+            kwargs["repetition_penalty"] = self.config.repetition_penalty
+        if self.config.no_repeat_ngram_size > 0:
+            kwargs["no_repeat_ngram_size"] = self.config.no_repeat_ngram_size
+        return kwargs
+
+    def _generate_executorch(self, inputs: BatchEncoding) -> torch.Tensor:
+        """
+        Run greedy generation with the exported ExecuTorch program.
+
+        Args:
+            inputs: Tokenized prompt on the CPU
+
+        Returns:
+            Generated token ids, without the prompt
+        """
+        prompt_tokens = inputs["input_ids"][0].tolist()
+        generated = self._et_model.generate(
+            prompt_tokens=prompt_tokens,
+            echo=False,
+            max_seq_len=len(prompt_tokens) + self.config.max_new_tokens,
+        )
+        return torch.tensor(generated, dtype=torch.long)
+
+    @staticmethod
+    def _build_messages(text: str, target_lang: str) -> list:
+        """Build the chat messages for translating text into target_lang."""
+        return [
+            {
+                "role": "system",
+                "content": (
+                    f"Translate the user's text to {target_lang}. "
+                    "Output only one sentence of the final translation. "
+                    "Do not print explanations, thought processes, or examples."
+                ),
+            },
+            {"role": "user", "content": text},
+        ]
+
+    def _render_chat_template(self, text: str, target_lang: str) -> str:
+        """Render the prompt through the tokenizer's Jinja chat template."""
+        return self.tokenizer.apply_chat_template(
+            self._build_messages(text, target_lang), tokenize=False, add_generation_prompt=True
+        )
+
+    def _chat_template(self, target_lang: str) -> Optional[Tuple[str, str]]:
+        """
+        Get the rendered chat template for target_lang, split around the user text.
+
+        The template is rendered once with a sentinel as the user text and
+        checked against a full render of a sample text.
+
+        Args:
+            target_lang: Target language name
+
+        Returns:
+            (prefix, suffix) strings, or None if the template cannot be split
+        """
+        if target_lang in self._chat_templates:
+            return self._chat_templates[target_lang]
+
+        template: Optional[Tuple[str, str]] = None
+        rendered = self._render_chat_template(_USER_SENTINEL, target_lang)
+        if rendered.count(_USER_SENTINEL) == 1:
+            prefix, suffix = rendered.split(_USER_SENTINEL)
+            sample = _TEMPLATE_CHECK_TEXT
+            if prefix + sample + suffix == self._render_chat_template(sample, target_lang):
+                template = (prefix, suffix)
+        if template is None:
+            logger.warning(f"Chat template for {target_lang} is not splittable; rendering per call")
+
+        self._chat_templates[target_lang] = template
+        return template
+
+    def _render_prompt(self, text: str, target_lang: str) -> str:
+        """Render the full chat-template prompt for a translation."""
+        template = self._chat_template(target_lang)
+        if template is None:
+            return self._render_chat_template(text, target_lang)
+        prefix, suffix = template
+        return prefix + text + suffix
+
+    def _tokenize_prompt(self, text: str, target_lang: str) -> BatchEncoding:
+        """
+        Tokenize the translation prompt, reusing the cached template prefix.
+
+        The system prompt and everything before the user text only depend on
+        target_lang, so they are tokenized once and only the user text and
+        the trailing template are tokenized per call. The first call for
+        each language checks the split against a full tokenization and
+        disables the cache for that language if tokens differ.
+
+        Args:
+            text: Text to translate
+            target_lang: Target language name
+
+        Returns:
+            Tokenized inputs with input_ids and attention_mask on the CPU
+        """
+        if target_lang in self._prompt_parts:
+            parts = self._prompt_parts[target_lang]
+            if parts is not None:
+                return self._join_prompt_parts(parts, text)
+            return self.tokenizer(self._render_prompt(text, target_lang), return_tensors="pt")
+
+        full = self.tokenizer(self._render_prompt(text, target_lang), return_tensors="pt")
+
+        parts: Optional[Tuple[torch.Tensor, str]] = None
+        template = self._chat_template(target_lang)
+        if template is not None:
+            prefix, suffix = template
+            prefix_ids = self.tokenizer(prefix, return_tensors="pt")["input_ids"]
+            parts = (prefix_ids, suffix)
+            joined_ids = self._join_prompt_parts(parts, text)["input_ids"]
+            if not torch.equal(joined_ids, full["input_ids"]):
+                logger.warning(f"Prompt prefix cache disabled for {target_lang}: token mismatch")
+                parts = None
+        self._prompt_parts[target_lang] = parts
+        return full
+
+    def _join_prompt_parts(self, parts: Tuple[torch.Tensor, str], text: str) -> BatchEncoding:
+        """Append the tokenized user text and template suffix to a cached prefix."""
+        prefix_ids, suffix = parts
+        delta_ids = self.tokenizer(text + suffix, add_special_tokens=False, return_tensors="pt")[
+            "input_ids"
+        ]
+        input_ids = torch.cat([prefix_ids, delta_ids], dim=1)
+        return BatchEncoding(
+            {"input_ids": input_ids, "attention_mask": torch.ones_like(input_ids)}
+        )
+
+    def _get_prefix_kv(self, target_lang: str) -> Optional[DynamicCache]:
+        """
+        Get the KV cache for the cached prompt prefix of target_lang.
+
+        The prefix is prefilled on first use. Static-cache (compiled) decoding
+        pads prompts on the left, which shifts the prefix, so it is skipped,
+        as is prompt lookup decoding.
+
+        Args:
+            target_lang: Target language name
+
+        Returns:
+            The prefix KV cache, or None if prefix reuse is unavailable
+        """
+        if self._use_static_cache:
+            return None
+        # Assisted decoding does not resume correctly from a pre-filled
+        # prompt cache, so prompt lookup decoding prefills the whole prompt
+        if self.config.prompt_lookup_num_tokens:
+            return None
+        parts = self._prompt_parts.get(target_lang)
+        if parts is None:
+            return None
+
+        prefix_kv = self._prefix_kv.get(target_lang)
+        if prefix_kv is None:
+            prefix_ids = parts[0].to(self.model.device)
+            with torch.inference_mode():
+                outputs = self.model(
+                    input_ids=prefix_ids,
+                    past_key_values=DynamicCache(config=self.model.config),
+                    use_cache=True,
+                )
+            prefix_kv = outputs.past_key_values
+            self._prefix_kv[target_lang] = prefix_kv
+        return prefix_kv
+
     def unload(self) -> None:
         """Unload model and free memory."""
+        if self._et_model is not None:
+            self._et_model = None
+            self.tokenizer = None
+            self._chat_templates.clear()
+            self._prompt_parts.clear()
+            self._is_loaded = False
+            logger.info("ExecuTorch model unloaded")
+
         if self.model is not None:
             del self.model
             del self.tokenizer
             self.model = None
             self.tokenizer = None
+            self._chat_templates.clear()
+            self._prompt_parts.clear()
+            self._prefix_kv.clear()
 
             # Clear device cache
             if self.device == "mps" and torch.backends.mps.is_available():
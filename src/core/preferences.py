@@ -3,10 +3,13 @@
 from enum import Enum
 from typing import Any
 
-from PySide6.QtCore import QByteArray, QSettings
+from PySide6.QtCore import QByteArray, QSettings, QTimer
 
 from core.config import LanguageCode
 
+# Cache marker for keys known to be absent from the settings store
+_ABSENT = object()
+
 
 class Theme(str, Enum):
     """Theme preference options."""
@@ -20,6 +23,8 @@ class UserPreferences:
     """Manages user preferences using QSettings."""
 
     SETTINGS_VERSION = 1
+    # Writes within this window are coalesced into a single sync to disk
+    SYNC_DEBOUNCE_MS = 500
 
     def __init__(self, organization: str = "LocalTranslate", application: str = "LocalTranslate"):
         """
@@ -30,6 +35,17 @@ class UserPreferences:
             application: Application name for QSettings
         """
         self._settings = QSettings(organization, application)
+
+        # Values read from or written to QSettings, keyed by settings key, so
+        # repeated property reads skip the settings backend
+        self._cache: dict[str, Any] = {}
+
+        self._dirty = False
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.SYNC_DEBOUNCE_MS)
+        self._flush_timer.timeout.connect(self._flush)
+
         self._migrate_if_needed()
 
     # Language preferences
@@ -37,39 +53,39 @@ class UserPreferences:
     @property
     def source_language(self) -> str:
         """Get source language preference."""
-        return self._settings.value("language/source", LanguageCode.AUTO.value, type=str)
+        return self._value("language/source", LanguageCode.AUTO.value, value_type=str)
 
     @source_language.setter
     def source_language(self, value: str) -> None:
         """Set source language preference."""
-        self._settings.setValue("language/source", value)
+        self._set("language/source", value)
 
     @property
     def target_language(self) -> str:
         """Get target language preference."""
-        return self._settings.value("language/target", LanguageCode.KOREAN.value, type=str)
+        return self._value("language/target", LanguageCode.KOREAN.value, value_type=str)
 
     @target_language.setter
     def target_language(self, value: str) -> None:
         """Set target language preference."""
-        self._settings.setValue("language/target", value)
+        self._set("language/target", value)
 
     @property
     def auto_detect(self) -> bool:
         """Get auto-detect language preference."""
-        return self._settings.value("language/auto_detect", True, type=bool)
+        return self._value("language/auto_detect", True, value_type=bool)
 
     @auto_detect.setter
     def auto_detect(self, value: bool) -> None:
         """Set auto-detect language preference."""
-        self._settings.setValue("language/auto_detect", value)
+        self._set("language/auto_detect", value)
 
     # Window geometry
 
     @property
     def window_geometry(self) -> QByteArray | None:
         """Get window geometry."""
-        value = self._settings.value("window/geometry")
+        value = self._value("window/geometry")
         if value is not None:
             return QByteArray(value)
         return None
@@ -77,12 +93,12 @@ class UserPreferences:
     @window_geometry.setter
     def window_geometry(self, value: QByteArray) -> None:
         """Set window geometry."""
-        self._settings.setValue("window/geometry", value)
+        self._set("window/geometry", value)
 
     @property
     def window_state(self) -> QByteArray | None:
         """Get window state."""
-        value = self._settings.value("window/state")
+        value = self._value("window/state")
         if value is not None:
             return QByteArray(value)
         return None
@@ -90,14 +106,14 @@ class UserPreferences:
     @window_state.setter
     def window_state(self, value: QByteArray) -> None:
         """Set window state."""
-        self._settings.setValue("window/state", value)
+        self._set("window/state", value)
 
     # Theme preference
 
     @property
     def theme(self) -> Theme:
         """Get theme preference."""
-        value = self._settings.value("appearance/theme", Theme.AUTO.value, type=str)
+        value = self._value("appearance/theme", Theme.AUTO.value, value_type=str)
         try:
             return Theme(value)
         except ValueError:
@@ -106,17 +122,17 @@ class UserPreferences:
     @theme.setter
     def theme(self, value: Theme) -> None:
         """Set theme preference."""
-        self._settings.setValue("appearance/theme", value.value)
+        self._set("appearance/theme", value.value)
 
     @property
     def dark_mode(self) -> bool:
         """Get dark mode preference (simpler alternative to theme)."""
-        return self._settings.value("appearance/dark_mode", False, type=bool)
+        return self._value("appearance/dark_mode", False, value_type=bool)
 
     @dark_mode.setter
     def dark_mode(self, value: bool) -> None:
         """Set dark mode preference."""
-        self._settings.setValue("appearance/dark_mode", value)
+        self._set("appearance/dark_mode", value)
 
     # Generic getter/setter for dynamic preferences
 
@@ -131,7 +147,7 @@ class UserPreferences:
         Returns:
             The preference value or default
         """
-        return self._settings.value(f"preferences/{key}", default)
+        return self._value(f"preferences/{key}", default)
 
     def set(self, key: str, value: Any) -> None:
         """
@@ -141,17 +157,66 @@ class UserPreferences:
             key: The preference key
             value: The value to set
         """
-        self._settings.setValue(f"preferences/{key}", value)
+        self._set(f"preferences/{key}", value)
 
     # Utility methods
 
+    def _value(self, key: str, default: Any = None, value_type: type | None = None) -> Any:
+        """
+        Read a value through the in-memory cache.
+
+        Args:
+            key: The settings key
+            default: Value returned if the key doesn't exist
+            value_type: Type to coerce the stored value to, as QSettings.value does
+
+        Returns:
+            The stored value or default
+        """
+        if key not in self._cache:
+            if not self._settings.contains(key):
+                self._cache[key] = _ABSENT
+            elif value_type is None:
+                self._cache[key] = self._settings.value(key)
+            else:
+                self._cache[key] = self._settings.value(key, type=value_type)
+        value = self._cache[key]
+        return default if value is _ABSENT else value
+
+    def _set(self, key: str, value: Any) -> None:
+        """Store a value and schedule a debounced sync to disk.
+
+        Setting a key to the value it already holds is a no-op, so handlers
+        that save all of their state on each change only write what changed.
+        """
+        cached = self._cache.get(key, _ABSENT)
+        if type(cached) is type(value) and cached == value:
+            return
+        self._settings.setValue(key, value)
+        self._cache[key] = value
+        self._dirty = True
+        self._flush_timer.start()
+
+    def _flush(self) -> None:
+        """Write pending changes to disk."""
+        if self._dirty:
+            self._dirty = False
+            self._settings.sync()
+
     def sync(self) -> None:
         """Force write settings to disk."""
+        self._flush_timer.stop()
+        self._dirty = False
         self._settings.sync()
 
+    def invalidate(self) -> None:
+        """Drop cached values so the next reads go back to QSettings."""
+        self._cache.clear()
+
     def clear(self) -> None:
         """Clear all settings."""
         self._settings.clear()
+        self._cache.clear()
 
     def reset_to_defaults(self) -> None:
         """Reset all settings to default values."""
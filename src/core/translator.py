@@ -1,12 +1,18 @@
 """Translation service with async execution and debouncing."""
 
-import os
+import heapq
+import itertools
+import logging
+import queue
+import threading
 import time
-import uuid
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from types import TracebackType
 from typing import Callable, Optional
 
-from PySide6.QtCore import QObject, QThreadPool, QTimer, Signal
+from PySide6.QtCore import QCoreApplication, QObject, QTimer, Signal
 
 from utils.logger import get_logger
 from utils.async_helpers import Worker
@@ -17,8 +23,27 @@ from core.error_handler import ErrorClassifier, ErrorType, TranslationError
 
 logger = get_logger(__name__)
 
+ExcInfo = tuple[type[BaseException], BaseException, TracebackType]
 
-@dataclass
+
+def _log_traceback(exception: Optional[BaseException]) -> None:
+    """Log a worker's traceback at DEBUG, formatting it only if that level is enabled."""
+    if exception is not None and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Traceback:\n%s", "".join(traceback.format_exception(exception)))
+
+
+def _as_translation_error(payload: TranslationError | ExcInfo) -> TranslationError:
+    """Get the TranslationError for a worker error signal payload."""
+    if isinstance(payload, TranslationError):
+        return payload
+    # The worker could not classify the error; fall back to its message
+    exception = payload[1]
+    error = ErrorClassifier.classify_from_message(str(exception))
+    error.original_exception = exception
+    return error
+
+
+@dataclass(slots=True)
 class RetryState:
     """Tracks retry state for a translation task."""
 
@@ -42,6 +67,17 @@ class TranslationService(QObject):
     translationError = Signal(str, object)  # task_id, TranslationError
     translationRetrying = Signal(str, int, int, int)  # task_id, attempt, max_attempts, delay_ms
 
+    # Internal signals queuing worker events from the generator thread back
+    # to the GUI thread; this object outlives the events, unlike the workers
+    _workerResult = Signal(str, object)  # task_id, (source_lang, translated_text)
+    _workerError = Signal(str, object)  # task_id, TranslationError or exc_info
+    _workerRetired = Signal(object)  # Worker the generator thread is done with
+
+    # Resolution of translation timeouts
+    TIMEOUT_TICK_MS = 250
+    # Finished translation workers kept for reuse
+    WORKER_POOL_SIZE = 4
+
     def __init__(
         self,
         model_manager: ModelManager,
@@ -61,12 +97,24 @@ class TranslationService(QObject):
         self.language_detector = language_detector
         self.debounce_ms = debounce_ms
 
-        # Thread pool for async execution
-        self.thread_pool = QThreadPool.globalInstance()
-        # Optimize thread count based on CPU cores (min 2, max 4)
-        cpu_count = os.cpu_count() or 2
-        max_threads = min(4, max(2, cpu_count))
-        self.thread_pool.setMaxThreadCount(max_threads)
+        # One long-lived thread runs every model call, so translations share
+        # its torch/CUDA state instead of migrating between pool threads.
+        # Worker callbacks run there and reach the GUI thread through the
+        # internal signals.
+        self._workerResult.connect(self._on_worker_result)
+        self._workerError.connect(self._on_worker_error_with_retry)
+        self._workerRetired.connect(self._on_worker_retired)
+        self._work_queue: queue.Queue[Optional[Worker]] = queue.Queue()
+        self._generator_thread = threading.Thread(
+            target=self._run_loop, name="translation-generator", daemon=True
+        )
+        self._generator_thread.start()
+
+        # Language detection runs beside the model call instead of before it;
+        # the model ignores the source language, so nothing waits on it
+        self._detect_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="language-detect"
+        )
 
         # Debouncing support
         self.debounce_timer = QTimer()
@@ -74,20 +122,73 @@ class TranslationService(QObject):
         self.debounce_timer.timeout.connect(self._execute_pending_task)
         self.pending_task = None
 
+        # Task IDs are only generated on the GUI thread, so a counter suffices
+        self._task_ids = itertools.count()
+
+        # (text, source_lang, target_lang) of the last executed task, so an
+        # identical request can join it instead of restarting the model
+        self._last_submitted_key: Optional[tuple[str, str, str]] = None
+        self._last_submitted_id: Optional[str] = None
+
         # Track active tasks
-        self.active_tasks: dict[str, Worker] = {}
+        # Most recent wins, so at most one translation is tracked at a time;
+        # superseded workers are cancelled and left to finish on their own
+        self._active: Optional[Worker] = None
+        self._active_id: Optional[str] = None
+        # Finished workers, reused with their callbacks still bound
+        self._worker_pool: list[Worker] = []
         self.last_task_id: Optional[str] = None
 
         # Retry management
         self.retry_states: dict[str, RetryState] = {}
 
-        # Timeout management
-        self.timeout_timers: dict[str, QTimer] = {}
+        # Scheduled retries as (time.monotonic() due, task_id), served by one timer
+        self._retry_heap: list[tuple[float, str]] = []
+        self._retry_timer = QTimer(self)
+        self._retry_timer.setSingleShot(True)
+        self._retry_timer.timeout.connect(self._fire_retries)
 
-        logger.info(
-            f"TranslationService initialized with {debounce_ms}ms debounce, "
-            f"{self.thread_pool.maxThreadCount()} max threads"
-        )
+        # The config is frozen, so retry and timeout settings are read once
+        cfg = config.error_handling
+        self._cfg_initial_delay_ms = cfg.initial_retry_delay_ms
+        self._cfg_backoff = cfg.backoff_multiplier
+        self._cfg_max_delay_ms = cfg.max_retry_delay_ms
+        # Attempts allowed per task (1 initial + retries), by error type
+        self._max_attempts = cfg.max_retries + 1
+        self._max_attempts_by_error = {ErrorType.MEMORY: cfg.memory_error_max_retries + 1}
+        self._cfg_timeout_ms = cfg.translation_timeout_ms
+
+        # Timeout management: one shared tick checks every task's deadline
+        self._deadlines: dict[str, float] = {}  # task_id -> time.monotonic() deadline
+        self._timeout_tick = QTimer(self)
+        self._timeout_tick.setInterval(self.TIMEOUT_TICK_MS)
+        self._timeout_tick.timeout.connect(self._scan_deadlines)
+
+        logger.info(f"TranslationService initialized with {debounce_ms}ms debounce")
+
+    def _run_loop(self) -> None:
+        """Run queued workers one at a time until shutdown (generator thread)."""
+        while True:
+            worker = self._work_queue.get()
+            if worker is None:
+                break
+            # Workers cancelled while queued return without calling fn
+            worker.run()
+            # Finishing is handled here rather than by on_finished, since the
+            # GUI thread needs to know which worker is done
+            self._workerRetired.emit(worker)
+            del worker
+
+    @property
+    def active_tasks(self) -> dict[str, Worker]:
+        """Get the running task as a read-only {task_id: worker} snapshot."""
+        if self._active is None:
+            return {}
+        return {self._active_id: self._active}
+
+    def _next_task_id(self) -> str:
+        """Generate a task ID unique within this service."""
+        return f"t{next(self._task_ids):08x}"
 
     def translate(
         self,
@@ -106,12 +207,37 @@ class TranslationService(QObject):
             debounce: If True, debounce rapid successive calls
 
         Returns:
-            task_id: Unique identifier for this task
+            task_id: Unique identifier for this task, or of an identical task
+                that is already running or pending
         """
+        key = (text, source_lang, target_lang)
+
+        # Identical to the running task: let it finish instead of restarting
+        if self._matches_running_task(key):
+            logger.debug(f"Request matches running task: {self._last_submitted_id}")
+            # Input went back to the running text, so older pending input is stale
+            self.pending_task = None
+            self.last_task_id = self._last_submitted_id
+            return self._last_submitted_id
+
+        # Identical to the pending task: keep its debounce deadline
+        if debounce and self.pending_task and self.pending_task[1:] == key:
+            task_id = self.pending_task[0]
+            logger.debug(f"Request matches pending task: {task_id}")
+            self.last_task_id = task_id
+            return task_id
+
         # Generate unique task ID
-        task_id = str(uuid.uuid4())[:8]
+        task_id = self._next_task_id()
 
-        if debounce:
+        if debounce and not self.debounce_timer.isActive():
+            # Leading edge: the first request after a quiet period runs now,
+            # and the timer opens a window that debounces the input following it
+            self._execute_task(task_id, text, source_lang, target_lang)
+            self.debounce_timer.start(self.debounce_ms)
+            logger.debug(f"Task {task_id} executed on leading edge")
+
+        elif debounce:
             # Cancel pending task if exists
             if self.pending_task:
                 old_task_id = self.pending_task[0]
@@ -130,11 +256,22 @@ class TranslationService(QObject):
         self.last_task_id = task_id
         return task_id
 
+    def _matches_running_task(self, key: tuple[str, str, str]) -> bool:
+        """Check if (text, source_lang, target_lang) is the request still running."""
+        return (
+            key == self._last_submitted_key
+            and self._active_id is not None
+            and self._active_id == self._last_submitted_id
+        )
+
     def _execute_pending_task(self) -> None:
         """Execute the pending debounced task."""
         if self.pending_task:
             task_id, text, source_lang, target_lang = self.pending_task
             self.pending_task = None
+            if self._matches_running_task((text, source_lang, target_lang)):
+                logger.debug(f"Skipping debounced task {task_id}: matches running task")
+                return
             logger.debug(f"Executing debounced task: {task_id}")
             self._execute_task(task_id, text, source_lang, target_lang)
 
@@ -151,13 +288,16 @@ class TranslationService(QObject):
         # Cancel all currently active tasks (most recent wins)
         self.cancel_all_tasks()
 
+        self._last_submitted_key = (text, source_lang, target_lang)
+        self._last_submitted_id = task_id
+
         # Initialize retry state
         retry_state = RetryState(
             task_id=task_id,
             text=text,
             source_lang=source_lang,
             target_lang=target_lang,
-            max_attempts=config.error_handling.max_retries + 1,
+            max_attempts=self._max_attempts,
         )
         self.retry_states[task_id] = retry_state
 
@@ -174,65 +314,94 @@ class TranslationService(QObject):
         retry_state.attempt += 1
         task_id = retry_state.task_id
 
-        # Create worker
-        worker = Worker(
-            task_id=task_id,
-            fn=self._translate_worker,
+        worker = self._acquire_worker(
+            task_id,
+            self._translate_worker,
             text=retry_state.text,
             source_lang=retry_state.source_lang,
             target_lang=retry_state.target_lang,
         )
-
-        # Connect signals
-        worker.signals.started.connect(self._on_worker_started)
-        worker.signals.progress.connect(self._on_worker_progress)
-        worker.signals.result.connect(self._on_worker_result)
-        worker.signals.error.connect(self._on_worker_error_with_retry)
-        worker.signals.finished.connect(self._on_worker_finished)
+        # Lets generate() stop mid-decode when the task is superseded
+        worker.kwargs["cancel_event"] = worker.cancel_event
 
         # Track active task
-        self.active_tasks[task_id] = worker
+        self._active = worker
+        self._active_id = task_id
 
         # Setup timeout timer
         self._setup_timeout(task_id)
 
-        # Submit to thread pool
-        self.thread_pool.start(worker)
+        # Hand off to the generator thread
+        self._work_queue.put(worker)
         logger.info(
             f"Task {task_id} attempt {retry_state.attempt}/{retry_state.max_attempts} "
-            f"submitted to thread pool"
+            f"queued for generation"
         )
 
-    def _setup_timeout(self, task_id: str) -> None:
-        """Setup timeout timer for a translation task."""
-        # Cancel existing timer if any
-        self._cancel_timeout(task_id)
+    def _acquire_worker(self, task_id: str, fn: Callable, **kwargs) -> Worker:
+        """
+        Get a translation worker, reusing a pooled one if available.
 
-        timeout_ms = config.error_handling.translation_timeout_ms
+        Args:
+            task_id: Task identifier
+            fn: Function for the worker to run
+            **kwargs: Keyword arguments for fn
 
-        timer = QTimer()
-        timer.setSingleShot(True)
-        timer.timeout.connect(lambda: self._on_timeout(task_id))
+        Returns:
+            Worker with its callbacks bound to this service
+        """
+        if self._worker_pool:
+            worker = self._worker_pool.pop()
+            worker.reset(task_id, fn, **kwargs)
+            return worker
+
+        worker = Worker(task_id, fn, **kwargs)
+        worker.classify_error = ErrorClassifier.classify_from_exception
+        # Started and progress only re-emit public signals, which Qt queues to
+        # GUI receivers itself, so they are called directly
+        worker.on_started = self._on_worker_started
+        worker.on_progress = self._on_worker_progress
+        worker.on_result = self._workerResult.emit
+        worker.on_error = self._workerError.emit
+        return worker
+
+    def _release_worker(self, worker: Worker) -> None:
+        """Return a finished translation worker to the pool."""
+        if len(self._worker_pool) < self.WORKER_POOL_SIZE:
+            self._worker_pool.append(worker)
 
-        # Store timer reference
-        self.timeout_timers[task_id] = timer
+    def _setup_timeout(self, task_id: str) -> None:
+        """Setup timeout deadline for a translation task."""
+        timeout_ms = self._cfg_timeout_ms
 
-        timer.start(timeout_ms)
+        # Replaces any existing deadline for the task
+        self._deadlines[task_id] = time.monotonic() + timeout_ms / 1000
+        if not self._timeout_tick.isActive():
+            self._timeout_tick.start()
         logger.debug(f"Timeout set for {task_id}: {timeout_ms}ms")
 
     def _cancel_timeout(self, task_id: str) -> None:
-        """Cancel timeout timer for a task."""
-        if task_id in self.timeout_timers:
-            self.timeout_timers[task_id].stop()
-            del self.timeout_timers[task_id]
+        """Cancel timeout deadline for a task."""
+        self._deadlines.pop(task_id, None)
+
+    def _scan_deadlines(self) -> None:
+        """Fire timeouts for tasks past their deadline."""
+        now = time.monotonic()
+        expired = [task_id for task_id, deadline in self._deadlines.items() if deadline <= now]
+        for task_id in expired:
+            self._deadlines.pop(task_id, None)
+            self._on_timeout(task_id)
+
+        if not self._deadlines:
+            self._timeout_tick.stop()
 
     def _on_timeout(self, task_id: str) -> None:
         """Handle translation timeout."""
         logger.warning(f"Translation timeout: {task_id}")
 
         # Cancel the worker
-        if task_id in self.active_tasks:
-            self.active_tasks[task_id].cancel()
+        if self._active is not None and task_id == self._active_id:
+            self._active.cancel()
 
         # Create timeout error
         error = ErrorClassifier.create_timeout_error()
@@ -242,9 +411,8 @@ class TranslationService(QObject):
 
     def _calculate_retry_delay(self, attempt: int) -> int:
         """Calculate retry delay with exponential backoff."""
-        cfg = config.error_handling
-        delay = cfg.initial_retry_delay_ms * (cfg.backoff_multiplier ** (attempt - 1))
-        return min(int(delay), cfg.max_retry_delay_ms)
+        delay = self._cfg_initial_delay_ms * self._cfg_backoff ** (attempt - 1)
+        return min(int(delay), self._cfg_max_delay_ms)
 
     def _handle_error_with_retry(self, task_id: str, error: TranslationError) -> None:
         """Handle error with potential retry."""
@@ -253,28 +421,25 @@ class TranslationService(QObject):
             self.translationError.emit(task_id, error)
             return
 
-        # Determine max retries based on error type
-        max_retries = config.error_handling.max_retries
-        if error.error_type == ErrorType.MEMORY:
-            max_retries = config.error_handling.memory_error_max_retries
+        # Determine max attempts based on error type
+        max_attempts = self._max_attempts_by_error.get(error.error_type, self._max_attempts)
 
         # Check if retryable and within limits
-        if error.is_retryable and retry_state.attempt <= max_retries:
+        if error.is_retryable and retry_state.attempt < max_attempts:
             # Calculate delay with exponential backoff
             delay_ms = self._calculate_retry_delay(retry_state.attempt)
 
             logger.info(
-                f"Retrying {task_id}: attempt {retry_state.attempt}/{max_retries + 1}, "
+                f"Retrying {task_id}: attempt {retry_state.attempt}/{max_attempts}, "
                 f"delay {delay_ms}ms, error: {error.error_type.name}"
             )
 
             # Emit retrying signal
-            self.translationRetrying.emit(
-                task_id, retry_state.attempt, max_retries + 1, delay_ms
-            )
+            self.translationRetrying.emit(task_id, retry_state.attempt, max_attempts, delay_ms)
 
             # Schedule retry
-            QTimer.singleShot(delay_ms, lambda: self._execute_attempt(retry_state))
+            heapq.heappush(self._retry_heap, (time.monotonic() + delay_ms / 1000, task_id))
+            self._schedule_retry_timer()
         else:
             # Max retries exceeded or not retryable
             logger.error(
@@ -284,12 +449,32 @@ class TranslationService(QObject):
             self.translationError.emit(task_id, error)
             self.retry_states.pop(task_id, None)
 
+    def _schedule_retry_timer(self) -> None:
+        """Start the retry timer for the earliest scheduled retry."""
+        if not self._retry_heap:
+            self._retry_timer.stop()
+            return
+        delay = self._retry_heap[0][0] - time.monotonic()
+        self._retry_timer.start(max(0, int(delay * 1000)))
+
+    def _fire_retries(self) -> None:
+        """Run every retry that is due."""
+        now = time.monotonic()
+        while self._retry_heap and self._retry_heap[0][0] <= now:
+            _, task_id = heapq.heappop(self._retry_heap)
+            # Tasks cancelled while waiting no longer have a retry state
+            retry_state = self.retry_states.get(task_id)
+            if retry_state is not None:
+                self._execute_attempt(retry_state)
+        self._schedule_retry_timer()
+
     def _translate_worker(
         self,
         text: str,
         source_lang: str,
         target_lang: str,
         progress_callback: Optional[Callable[[int, str], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
     ) -> tuple[str, str]:
         """
         Worker function for translation (runs in background thread).
@@ -299,20 +484,20 @@ class TranslationService(QObject):
             source_lang: Source language
             target_lang: Target language
             progress_callback: Progress callback from Worker
+            cancel_event: Worker cancellation event, forwarded to the model
 
         Returns:
             Tuple of (detected_source_lang, translated_text)
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
 
-        # Auto-detect language if needed
+        # Auto-detect language if needed, concurrently with the translation
+        detect_future: Optional[Future] = None
         if source_lang == "auto":
             if progress_callback:
                 progress_callback(10, "Detecting language...")
 
-            detected = self.language_detector.detect(text)
-            source_lang = detected if detected else "en"
-            logger.info(f"Detected source language: {source_lang}")
+            detect_future = self._detect_executor.submit(self.language_detector.detect, text)
         else:
             logger.info(f"Using specified source language: {source_lang}")
 
@@ -325,14 +510,22 @@ class TranslationService(QObject):
             source_lang=source_lang,
             target_lang=target_lang,
             progress_callback=progress_callback,
+            cancel_event=cancel_event,
         )
 
-        elapsed = time.time() - start_time
-        logger.info(
-            f"Translation completed in {elapsed:.2f}s: "
-            f"'{text[:50]}...' ({len(text)} chars) -> "
-            f"'{translated_text[:50]}...' ({len(translated_text)} chars)"
-        )
+        if detect_future is not None:
+            detected = detect_future.result()
+            source_lang = detected if detected else "en"
+            logger.info(f"Detected source language: {source_lang}")
+
+        # Skip building the previews when INFO is filtered out
+        if logger.isEnabledFor(logging.INFO):
+            elapsed = time.perf_counter() - start_time
+            logger.info(
+                f"Translation completed in {elapsed:.2f}s: "
+                f"'{text[:50]}...' ({len(text)} chars) -> "
+                f"'{translated_text[:50]}...' ({len(translated_text)} chars)"
+            )
 
         return source_lang, translated_text
 
@@ -346,42 +539,55 @@ class TranslationService(QObject):
         Returns:
             True if task was cancelled, False if not found
         """
-        if task_id in self.active_tasks:
-            self.active_tasks[task_id].cancel()
+        if self._active is not None and task_id == self._active_id:
+            self._active.cancel()
             logger.info(f"Task {task_id} cancelled")
             return True
         return False
 
     def cancel_all_tasks(self) -> None:
         """Cancel all active tasks."""
-        if self.active_tasks:
-            logger.info(f"Cancelling {len(self.active_tasks)} active task(s)")
-            for worker in self.active_tasks.values():
-                worker.cancel()
+        if self._active is not None:
+            logger.info(f"Cancelling active task: {self._active_id}")
+            self._active.cancel()
 
-        # Cancel all timeout timers
-        for task_id in list(self.timeout_timers.keys()):
-            self._cancel_timeout(task_id)
+        # Cancel all timeouts
+        self._deadlines.clear()
+        self._timeout_tick.stop()
 
-        # Clear retry states
+        # Clear retry states and scheduled retries
         self.retry_states.clear()
+        self._retry_heap.clear()
+        self._retry_timer.stop()
 
     def shutdown(self) -> None:
         """Clean shutdown - cancel all tasks and wait for completion."""
         logger.info("Shutting down translation service...")
         self.cancel_all_tasks()
-        self.thread_pool.waitForDone(5000)  # Wait up to 5 seconds
+        self.debounce_timer.stop()
+        self.pending_task = None
+        self._work_queue.put(None)
+        self._generator_thread.join(5.0)  # Wait up to 5 seconds
+        # Workers refer back to this service, so drop them, along with the
+        # queued worker events that could start new ones; left in place, the
+        # service is freed by whichever thread next runs the garbage collector
+        if not self._generator_thread.is_alive():
+            QCoreApplication.removePostedEvents(self)
+        self._active = None
+        self._active_id = None
+        self._worker_pool.clear()
+        self._detect_executor.shutdown(wait=False, cancel_futures=True)
         logger.info("Translation service shutdown complete")
 
     # Signal handlers
 
     def _on_worker_started(self, task_id: str) -> None:
-        """Handle worker started signal."""
+        """Handle worker started callback (runs in the generator thread)."""
         logger.debug(f"Worker started: {task_id}")
         self.translationStarted.emit(task_id)
 
     def _on_worker_progress(self, task_id: str, percentage: int, message: str) -> None:
-        """Handle worker progress signal."""
+        """Handle worker progress callback (runs in the generator thread)."""
         self.translationProgress.emit(task_id, percentage, message)
 
     def _on_worker_result(self, task_id: str, result: tuple) -> None:
@@ -397,22 +603,26 @@ class TranslationService(QObject):
         self.translationComplete.emit(task_id, source_lang, translated_text)
 
     def _on_worker_error_with_retry(
-        self, task_id: str, error_message: str, traceback_str: str
+        self, task_id: str, payload: TranslationError | ExcInfo
     ) -> None:
         """Handle worker error with retry logic."""
-        logger.error(f"Worker error for {task_id}: {error_message}")
-        logger.debug(f"Traceback:\n{traceback_str}")
+        # Normally already classified in the worker thread
+        error = _as_translation_error(payload)
+        logger.error(f"Worker error for {task_id}: {error.message}")
+        _log_traceback(error.original_exception)
 
         # Cancel timeout timer
         self._cancel_timeout(task_id)
 
-        # Classify the error
-        error = ErrorClassifier.classify_from_message(error_message, traceback_str)
-
         # Handle with retry logic
         self._handle_error_with_retry(task_id, error)
 
-    def _on_worker_finished(self, task_id: str) -> None:
-        """Handle worker finished signal."""
-        logger.debug(f"Worker finished: {task_id}")
-        self.active_tasks.pop(task_id, None)
+    def _on_worker_retired(self, worker: Worker) -> None:
+        """Handle the generator thread finishing a worker."""
+        logger.debug(f"Worker finished: {worker.task_id}")
+        # A timed-out attempt can finish after its retry took the task ID;
+        # only the worker that is still tracked is done and safe to reuse
+        if worker is self._active:
+            self._active = None
+            self._active_id = None
+            self._release_worker(worker)
@@ -1,11 +1,14 @@
 """Update checker for checking new versions on GitHub Releases."""
 
+import base64
 import json
 from dataclasses import dataclass
 from enum import Enum
+from http.client import HTTPConnection, HTTPException, HTTPResponse, HTTPSConnection
 from typing import Any
 from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from urllib.parse import unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
 
 from core.config import config
 from utils.logger import get_logger
@@ -24,7 +27,7 @@ class UpdateStatus(Enum):
     RATE_LIMITED = "rate_limited"
 
 
-@dataclass
+@dataclass(slots=True)
 class ReleaseInfo:
     """Information about a GitHub release."""
 
@@ -54,7 +57,7 @@ class ReleaseInfo:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateCheckResult:
     """Result of an update check."""
 
@@ -78,6 +81,9 @@ class UpdateChecker:
     """Checks for updates using GitHub Releases API."""
 
     DEFAULT_TIMEOUT = 15  # seconds
+    # Redirects followed per check, as in urllib's HTTPRedirectHandler
+    MAX_REDIRECTS = 10
+    _REDIRECT_CODES = frozenset({301, 302, 303, 307, 308})
 
     def __init__(
         self,
@@ -97,6 +103,20 @@ class UpdateChecker:
         self.api_url = api_url or config.github_api_url
         self.timeout = timeout
 
+        # One keep-alive connection is reused across checks, so repeat checks
+        # skip the TCP and TLS handshakes; it is opened on the first request.
+        # It goes through the system/environment proxy, like urlopen() would.
+        self._url = f"{self.api_url.rstrip('/')}/releases/latest"
+        self._conn: HTTPConnection | None = None
+        self._conn_origin: tuple[str, str] | None = None  # (scheme, netloc) served
+        # Plain HTTP through a proxy sends absolute URLs and proxy credentials
+        # with each request; HTTPS tunnels through it with CONNECT instead
+        self._conn_proxy_headers: dict[str, str] | None = None
+
+        # Last release response and its ETag, for conditional requests
+        self._etag: str | None = None
+        self._cached_release: dict[str, Any] | None = None
+
     def check(self) -> UpdateCheckResult:
         """
         Check for updates.
@@ -179,6 +199,9 @@ class UpdateChecker:
         """
         Fetch the latest release from GitHub API.
 
+        Repeat requests send the previous ETag; an unchanged release comes
+        back as an empty 304 response and the cached data is reused.
+
         Returns:
             Dictionary containing release data
 
@@ -186,15 +209,165 @@ class UpdateChecker:
             HTTPError: On HTTP errors
             URLError: On network errors
         """
-        url = f"{self.api_url}/releases/latest"
+        url = self._url
         headers = {
             "User-Agent": f"{config.app_name}/{config.version}",
             "Accept": "application/vnd.github.v3+json",
         }
+        if self._etag and self._cached_release is not None:
+            headers["If-None-Match"] = self._etag
 
-        request = Request(url, headers=headers)
         logger.debug(f"Fetching: {url}")
 
-        with urlopen(request, timeout=self.timeout) as response:
-            data: dict[str, Any] = json.loads(response.read().decode("utf-8"))
-            return data
+        url, response, body = self._request(headers)
+        if response.status == 304 and self._cached_release is not None:
+            logger.debug("Latest release not modified")
+            return self._cached_release
+        if response.status != 200:
+            raise HTTPError(url, response.status, response.reason, response.headers, None)
+
+        # json detects the UTF-8 encoding itself, so no decoded copy is made
+        data: dict[str, Any] = json.loads(body)
+        self._etag = response.headers.get("ETag")
+        self._cached_release = data
+        return data
+
+    def _request(self, headers: dict[str, str]) -> tuple[str, HTTPResponse, bytes]:
+        """
+        Send the release request, following redirects.
+
+        Redirects (e.g. after a repository rename) are followed like urlopen()
+        follows them; a redirect to another host moves the shared connection
+        there.
+
+        Args:
+            headers: Request headers
+
+        Returns:
+            Tuple of (final URL, response, body)
+
+        Raises:
+            HTTPError: On a redirect loop or a redirect to an unsupported URL
+            URLError: On network errors
+        """
+        url = self._url
+        for _ in range(self.MAX_REDIRECTS + 1):
+            response, body = self._send_with_retry(url, headers)
+            location = response.headers.get("Location")
+            if response.status not in self._REDIRECT_CODES or not location:
+                return url, response, body
+
+            new_url = urljoin(url, location)
+            if urlsplit(new_url).scheme not in ("http", "https"):
+                reason = f"Redirect to unsupported URL: {new_url}"
+                raise HTTPError(url, response.status, reason, response.headers, None)
+            logger.debug(f"Update check redirected: {url} -> {new_url}")
+            url = new_url
+
+        raise HTTPError(url, response.status, "Too many redirects", response.headers, None)
+
+    def _send_with_retry(self, url: str, headers: dict[str, str]) -> tuple[HTTPResponse, bytes]:
+        """
+        Send one GET request over the shared connection.
+
+        The server may drop a keep-alive connection while it sits idle between
+        checks, so a reused connection that was closed is retried once on a
+        fresh one.
+
+        Args:
+            url: URL to request
+            headers: Request headers
+
+        Returns:
+            Tuple of (response, body)
+
+        Raises:
+            URLError: On network errors
+        """
+        reused = self._conn is not None and self._conn_origin == self._origin(url)
+        try:
+            return self._send(url, headers)
+        except ConnectionError as e:
+            self._close_connection()
+            if not reused:
+                raise URLError(e) from e
+            logger.debug("Update check connection was closed, reconnecting")
+        except (HTTPException, OSError) as e:
+            self._close_connection()
+            raise URLError(e) from e
+
+        try:
+            return self._send(url, headers)
+        except (HTTPException, OSError) as e:
+            self._close_connection()
+            raise URLError(e) from e
+
+    @staticmethod
+    def _origin(url: str) -> tuple[str, str]:
+        """Get the (scheme, netloc) a URL's connection is made to."""
+        parts = urlsplit(url)
+        return parts.scheme, parts.netloc
+
+    def _send(self, url: str, headers: dict[str, str]) -> tuple[HTTPResponse, bytes]:
+        """Send one GET request, opening a connection to the URL's origin if needed."""
+        origin = self._origin(url)
+        if self._conn is None or self._conn_origin != origin:
+            self._close_connection()
+            self._conn = self._open_connection(*origin)
+            self._conn_origin = origin
+
+        parts = urlsplit(url)
+        if self._conn_proxy_headers is not None:
+            target = url
+            headers = {**headers, **self._conn_proxy_headers}
+        else:
+            target = parts.path or "/"
+            if parts.query:
+                target = f"{target}?{parts.query}"
+
+        self._conn.request("GET", target, headers=headers)
+        response = self._conn.getresponse()
+        # The body is always read to the end so the connection can be reused
+        return response, response.read()
+
+    def _open_connection(self, scheme: str, netloc: str) -> HTTPConnection:
+        """
+        Open a connection to an origin, through the proxy configured for it.
+
+        Proxies come from urllib's getproxies(): the *_proxy environment
+        variables, or the system settings on macOS and Windows. Hosts the
+        proxy is bypassed for (no_proxy, system exceptions) connect directly.
+        """
+        self._conn_proxy_headers = None
+        connection_class = HTTPSConnection if scheme == "https" else HTTPConnection
+
+        proxy = getproxies().get(scheme)
+        host = urlsplit(f"//{netloc}").hostname or netloc
+        if not proxy or proxy_bypass(host):
+            return connection_class(netloc, timeout=self.timeout)
+
+        proxy_parts = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+        proxy_headers = {}
+        if proxy_parts.username is not None:
+            credentials = f"{unquote(proxy_parts.username)}:{unquote(proxy_parts.password or '')}"
+            token = base64.b64encode(credentials.encode()).decode("ascii")
+            proxy_headers["Proxy-Authorization"] = f"Basic {token}"
+
+        proxy_host = proxy_parts.hostname
+        proxy_port = proxy_parts.port or (443 if proxy_parts.scheme == "https" else 80)
+        logger.debug(f"Update check using proxy {proxy_host}:{proxy_port}")
+        if scheme == "https":
+            # TLS to the API host runs inside a CONNECT tunnel through the proxy
+            conn = HTTPSConnection(proxy_host, proxy_port, timeout=self.timeout)
+            conn.set_tunnel(netloc, headers=proxy_headers)
+            return conn
+
+        self._conn_proxy_headers = proxy_headers
+        return HTTPConnection(proxy_host, proxy_port, timeout=self.timeout)
+
+    def _close_connection(self) -> None:
+        """Close the shared connection so the next request opens a new one."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+            self._conn_origin = None
@@ -2,6 +2,7 @@
 
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # PyInstaller 호환성: 실행 파일 경로 설정
 if getattr(sys, 'frozen', False):
@@ -19,20 +20,19 @@ else:
     if str(_src_path) not in sys.path:
         sys.path.insert(0, str(_src_path))
 
-from PySide6.QtCore import QObject, QThread, Signal
+from PySide6.QtCore import QEventLoop, QObject, QThread, Signal
 from PySide6.QtWidgets import QApplication, QMessageBox
 
+# Only what the splash screen needs is imported here; the rest of the app
+# (and torch/transformers behind ModelManager) is imported once it is painted
 from core.config import config
-from core.history_store import HistoryStore
-from core.language_detector import LanguageDetector
-from core.model_manager import ModelManager
-from core.preferences import UserPreferences
-from core.translator import TranslationService
-from ui.main_window import MainWindow
 from ui.splash_screen import SplashScreen
 from ui.styles import ThemeManager
 from utils.logger import get_logger, setup_logger
 
+if TYPE_CHECKING:
+    from core.model_manager import ModelManager
+
 # Setup logging
 setup_logger(level="INFO")
 logger = get_logger(__name__)
@@ -44,7 +44,7 @@ class ModelLoader(QObject):
     progress = Signal(int, str)
     finished = Signal(bool, str)  # success, message
 
-    def __init__(self, model_manager: ModelManager):
+    def __init__(self, model_manager: "ModelManager"):
         super().__init__()
         self.model_manager = model_manager
 
@@ -95,6 +95,13 @@ def main() -> int:
     splash.show_progress(0, "애플리케이션 초기화 중...")
     app.processEvents()
 
+    from core.history_store import HistoryStore
+    from core.language_detector import LanguageDetector
+    from core.model_manager import ModelManager
+    from core.preferences import UserPreferences
+    from core.translator import TranslationService
+    from ui.main_window import MainWindow
+
     # Track resources for cleanup
     model_manager = None
     translation_service = None
@@ -109,6 +116,8 @@ def main() -> int:
         history_store = HistoryStore(preferences._settings)
         history_store.load()
         logger.info(f"History loaded: {history_store.count} entries")
+        app.aboutToQuit.connect(history_store.flush)
+        app.aboutToQuit.connect(preferences.sync)
 
         splash.show_progress(10, "언어 감지기 초기화 중...")
         language_detector = LanguageDetector()
@@ -116,7 +125,8 @@ def main() -> int:
         splash.show_progress(15, "모델 관리자 초기화 중...")
         model_manager = ModelManager()
 
-        # Load model in background (this will take time)
+        # Load model in background; the splash keeps painting because the
+        # GUI thread runs an event loop until the loader finishes
         splash.show_progress(20, "번역 모델 로딩 중 (시간이 걸릴 수 있습니다)...")
 
         # Create model loader
@@ -124,14 +134,11 @@ def main() -> int:
         thread = QThread()
         loader.moveToThread(thread)
 
-        # Connect signals
-        def update_progress(p: int, m: str) -> None:
-            splash.show_progress(p, m)
-            app.processEvents()  # Process events after each update
-
-        loader.progress.connect(update_progress)
+        # Progress arrives as queued signals, painted by the wait loop below
+        loader.progress.connect(splash.show_progress)
 
         model_loaded = [False, ""]  # [success, message]
+        wait_loop = QEventLoop()
 
         def on_model_loaded(success: bool, message: str) -> None:
             model_loaded[0] = success
@@ -139,6 +146,7 @@ def main() -> int:
             thread.quit()
 
         loader.finished.connect(on_model_loaded)
+        thread.finished.connect(wait_loop.quit)
         thread.started.connect(loader.run)
 
         # Start loading
@@ -146,11 +154,10 @@ def main() -> int:
 
         # Wait for model to load (with event processing)
         logger.info("Waiting for model loading thread to finish...")
-        while thread.isRunning():
-            app.processEvents()
-            thread.wait(50)  # Shorter wait for more responsive UI
+        wait_loop.exec()
+        thread.wait()
 
-        logger.info(f"Thread finished. Model loaded: {model_loaded}")
+        logger.info(f"Thread finished. Model loaded: {model_loaded[0]}")
 
         # Check if loading succeeded
         if not model_loaded[0]:
@@ -173,12 +180,14 @@ def main() -> int:
 
         # Initialize translation service
         splash.show_progress(95, "번역 서비스 초기화 중...")
+        app.processEvents()
         logger.info("Creating TranslationService...")
         translation_service = TranslationService(model_manager, language_detector)
         logger.info("TranslationService created")
 
         # Create main window
         splash.show_progress(98, "메인 윈도우 생성 중...")
+        app.processEvents()
         logger.info("Creating MainWindow...")
         window = MainWindow(translation_service, preferences, history_store, theme_manager)
         logger.info("MainWindow created")
@@ -42,6 +42,7 @@ class AboutDialog(QDialog):
 
         # App icon placeholder (if available)
         icon_label = QLabel()
+        icon_label.setObjectName("aboutIcon")
         icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         # Try to load app icon, use text fallback if not found
         try:
@@ -54,41 +55,39 @@ class AboutDialog(QDialog):
                 icon_label.setPixmap(pixmap)
             else:
                 icon_label.setText("🌐")
-                icon_label.setStyleSheet("font-size: 48px;")
         except Exception:
             icon_label.setText("🌐")
-            icon_label.setStyleSheet("font-size: 48px;")
         layout.addWidget(icon_label)
 
         # App name
         name_label = QLabel(config.app_name)
+        name_label.setObjectName("aboutName")
         name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        name_label.setStyleSheet("font-size: 24px; font-weight: bold;")
         layout.addWidget(name_label)
 
         # Version
         version_label = QLabel(f"Version {config.version}")
+        version_label.setObjectName("aboutVersion")
         version_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        version_label.setStyleSheet("font-size: 14px; color: #666666;")
         layout.addWidget(version_label)
 
         # Copyright
         copyright_label = QLabel(f"© {config.copyright_year} {config.organization}")
+        copyright_label.setObjectName("aboutCopyright")
         copyright_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        copyright_label.setStyleSheet("font-size: 12px; color: #888888;")
         layout.addWidget(copyright_label)
 
         # License
         license_label = QLabel(f"Licensed under {config.license_type}")
+        license_label.setObjectName("aboutLicense")
         license_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        license_label.setStyleSheet("font-size: 12px; color: #888888;")
         layout.addWidget(license_label)
 
         # GitHub link
         self._github_link = QLabel(f'<a href="{config.github_url}">GitHub Repository</a>')
         self._github_link.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._github_link.setObjectName("aboutLink")
         self._github_link.setOpenExternalLinks(True)
-        self._github_link.setStyleSheet("font-size: 12px;")
         layout.addWidget(self._github_link)
 
         layout.addStretch()
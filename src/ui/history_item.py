@@ -1,26 +1,92 @@
-"""History item widget for displaying individual translation history entries.
+"""History item delegate for painting individual translation history entries.
 
-This module provides the widget for rendering a single history entry with
-preview text, language info, timestamp, and action buttons.
+This module provides the item delegate that renders a single history entry
+with preview text, language info, timestamp, and action buttons.
 """
 
 
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtWidgets import (
-    QFrame,
-    QHBoxLayout,
-    QLabel,
-    QPushButton,
-    QSizePolicy,
-    QVBoxLayout,
-    QWidget,
+from dataclasses import dataclass
+
+from PySide6.QtCore import QEvent, QModelIndex, QObject, QRect, QSize, Qt, Signal
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QMouseEvent, QPainter, QPalette
+from PySide6.QtWidgets import QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+from ui.history_model import HistoryListModel
+
+# Card geometry, matching the layout the item widgets used to have
+_ITEM_SPACING = 8  # Gap below each card
+_PADDING_X = 12
+_PADDING_Y = 8
+_COLUMN_SPACING = 8  # Between the text column and the buttons
+_LINE_SPACING = 4  # Between the preview and the meta line
+_BUTTON_WIDTH = 50
+_BUTTON_HEIGHT = 24
+_BUTTON_SPACING = 4
+_META_SPACING = 8  # Between the language pair and the timestamp
+_SMALL_FONT_PX = 11
+_CARD_RADIUS = 8
+_BUTTON_RADIUS = 4
+
+# Cached preview heights, enough for every entry at a few widths. The cache
+# is dropped when full (e.g. after a long splitter drag).
+_MAX_CACHED_HEIGHTS = 512
+
+_COPY_TEXT = "복사"
+_DELETE_TEXT = "삭제"
+
+
+@dataclass(frozen=True, slots=True)
+class _ItemColors:
+    """Colors for one theme of the history item card."""
+
+    background: QColor
+    border: QColor
+    hover_background: QColor
+    hover_border: QColor
+    text: QColor
+    meta_text: QColor
+    button_background: QColor
+    button_border: QColor
+    delete: QColor
+
+
+_DARK_COLORS = _ItemColors(
+    background=QColor("#252525"),
+    border=QColor("#3c3c3c"),
+    hover_background=QColor("#2d2d2d"),
+    hover_border=QColor("#007aff"),
+    text=QColor("#dcdcdc"),
+    meta_text=QColor("#888888"),
+    button_background=QColor("#3c3c3c"),
+    button_border=QColor("#4c4c4c"),
+    delete=QColor("#ff6b6b"),
+)
+
+_LIGHT_COLORS = _ItemColors(
+    background=QColor("#ffffff"),
+    border=QColor("#e0e0e0"),
+    hover_background=QColor("#f8f8f8"),
+    hover_border=QColor("#007aff"),
+    text=QColor("#1e1e1e"),
+    meta_text=QColor("#888888"),
+    button_background=QColor("#f0f0f0"),
+    button_border=QColor("#d0d0d0"),
+    delete=QColor("#dc3545"),
 )
 
-from core.history_store import HistoryEntry
 
+def _small_font(font: QFont) -> QFont:
+    """Get the font used for the meta line and buttons."""
+    small = QFont(font)
+    small.setPixelSize(_SMALL_FONT_PX)
+    return small
 
-class HistoryItemWidget(QFrame):
-    """Widget for displaying a single history entry.
+
+class HistoryItemDelegate(QStyledItemDelegate):
+    """Delegate that paints a history entry as a card with action buttons.
+
+    Only the rows in view are painted, and clicks are hit-tested against the
+    painted button rects instead of going through per-row widgets.
 
     Signals:
         clicked: Emitted when the item is clicked (entry_id)
@@ -32,108 +98,160 @@ class HistoryItemWidget(QFrame):
     deleteClicked = Signal(str)  # entry_id
     copyClicked = Signal(str)  # entry_id
 
-    def __init__(self, entry: HistoryEntry, parent: QWidget | None = None):
-        """Initialize the history item widget.
+    def __init__(self, parent: QObject | None = None):
+        """Initialize the delegate.
 
         Args:
-            entry: The history entry to display
-            parent: Optional parent widget
+            parent: Optional parent QObject
         """
         super().__init__(parent)
-        self._entry = entry
-        self._setup_ui()
-        self._apply_styles()
+        # (font key, width, text) -> wrapped preview height
+        self._preview_heights: dict[tuple[str, int, str], int] = {}
 
-    @property
-    def entry(self) -> HistoryEntry:
-        """Get the associated history entry."""
-        return self._entry
+    @staticmethod
+    def _card_rect(rect: QRect) -> QRect:
+        """Get the card area of an item rect, without the gap below it."""
+        return rect.adjusted(0, 0, 0, -_ITEM_SPACING)
 
-    @property
-    def entry_id(self) -> str:
-        """Get the entry ID."""
-        return self._entry.id
+    @staticmethod
+    def _button_rects(card: QRect) -> tuple[QRect, QRect]:
+        """Get the (copy, delete) button rects inside a card."""
+        left = card.right() + 1 - _PADDING_X - _BUTTON_WIDTH
+        top = card.top() + _PADDING_Y
+        copy_rect = QRect(left, top, _BUTTON_WIDTH, _BUTTON_HEIGHT)
+        delete_rect = copy_rect.translated(0, _BUTTON_HEIGHT + _BUTTON_SPACING)
+        return copy_rect, delete_rect
 
-    def _setup_ui(self) -> None:
-        """Set up the widget UI."""
-        self.setFrameShape(QFrame.Shape.StyledPanel)
-        self.setCursor(Qt.CursorShape.PointingHandCursor)
+    @staticmethod
+    def _text_width(card_width: int) -> int:
+        """Get the width of the text column for a card width."""
+        return max(card_width - 2 * _PADDING_X - _BUTTON_WIDTH - _COLUMN_SPACING, 1)
 
-        main_layout = QHBoxLayout(self)
-        main_layout.setContentsMargins(12, 8, 12, 8)
-        main_layout.setSpacing(8)
+    def _preview_height(self, font: QFont, width: int, text: str) -> int:
+        """Get the height of the word-wrapped preview text.
 
-        # Content section (left)
-        content_layout = QVBoxLayout()
-        content_layout.setSpacing(4)
+        Heights are cached: the view asks for every row's size hint on each
+        layout, and each row is painted again on hover.
+        """
+        key = (font.key(), width, text)
+        height = self._preview_heights.get(key)
+        if height is None:
+            if len(self._preview_heights) >= _MAX_CACHED_HEIGHTS:
+                self._preview_heights.clear()
+            height = QFontMetrics(font).boundingRect(
+                QRect(0, 0, width, 0),
+                Qt.TextFlag.TextWordWrap,
+                text,
+            ).height()
+            self._preview_heights[key] = height
+        return height
 
-        # Preview text
-        self._preview_label = QLabel(self._entry.preview())
-        self._preview_label.setWordWrap(True)
-        self._preview_label.setSizePolicy(
-            QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        """Get the item size: the wrapped preview decides the height."""
+        width = option.rect.width()
+        if option.widget is not None:
+            width = option.widget.viewport().width()
+
+        preview = index.data(Qt.ItemDataRole.DisplayRole) or ""
+        text_height = (
+            self._preview_height(option.font, self._text_width(width), preview)
+            + _LINE_SPACING
+            + QFontMetrics(_small_font(option.font)).height()
         )
-        content_layout.addWidget(self._preview_label)
+        buttons_height = 2 * _BUTTON_HEIGHT + _BUTTON_SPACING
+        height = 2 * _PADDING_Y + max(text_height, buttons_height) + _ITEM_SPACING
+        return QSize(width, height)
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        """Paint the history entry card."""
+        palette = option.palette
+        is_dark = palette.color(QPalette.ColorRole.Window).lightness() < 128
+        colors = _DARK_COLORS if is_dark else _LIGHT_COLORS
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # Card
+        card = self._card_rect(option.rect)
+        painter.setPen(colors.hover_border if hovered else colors.border)
+        painter.setBrush(colors.hover_background if hovered else colors.background)
+        painter.drawRoundedRect(card.adjusted(0, 0, -1, -1), _CARD_RADIUS, _CARD_RADIUS)
+
+        # Preview text
+        text_left = card.left() + _PADDING_X
+        text_width = self._text_width(card.width())
+        preview = index.data(Qt.ItemDataRole.DisplayRole) or ""
+        preview_height = self._preview_height(option.font, text_width, preview)
+        preview_rect = QRect(text_left, card.top() + _PADDING_Y, text_width, preview_height)
+        painter.setFont(option.font)
+        painter.setPen(colors.text)
+        painter.drawText(preview_rect, Qt.TextFlag.TextWordWrap, preview)
 
         # Meta info (language and time)
-        meta_layout = QHBoxLayout()
-        meta_layout.setSpacing(8)
-
-        # Language pair
-        lang_text = f"{self._entry.source_lang} → {self._entry.target_lang}"
-        self._lang_label = QLabel(lang_text)
-        self._lang_label.setObjectName("langLabel")
-        meta_layout.addWidget(self._lang_label)
-
-        # Timestamp
-        time_text = self._entry.created_at.strftime("%Y-%m-%d %H:%M")
-        self._time_label = QLabel(time_text)
-        self._time_label.setObjectName("timeLabel")
-        meta_layout.addWidget(self._time_label)
-
-        meta_layout.addStretch()
-        content_layout.addLayout(meta_layout)
-
-        main_layout.addLayout(content_layout, 1)
-
-        # Action buttons (right)
-        button_layout = QVBoxLayout()
-        button_layout.setSpacing(4)
-
-        # Copy button
-        self._copy_btn = QPushButton("복사")
-        self._copy_btn.setObjectName("copyButton")
-        self._copy_btn.setFixedWidth(50)
-        self._copy_btn.clicked.connect(self._on_copy_clicked)
-        button_layout.addWidget(self._copy_btn)
-
-        # Delete button
-        self._delete_btn = QPushButton("삭제")
-        self._delete_btn.setObjectName("deleteButton")
-        self._delete_btn.setFixedWidth(50)
-        self._delete_btn.clicked.connect(self._on_delete_clicked)
-        button_layout.addWidget(self._delete_btn)
-
-        button_layout.addStretch()
-        main_layout.addLayout(button_layout)
-
-    def _apply_styles(self) -> None:
-        """Apply styles to the widget."""
-        # Note: Styles are applied via ThemeManager in styles.py
-        # Only set minimal frame-specific styles here
-        pass
-
-    def mousePressEvent(self, event: any) -> None:
-        """Handle mouse press to emit clicked signal."""
-        # Only emit if not clicking on a button
-        if not self._copy_btn.underMouse() and not self._delete_btn.underMouse():
-            self.clicked.emit(self._entry.id)
-        super().mousePressEvent(event)
-
-    def _on_copy_clicked(self) -> None:
-        """Handle copy button click."""
-        self.copyClicked.emit(self._entry.id)
-
-    def _on_delete_clicked(self) -> None:
-        """Handle delete button click."""
-        self.deleteClicked.emit(self._entry.id)
+        small_font = _small_font(option.font)
+        small_metrics = QFontMetrics(small_font)
+        painter.setFont(small_font)
+        painter.setPen(colors.meta_text)
+        meta_top = preview_rect.bottom() + 1 + _LINE_SPACING
+        lang_text = index.data(HistoryListModel.LanguagesRole) or ""
+        lang_width = small_metrics.horizontalAdvance(lang_text)
+        painter.drawText(
+            QRect(text_left, meta_top, lang_width, small_metrics.height()),
+            Qt.AlignmentFlag.AlignLeft,
+            lang_text,
+        )
+        time_left = text_left + lang_width + _META_SPACING
+        time_width = max(text_width - lang_width - _META_SPACING, 0)
+        painter.drawText(
+            QRect(time_left, meta_top, time_width, small_metrics.height()),
+            Qt.AlignmentFlag.AlignLeft,
+            index.data(HistoryListModel.TimeRole) or "",
+        )
+
+        # Action buttons
+        copy_rect, delete_rect = self._button_rects(card)
+        painter.setPen(colors.button_border)
+        painter.setBrush(colors.button_background)
+        painter.drawRoundedRect(copy_rect.adjusted(0, 0, -1, -1), _BUTTON_RADIUS, _BUTTON_RADIUS)
+        painter.setPen(colors.text)
+        painter.drawText(copy_rect, Qt.AlignmentFlag.AlignCenter, _COPY_TEXT)
+
+        painter.setPen(colors.delete)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRoundedRect(
+            delete_rect.adjusted(0, 0, -1, -1), _BUTTON_RADIUS, _BUTTON_RADIUS
+        )
+        painter.drawText(delete_rect, Qt.AlignmentFlag.AlignCenter, _DELETE_TEXT)
+
+        painter.restore()
+
+    def editorEvent(
+        self,
+        event: QEvent,
+        model: HistoryListModel,
+        option: QStyleOptionViewItem,
+        index: QModelIndex,
+    ) -> bool:
+        """Handle clicks on the card and its buttons."""
+        if (
+            event.type() != QEvent.Type.MouseButtonRelease
+            or not isinstance(event, QMouseEvent)
+            or event.button() != Qt.MouseButton.LeftButton
+        ):
+            return super().editorEvent(event, model, option, index)
+
+        card = self._card_rect(option.rect)
+        pos = event.position().toPoint()
+        if not card.contains(pos):
+            return False
+
+        entry_id = index.data(HistoryListModel.EntryRole).id
+        copy_rect, delete_rect = self._button_rects(card)
+        if copy_rect.contains(pos):
+            self.copyClicked.emit(entry_id)
+        elif delete_rect.contains(pos):
+            self.deleteClicked.emit(entry_id)
+        else:
+            self.clicked.emit(entry_id)
+        return True
@@ -0,0 +1,123 @@
+"""List model for the translation history panel.
+
+This module provides the Qt item model that exposes the history entries
+shown in the panel to a QListView, so only visible rows are painted.
+"""
+
+
+from typing import Any
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, QPersistentModelIndex, Qt
+
+from core.history_store import HistoryEntry
+
+_Index = QModelIndex | QPersistentModelIndex
+
+
+class HistoryListModel(QAbstractListModel):
+    """Model of the history entries currently listed (newest first).
+
+    Roles:
+        Qt.DisplayRole: Source text preview
+        EntryRole: The HistoryEntry itself
+        LanguagesRole: Language pair label (e.g. "en → ko")
+        TimeRole: Creation time label
+    """
+
+    EntryRole = Qt.ItemDataRole.UserRole
+    LanguagesRole = Qt.ItemDataRole.UserRole + 1
+    TimeRole = Qt.ItemDataRole.UserRole + 2
+
+    def __init__(self, parent: QObject | None = None):
+        """Initialize an empty model.
+
+        Args:
+            parent: Optional parent QObject
+        """
+        super().__init__(parent)
+        self._entries: list[HistoryEntry] = []
+
+    def rowCount(self, parent: _Index = QModelIndex()) -> int:
+        """Get the number of listed entries."""
+        if parent.isValid():
+            return 0
+        return len(self._entries)
+
+    def data(self, index: _Index, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        """Get the data for a row.
+
+        Args:
+            index: Row index
+            role: Data role (see class docstring)
+
+        Returns:
+            Data for the role, or None if the index or role is not handled
+        """
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return entry.preview()
+        if role == self.EntryRole:
+            return entry
+        if role == self.LanguagesRole:
+            return f"{entry.source_lang} → {entry.target_lang}"
+        if role == self.TimeRole:
+            return entry.formatted_time
+        return None
+
+    def entry(self, row: int) -> HistoryEntry:
+        """Get the entry listed at a row."""
+        return self._entries[row]
+
+    def set_entries(self, entries: list[HistoryEntry]) -> None:
+        """Replace all listed entries.
+
+        The model is not reset when the same entries are already listed (e.g.
+        a search keystroke that matches the same rows), so the view keeps its
+        layout and scroll position.
+
+        Args:
+            entries: Entries to list, newest first
+        """
+        if len(entries) == len(self._entries) and all(
+            new is old for new, old in zip(entries, self._entries)
+        ):
+            return
+
+        self.beginResetModel()
+        self._entries = entries
+        self.endResetModel()
+
+    def insert_entry(self, row: int, entry: HistoryEntry) -> None:
+        """Insert an entry at a row.
+
+        Args:
+            row: Row to insert at
+            entry: Entry to insert
+        """
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._entries.insert(row, entry)
+        self.endInsertRows()
+
+    def remove_row(self, row: int) -> None:
+        """Remove the entry at a row."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._entries[row]
+        self.endRemoveRows()
+
+    def remove_entry(self, entry_id: str) -> bool:
+        """Remove an entry by ID.
+
+        Args:
+            entry_id: The entry ID to remove
+
+        Returns:
+            True if the entry was listed and removed, False otherwise
+        """
+        for row, entry in enumerate(self._entries):
+            if entry.id == entry_id:
+                self.remove_row(row)
+                return True
+        return False
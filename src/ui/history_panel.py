@@ -6,21 +6,39 @@ translation history entries.
 
 
 from PySide6.QtCore import Qt, QTimer, Signal, Slot
+from PySide6.QtGui import QResizeEvent, QShowEvent
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QApplication,
+    QFrame,
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QListView,
     QMessageBox,
     QPushButton,
-    QScrollArea,
     QVBoxLayout,
     QWidget,
 )
 
 from core.config import config
 from core.history_store import HistoryEntry, HistoryStore
-from ui.history_item import HistoryItemWidget
+from ui.history_item import HistoryItemDelegate
+from ui.history_model import HistoryListModel
+
+
+class _HistoryListView(QListView):
+    """List view that re-lays out its rows when its width changes.
+
+    Row heights depend on how the preview text wraps, but QListView only
+    re-lays out a top-to-bottom list when its height changes.
+    """
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        """Schedule a relayout when the width changes."""
+        super().resizeEvent(event)
+        if event.size().width() != event.oldSize().width():
+            self.scheduleDelayedItemsLayout()
 
 
 class HistoryPanel(QWidget):
@@ -49,19 +67,23 @@ class HistoryPanel(QWidget):
         """
         super().__init__(parent)
         self._store = history_store
-        self._item_widgets: dict[str, HistoryItemWidget] = {}
+        self._model = HistoryListModel(self)
+        # The application owns the clipboard for its whole lifetime
+        self._clipboard = QApplication.clipboard()
         self._is_collapsed = False
         self._search_timer = QTimer(self)
         self._search_timer.setSingleShot(True)
         self._search_timer.setInterval(config.history.search_debounce_ms)
-        self._search_timer.timeout.connect(self._apply_filter)
+        self._search_timer.timeout.connect(self._refresh_list)
+
+        # The expanded content is built the first time it is shown, so a panel
+        # that starts collapsed or hidden costs no list setup at startup
+        self._expanded_content: QWidget | None = None
 
         self._setup_ui()
-        self._connect_signals()
-        self._refresh_list()
 
     def _setup_ui(self) -> None:
-        """Set up the panel UI."""
+        """Set up the panel skeleton: the layout and the collapsed bar."""
         self._expanded_width = 320
         self._collapsed_width = 36
 
@@ -94,6 +116,11 @@ class HistoryPanel(QWidget):
         self._collapsed_bar.hide()
         main_layout.addWidget(self._collapsed_bar)
 
+    def _build_expanded_content(self) -> None:
+        """Build the expanded panel and fill it from the history store."""
+        if self._expanded_content is not None:
+            return
+
         # Expanded content (main panel)
         self._expanded_content = QWidget()
         self._expanded_content.setObjectName("historyPanel")
@@ -140,38 +167,46 @@ class HistoryPanel(QWidget):
         self._search_input.setClearButtonEnabled(True)
         content_layout.addWidget(self._search_input)
 
-        # Scroll area for history items
-        self._scroll_area = QScrollArea()
-        self._scroll_area.setWidgetResizable(True)
-        self._scroll_area.setHorizontalScrollBarPolicy(
+        # List of history items; the delegate paints only the rows in view
+        self._list_view = _HistoryListView()
+        self._list_view.setObjectName("historyList")
+        self._list_view.setModel(self._model)
+        self._delegate = HistoryItemDelegate(self._list_view)
+        self._list_view.setItemDelegate(self._delegate)
+        self._list_view.setHorizontalScrollBarPolicy(
             Qt.ScrollBarPolicy.ScrollBarAlwaysOff
         )
-        self._scroll_area.setFrameShape(QScrollArea.Shape.NoFrame)
-
-        # Container for items
-        self._items_container = QWidget()
-        self._items_layout = QVBoxLayout(self._items_container)
-        self._items_layout.setContentsMargins(0, 0, 0, 0)
-        self._items_layout.setSpacing(8)
-        self._items_layout.addStretch()
-
-        self._scroll_area.setWidget(self._items_container)
-        content_layout.addWidget(self._scroll_area, 1)
+        self._list_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self._list_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self._list_view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self._list_view.setFrameShape(QFrame.Shape.NoFrame)
+        self._list_view.setMouseTracking(True)
+        self._list_view.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+        content_layout.addWidget(self._list_view, 1)
 
         # Empty state label
         self._empty_label = QLabel("번역 기록이 없습니다")
+        self._empty_label.setObjectName("historyEmptyLabel")
         self._empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._empty_label.setStyleSheet("color: palette(placeholderText);")
         content_layout.addWidget(self._empty_label)
 
         # No results label (for search)
         self._no_results_label = QLabel("검색 결과가 없습니다")
+        self._no_results_label.setObjectName("historyNoResultsLabel")
         self._no_results_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._no_results_label.setStyleSheet("color: palette(placeholderText);")
         self._no_results_label.hide()
         content_layout.addWidget(self._no_results_label)
 
-        main_layout.addWidget(self._expanded_content)
+        self.layout().addWidget(self._expanded_content)
+
+        self._connect_signals()
+        self._refresh_list()
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """Build the expanded content when the panel is first shown expanded."""
+        if not self._is_collapsed:
+            self._build_expanded_content()
+        super().showEvent(event)
 
     def _connect_signals(self) -> None:
         """Connect signals to slots."""
@@ -184,56 +219,25 @@ class HistoryPanel(QWidget):
         # UI signals
         self._search_input.textChanged.connect(self._on_search_changed)
         self._clear_all_btn.clicked.connect(self._on_clear_all_clicked)
+        self._delegate.clicked.connect(self._on_item_clicked)
+        self._delegate.deleteClicked.connect(self._on_item_delete_clicked)
+        self._delegate.copyClicked.connect(self._on_item_copy_clicked)
 
+    @Slot()
     def _refresh_list(self) -> None:
-        """Refresh the list from the history store."""
-        # Clear existing items
-        for widget in self._item_widgets.values():
-            self._items_layout.removeWidget(widget)
-            widget.deleteLater()
-        self._item_widgets.clear()
-
-        # Add items from store
-        for entry in self._store.entries:
-            self._add_item_widget(entry)
-
+        """Refresh the list from the history store, applying the search filter."""
+        self._model.set_entries(self._store.search(self._search_input.text()))
         self._update_empty_state()
 
-    def _add_item_widget(self, entry: HistoryEntry) -> None:
-        """Add a widget for the given entry.
-
-        Args:
-            entry: The history entry to add
-        """
-        widget = HistoryItemWidget(entry)
-        widget.clicked.connect(self._on_item_clicked)
-        widget.deleteClicked.connect(self._on_item_delete_clicked)
-        widget.copyClicked.connect(self._on_item_copy_clicked)
-
-        # Insert at the beginning (after existing items, before stretch)
-        insert_index = self._items_layout.count() - 1  # Before the stretch
-        self._items_layout.insertWidget(insert_index, widget)
-        self._item_widgets[entry.id] = widget
-
-    def _remove_item_widget(self, entry_id: str) -> None:
-        """Remove the widget for the given entry ID.
-
-        Args:
-            entry_id: The entry ID to remove
-        """
-        if entry_id in self._item_widgets:
-            widget = self._item_widgets.pop(entry_id)
-            self._items_layout.removeWidget(widget)
-            widget.deleteLater()
-
     def _update_empty_state(self) -> None:
         """Update visibility of empty state elements."""
-        has_items = len(self._item_widgets) > 0
-        has_search = bool(self._search_input.text())
+        has_entries = self._store.count > 0
+        has_rows = self._model.rowCount() > 0
 
-        self._scroll_area.setVisible(has_items)
-        self._empty_label.setVisible(not has_items and not has_search)
-        self._no_results_label.hide()  # Handled by filter
+        self._list_view.setVisible(has_rows)
+        self._empty_label.setVisible(not has_entries)
+        # Entries exist but none are listed: the search filtered them all out
+        self._no_results_label.setVisible(has_entries and not has_rows)
 
     @Slot(object)
     def _on_entry_added(self, entry: HistoryEntry) -> None:
@@ -242,12 +246,16 @@ class HistoryPanel(QWidget):
         Args:
             entry: The new history entry
         """
-        self._add_item_widget(entry)
-        self._update_empty_state()
-
         # Re-apply filter if search is active
         if self._search_input.text():
-            self._apply_filter()
+            self._refresh_list()
+            return
+
+        self._model.insert_entry(0, entry)
+        # A full store drops its oldest entry without emitting entryRemoved
+        while self._model.rowCount() > self._store.count:
+            self._model.remove_row(self._model.rowCount() - 1)
+        self._update_empty_state()
 
     @Slot(str)
     def _on_entry_removed(self, entry_id: str) -> None:
@@ -256,13 +264,15 @@ class HistoryPanel(QWidget):
         Args:
             entry_id: The removed entry ID
         """
-        self._remove_item_widget(entry_id)
+        self._model.remove_entry(entry_id)
         self._update_empty_state()
 
     @Slot()
     def _on_entries_cleared(self) -> None:
         """Handle all entries cleared from store."""
-        self._refresh_list()
+        # Nothing is left to list, so the store needs no search
+        self._model.set_entries([])
+        self._update_empty_state()
 
     @Slot(str)
     def _on_item_clicked(self, entry_id: str) -> None:
@@ -293,9 +303,8 @@ class HistoryPanel(QWidget):
         """
         entry = self._store.get(entry_id)
         if entry:
-            clipboard = QApplication.clipboard()
-            if clipboard:
-                clipboard.setText(entry.translated_text)
+            if self._clipboard:
+                self._clipboard.setText(entry.translated_text)
             self.copyRequested.emit(entry.translated_text)
 
     @Slot()
@@ -324,36 +333,6 @@ class HistoryPanel(QWidget):
         """
         self._search_timer.start()
 
-    @Slot()
-    def _apply_filter(self) -> None:
-        """Apply search filter to the list."""
-        query = self._search_input.text().lower()
-
-        if not query:
-            # Show all items
-            for widget in self._item_widgets.values():
-                widget.show()
-            self._no_results_label.hide()
-            self._update_empty_state()
-            return
-
-        # Filter items
-        visible_count = 0
-        for _entry_id, widget in self._item_widgets.items():
-            entry = widget.entry
-            matches = (
-                query in entry.source_text.lower()
-                or query in entry.translated_text.lower()
-            )
-            widget.setVisible(matches)
-            if matches:
-                visible_count += 1
-
-        # Show no results message if needed
-        self._no_results_label.setVisible(visible_count == 0 and len(self._item_widgets) > 0)
-        self._scroll_area.setVisible(visible_count > 0)
-        self._empty_label.hide()
-
     # Collapse/Expand functionality
 
     @property
@@ -371,19 +350,21 @@ class HistoryPanel(QWidget):
             return
 
         self._is_collapsed = collapsed
+        if not collapsed:
+            self._build_expanded_content()
         self._collapsed_bar.setVisible(collapsed)
-        self._expanded_content.setVisible(not collapsed)
+        if self._expanded_content is not None:
+            self._expanded_content.setVisible(not collapsed)
 
         # Update size constraints
         if collapsed:
             self.setFixedWidth(self._collapsed_width)
         else:
-            self.setMinimumWidth(280)
+            # Raise the maximum first so the range never inverts, then start
+            # at the expanded width inside it
             self.setMaximumWidth(400)
-            self.setFixedWidth(self._expanded_width)
-            # Remove fixed width constraint after setting
             self.setMinimumWidth(280)
-            self.setMaximumWidth(400)
+            self.resize(self._expanded_width, self.height())
 
         self.collapsedChanged.emit(collapsed)
 
@@ -5,11 +5,19 @@ from PySide6.QtWidgets import QComboBox, QWidget
 from PySide6.QtCore import Signal, Qt, QPoint
 from PySide6.QtGui import QPainter, QColor, QPolygon
 
-from core.config import SUPPORTED_LANGUAGES, LanguageCode, Language
+from core.config import SORTED_LANGUAGES, LanguageCode
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# (display name, code) for each dropdown item, in display order
+_LANGUAGE_ITEMS: tuple[tuple[str, str], ...] = tuple(
+    (lang.display_name, lang.code.value) for lang in SORTED_LANGUAGES
+)
+
+# Language code -> display name, for get_language_display_name()
+_CODE_TO_DISPLAY: dict[str, str] = {code: name for name, code in _LANGUAGE_ITEMS}
+
 
 class LanguageSelector(QComboBox):
     """
@@ -49,19 +57,20 @@ class LanguageSelector(QComboBox):
         """Populate dropdown with supported languages."""
         self.clear()
 
+        items = list(_LANGUAGE_ITEMS)
         # Add auto-detect option if enabled
         if self.include_auto:
-            self.addItem(self.auto_label, LanguageCode.AUTO.value)
+            items.insert(0, (self.auto_label, LanguageCode.AUTO.value))
 
-        # Add all supported languages sorted by display name
-        sorted_languages = sorted(
-            SUPPORTED_LANGUAGES.values(),
-            key=lambda lang: lang.display_name
-        )
+        # All items go into the combo model in one insert, then get their codes
+        self.insertItems(0, [display_name for display_name, _ in items])
+        for index, (_, code) in enumerate(items):
+            self.setItemData(index, code)
 
-        for language in sorted_languages:
-            if language.code != LanguageCode.AUTO:
-                self.addItem(language.display_name, language.code.value)
+        # Code -> item index, so set_language() doesn't scan the combo box items
+        self._code_to_index: dict[str, int] = {
+            code: index for index, (_, code) in enumerate(items)
+        }
 
         logger.debug(f"Populated {self.count()} languages")
 
@@ -100,11 +109,11 @@ class LanguageSelector(QComboBox):
         Returns:
             True if language was found and selected, False otherwise
         """
-        for i in range(self.count()):
-            if self.itemData(i) == language_code:
-                self.setCurrentIndex(i)
-                logger.debug(f"Language set to: {language_code}")
-                return True
+        index = self._code_to_index.get(language_code)
+        if index is not None:
+            self.setCurrentIndex(index)
+            logger.debug(f"Language set to: {language_code}")
+            return True
 
         logger.warning(f"Language code not found: {language_code}")
         return False
@@ -122,11 +131,7 @@ class LanguageSelector(QComboBox):
         if language_code == LanguageCode.AUTO.value:
             return self.auto_label
 
-        for lang in SUPPORTED_LANGUAGES.values():
-            if lang.code.value == language_code:
-                return lang.display_name
-
-        return language_code
+        return _CODE_TO_DISPLAY.get(language_code, language_code)
 
     def paintEvent(self, event) -> None:
         """Custom paint to draw dropdown arrow."""
@@ -1,16 +1,27 @@
 """Main application window."""
 
-from PySide6.QtCore import QObject, QThread, Qt, QTimer, Signal, Slot
-from PySide6.QtGui import QAction, QKeySequence, QShortcut
+import re
+
+from PySide6.QtCore import (
+    QObject,
+    QRegularExpression,
+    QSignalBlocker,
+    QThread,
+    Qt,
+    QTimer,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import QAction, QKeySequence, QShortcut, QTextDocument
 from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QMainWindow,
     QMessageBox,
     QProgressBar,
+    QPlainTextEdit,
     QPushButton,
     QSplitter,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
@@ -26,18 +37,53 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Unicode-aware, so e.g. U+3000 counts as whitespace like it does for str.strip()
+_NON_WHITESPACE = QRegularExpression(
+    r"\S", QRegularExpression.PatternOption.UseUnicodePropertiesOption
+)
+# A character stored as a UTF-16 surrogate pair
+_ASTRAL_CHARACTER = QRegularExpression(r"[\x{10000}-\x{10FFFF}]")
+
+# Character counter styles: normal, 80%+ of the limit, over the limit
+_COUNTER_CSS_NORMAL = "color: #888888; font-size: 12px;"
+_COUNTER_CSS_WARNING = "color: #FF9500; font-size: 12px;"
+_COUNTER_CSS_OVER = "color: #FF3B30; font-size: 12px;"
+
+# Error type icons
+_ERROR_ICONS = {
+    ErrorType.NETWORK: "🌐",
+    ErrorType.MEMORY: "💾",
+    ErrorType.MODEL: "🤖",
+    ErrorType.TIMEOUT: "⏱️",
+    ErrorType.VALIDATION: "⚠️",
+    ErrorType.UNKNOWN: "❌",
+}
+
+# How long confirmation messages (copied, loaded, ...) stay in the status bar
+_STATUS_MESSAGE_MS = 2000
+
+# Keywords _get_user_friendly_error maps to friendly messages
+_ERROR_KEYWORDS_RE = re.compile(r"memory|oom|timeout|model|load|empty|too long", re.IGNORECASE)
+
 
 class UpdateCheckerWorker(QObject):
     """Worker for checking updates in a background thread."""
 
     finished = Signal(object)
 
+    def __init__(self, checker):
+        """
+        Initialize the worker.
+
+        Args:
+            checker: UpdateChecker to run; reusing one lets it send conditional requests
+        """
+        super().__init__()
+        self.checker = checker
+
     def run(self) -> None:
         """Run the update check."""
-        from core.update_checker import UpdateChecker
-
-        checker = UpdateChecker()
-        result = checker.check()
+        result = self.checker.check()
         self.finished.emit(result)
 
 
@@ -66,9 +112,18 @@ class MainWindow(QMainWindow):
         self.history_store = history_store
         self.theme_manager = theme_manager
         self.current_task_id = None
+        self._update_checker = None  # Created on the first update check
+        self._update_thread = None  # Thread of the update check in flight, if any
+        self._about_dialog = None  # Created the first time it is shown, then reused
         self.status_timer = QTimer(self)
         self.status_timer.setSingleShot(True)
-        self.status_timer.timeout.connect(lambda: self.status_label.clear())
+        self.status_timer.timeout.connect(self._clear_status)
+
+        # Coalesces bursts of edits (typing, pastes) into one input update
+        self._text_changed_timer = QTimer(self)
+        self._text_changed_timer.setSingleShot(True)
+        self._text_changed_timer.setInterval(config.performance.text_changed_delay_ms)
+        self._text_changed_timer.timeout.connect(self._on_text_changed)
 
         self._setup_ui()
         self._setup_history_panel()
@@ -137,17 +192,17 @@ class MainWindow(QMainWindow):
         source_label = QLabel("원문 (Source Text)")
         main_layout.addWidget(source_label)
 
-        self.source_text = QTextEdit()
+        self.source_text = QPlainTextEdit()
         self.source_text.setPlaceholderText("번역할 텍스트를 입력하세요...")
         self.source_text.setMinimumHeight(150)
-        self.source_text.setAcceptRichText(False)
         main_layout.addWidget(self.source_text)
 
         # Character counter
         char_counter_layout = QHBoxLayout()
         char_counter_layout.addStretch()
         self.char_counter_label = QLabel(f"0 / {config.performance.max_text_length:,}")
-        self.char_counter_label.setStyleSheet("color: #888888; font-size: 12px;")
+        self.char_counter_label.setStyleSheet(_COUNTER_CSS_NORMAL)
+        self._counter_css = _COUNTER_CSS_NORMAL
         char_counter_layout.addWidget(self.char_counter_label)
         main_layout.addLayout(char_counter_layout)
 
@@ -159,28 +214,7 @@ class MainWindow(QMainWindow):
         self.translate_button.setToolTip("Cmd+Enter 또는 Ctrl+Enter로 번역 실행")
         self.translate_button.setEnabled(False)
         self.translate_button.setMinimumWidth(140)
-        self.translate_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #007AFF;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0056CC;
-            }
-            QPushButton:pressed {
-                background-color: #004499;
-            }
-            QPushButton:disabled {
-                background-color: #CCCCCC;
-                color: #888888;
-            }
-        """
-        )
+        self.translate_button.setObjectName("translateButton")
         translate_button_layout.addWidget(self.translate_button)
 
         main_layout.addLayout(translate_button_layout)
@@ -200,7 +234,7 @@ class MainWindow(QMainWindow):
         result_label = QLabel("번역 결과 (Translation Result)")
         main_layout.addWidget(result_label)
 
-        self.result_text = QTextEdit()
+        self.result_text = QPlainTextEdit()
         self.result_text.setReadOnly(True)
         self.result_text.setPlaceholderText("번역 결과가 여기에 표시됩니다...")
         self.result_text.setMinimumHeight(150)
@@ -248,8 +282,8 @@ class MainWindow(QMainWindow):
 
     def _connect_signals(self) -> None:
         """Connect signals and slots."""
-        # Text input changes (for button state management)
-        self.source_text.textChanged.connect(self._on_text_changed)
+        # Text input changes (for button state management), debounced
+        self.source_text.textChanged.connect(self._text_changed_timer.start)
 
         # Translate button click
         self.translate_button.clicked.connect(self._on_translate_clicked)
@@ -319,9 +353,9 @@ class MainWindow(QMainWindow):
         help_menu = menubar.addMenu("&Help")
 
         # Check for Updates action
-        check_updates_action = QAction("Check for &Updates...", self)
-        check_updates_action.triggered.connect(self._on_check_for_updates)
-        help_menu.addAction(check_updates_action)
+        self._check_updates_action = QAction("Check for &Updates...", self)
+        self._check_updates_action.triggered.connect(self._on_check_for_updates)
+        help_menu.addAction(self._check_updates_action)
 
         help_menu.addSeparator()
         help_menu.addAction(about_action)
@@ -368,29 +402,97 @@ class MainWindow(QMainWindow):
 
     @Slot()
     def _on_text_changed(self) -> None:
-        """Handle source text changes - manages translate button state."""
-        text = self.source_text.toPlainText().strip()
+        """Handle source text changes - manages translate button state.
+
+        Runs once edits have paused for the text-changed delay; see
+        _apply_text_changed_now() for programmatic edits.
+        """
         max_length = config.performance.max_text_length
-        current_length = len(text)
+        current_length = self._source_text_length()
 
         # Update character counter
         self._update_char_counter(current_length, max_length)
 
-        if not text:
+        if not current_length:
             self.result_text.clear()
-            self.status_label.clear()
+            self._show_status("")
             self.copy_button.setEnabled(False)
             self.translate_button.setEnabled(False)
             return
 
         # Validate text length
         if current_length > max_length:
-            self.status_label.setText("⚠️ 텍스트가 너무 깁니다")
+            self._show_status("⚠️ 텍스트가 너무 깁니다")
             self.translate_button.setEnabled(False)
             return
 
         # Enable translate button for valid text
         self.translate_button.setEnabled(True)
+        self._show_status("")
+
+    def _source_text_length(self) -> int:
+        """
+        Get the length of the source text without surrounding whitespace.
+
+        Measured on the document, without copying its text: the first and
+        last non-whitespace characters are found from each end, which is
+        immediate for typical input. Document positions are UTF-16 code
+        units, so each character outside the BMP (emoji, rare CJK) is then
+        subtracted once to count code points, like len(text.strip()) and the
+        model's length check.
+
+        Returns:
+            Length of the stripped text, in code points
+        """
+        document = self.source_text.document()
+        if document.isEmpty():
+            return 0
+
+        first = document.find(_NON_WHITESPACE, 0)
+        if first.isNull():
+            return 0
+        last = document.find(
+            _NON_WHITESPACE,
+            document.characterCount() - 1,
+            QTextDocument.FindFlag.FindBackward,
+        )
+        length = last.selectionEnd() - first.selectionStart()
+
+        # Surrogate pairs are never whitespace, so all of them are in the span
+        astral = document.find(_ASTRAL_CHARACTER, first.selectionStart())
+        while not astral.isNull():
+            length -= 1
+            astral = document.find(_ASTRAL_CHARACTER, astral.selectionEnd())
+        return length
+
+    def _apply_text_changed_now(self) -> None:
+        """Update the input state for the current source text immediately.
+
+        Used after programmatic loads, which block textChanged so the update
+        runs exactly once here instead of again when the debounce expires.
+        """
+        self._text_changed_timer.stop()
+        self._on_text_changed()
+
+    def _show_status(self, text: str, timeout_ms: int = 0) -> None:
+        """
+        Show a status message, replacing the current one.
+
+        Args:
+            text: Message to show; empty to clear the status
+            timeout_ms: Clear the message after this delay; 0 keeps it until
+                replaced. A pending clear from an earlier message is dropped
+                either way, so it cannot clear this one.
+        """
+        self.status_label.setText(text)
+        if timeout_ms:
+            self.status_timer.start(timeout_ms)
+        else:
+            self.status_timer.stop()
+
+    @Slot()
+    def _clear_status(self) -> None:
+        """Clear a timed status message once it expires."""
         self.status_label.clear()
 
     def _update_char_counter(self, current: int, maximum: int) -> None:
@@ -409,15 +511,18 @@ class MainWindow(QMainWindow):
         # Set color based on usage
         if current > maximum:
             # Over limit - red
-            color = "#FF3B30"
+            css = _COUNTER_CSS_OVER
         elif usage_ratio >= 0.8:
             # Warning - orange (80%+)
-            color = "#FF9500"
+            css = _COUNTER_CSS_WARNING
         else:
             # Normal - gray
-            color = "#888888"
+            css = _COUNTER_CSS_NORMAL
 
-        self.char_counter_label.setStyleSheet(f"color: {color}; font-size: 12px;")
+        # Setting a style sheet re-polishes the label, so only do it on change
+        if css is not self._counter_css:
+            self.char_counter_label.setStyleSheet(css)
+            self._counter_css = css
 
     @Slot()
     def _on_translate_clicked(self) -> None:
@@ -479,7 +584,7 @@ class MainWindow(QMainWindow):
         # Can't swap if source is auto-detect
         if source_lang == "auto":
             logger.warning("Cannot swap languages when source is auto-detect")
-            self.status_label.setText("⚠️ 자동 감지 모드에서는 언어 교환을 할 수 없습니다")
+            self._show_status("⚠️ 자동 감지 모드에서는 언어 교환을 할 수 없습니다")
             return
 
         # Swap
@@ -489,12 +594,24 @@ class MainWindow(QMainWindow):
         logger.info(f"Languages swapped: {target_lang} <-> {source_lang}")
 
         # Also swap the text content
-        source_text = self.source_text.toPlainText()
-        result_text = self.result_text.toPlainText()
+        if not self.result_text.document().isEmpty():
+            self._swap_text_documents()
+            self._apply_text_changed_now()
 
-        if result_text and result_text != "번역 결과가 여기에 표시됩니다...":
-            self.source_text.setPlainText(result_text)
-            self.result_text.setPlainText(source_text)
+    def _swap_text_documents(self) -> None:
+        """Swap the source and result documents between the two panes.
+
+        Moving the documents avoids copying both texts out and laying them
+        out again. Each document is reparented to the pane that now shows
+        it: a pane deletes a replaced document it owns.
+        """
+        source_doc = self.source_text.document()
+        result_doc = self.result_text.document()
+        source_doc.setParent(self.result_text)
+        result_doc.setParent(self.source_text)
+        with QSignalBlocker(self.source_text):  # Callers update the input state
+            self.source_text.setDocument(result_doc)
+        self.result_text.setDocument(source_doc)
 
     @Slot(str)
     def _on_translation_started(self, task_id: str) -> None:
@@ -504,7 +621,7 @@ class MainWindow(QMainWindow):
 
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
-        self.status_label.setText("번역 중...")
+        self._show_status("번역 중...")
         self.copy_button.setEnabled(False)
         self.translate_button.setEnabled(False)
         logger.debug(f"Translation started: {task_id}")
@@ -516,7 +633,7 @@ class MainWindow(QMainWindow):
             return  # Ignore old tasks
 
         self.progress_bar.setValue(percentage)
-        self.status_label.setText(message)
+        self._show_status(message)
 
     @Slot(str, str, str)
     def _on_translation_complete(
@@ -528,7 +645,7 @@ class MainWindow(QMainWindow):
 
         self.result_text.setPlainText(translated_text)
         self.progress_bar.setVisible(False)
-        self.status_label.setText(f"✓ 번역 완료 (감지된 언어: {source_lang})")
+        self._show_status(f"✓ 번역 완료 (감지된 언어: {source_lang})")
         self.copy_button.setEnabled(True)
         self.translate_button.setEnabled(True)
         logger.info(f"Translation complete: {task_id}")
@@ -554,7 +671,7 @@ class MainWindow(QMainWindow):
             return  # Ignore old tasks
 
         delay_sec = delay_ms / 1000
-        self.status_label.setText(
+        self._show_status(
             f"재시도 중... ({attempt}/{max_attempts}) - {delay_sec:.1f}초 후 재시도"
         )
         self.progress_bar.setFormat(f"재시도 대기 중... ({attempt}/{max_attempts})")
@@ -568,16 +685,7 @@ class MainWindow(QMainWindow):
 
         # Handle TranslationError object
         if isinstance(error, TranslationError):
-            # Error type icons
-            icons = {
-                ErrorType.NETWORK: "🌐",
-                ErrorType.MEMORY: "💾",
-                ErrorType.MODEL: "🤖",
-                ErrorType.TIMEOUT: "⏱️",
-                ErrorType.VALIDATION: "⚠️",
-                ErrorType.UNKNOWN: "❌",
-            }
-            icon = icons.get(error.error_type, "❌")
+            icon = _ERROR_ICONS.get(error.error_type, "❌")
 
             # Detailed error message
             error_text = f"""{icon} 번역 오류
@@ -592,12 +700,12 @@ class MainWindow(QMainWindow):
 {error.message}"""
 
             self.result_text.setPlainText(error_text)
-            self.status_label.setText(f"{icon} 번역 실패 - {error.cause}")
+            self._show_status(f"{icon} 번역 실패 - {error.cause}")
             logger.error(f"Translation error: {error.error_type.name} - {error.message}")
         else:
             # Fallback for string error messages (backward compatibility)
             self.result_text.setPlainText(f"❌ 번역 오류: {error}")
-            self.status_label.setText("번역 실패")
+            self._show_status("번역 실패")
             logger.error(f"Translation error: {error}")
 
         self.progress_bar.setVisible(False)
@@ -606,17 +714,18 @@ class MainWindow(QMainWindow):
 
     def _get_user_friendly_error(self, error_message: str) -> str:
         """Convert technical error message to user-friendly message."""
-        error_lower = error_message.lower()
+        # Collect every keyword in one scan, then pick by priority
+        found = {keyword.lower() for keyword in _ERROR_KEYWORDS_RE.findall(error_message)}
 
-        if "memory" in error_lower or "oom" in error_lower:
+        if "memory" in found or "oom" in found:
             return "메모리가 부족합니다. 다른 프로그램을 종료하고 다시 시도해 주세요."
-        elif "timeout" in error_lower:
+        elif "timeout" in found:
             return "번역 시간이 초과되었습니다. 더 짧은 텍스트로 시도해 주세요."
-        elif "model" in error_lower and "load" in error_lower:
+        elif "model" in found and "load" in found:
             return "번역 모델을 불러올 수 없습니다. 앱을 재시작해 주세요."
-        elif "empty" in error_lower:
+        elif "empty" in found:
             return "번역할 텍스트를 입력해 주세요."
-        elif "too long" in error_lower:
+        elif "too long" in found:
             return "텍스트가 너무 깁니다. 2,000자 이하로 줄여주세요."
         else:
             return error_message
@@ -629,18 +738,15 @@ class MainWindow(QMainWindow):
         text = self.result_text.toPlainText()
         if text:
             QApplication.clipboard().setText(text)
-            self.status_label.setText("✓ 클립보드에 복사되었습니다")
+            self._show_status("✓ 클립보드에 복사되었습니다", _STATUS_MESSAGE_MS)
             logger.info("Translation result copied to clipboard")
 
-            # Clear status message after 2 seconds
-            self.status_timer.start(2000)
-
     @Slot()
     def _on_clear_clicked(self) -> None:
         """Handle clear button click."""
         self.source_text.clear()
         self.result_text.clear()
-        self.status_label.clear()
+        self._show_status("")
         self.progress_bar.setVisible(False)
         self.copy_button.setEnabled(False)
         logger.info("Text cleared")
@@ -682,7 +788,9 @@ class MainWindow(QMainWindow):
         Args:
             entry: The selected history entry
         """
-        self.source_text.setPlainText(entry.source_text)
+        with QSignalBlocker(self.source_text):
+            self.source_text.setPlainText(entry.source_text)
+        self._apply_text_changed_now()
         self.result_text.setPlainText(entry.translated_text)
 
         # Set language selectors
@@ -690,8 +798,7 @@ class MainWindow(QMainWindow):
         self.target_lang_selector.set_language(entry.target_lang)
 
         self.copy_button.setEnabled(True)
-        self.status_label.setText("✓ 기록에서 불러옴")
-        self.status_timer.start(2000)
+        self._show_status("✓ 기록에서 불러옴", _STATUS_MESSAGE_MS)
 
         logger.info(f"Loaded history entry: {entry.id}")
 
@@ -703,8 +810,7 @@ class MainWindow(QMainWindow):
         Args:
             text: The text to copy
         """
-        self.status_label.setText("✓ 클립보드에 복사되었습니다")
-        self.status_timer.start(2000)
+        self._show_status("✓ 클립보드에 복사되었습니다", _STATUS_MESSAGE_MS)
 
     @Slot(bool)
     def _on_history_panel_collapsed_changed(self, collapsed: bool) -> None:
@@ -720,24 +826,37 @@ class MainWindow(QMainWindow):
     @Slot()
     def _on_show_about(self) -> None:
         """Show the About dialog."""
-        from ui.about_dialog import AboutDialog
+        if self._about_dialog is None:
+            from ui.about_dialog import AboutDialog
 
-        dialog = AboutDialog(self)
-        dialog.exec()
+            self._about_dialog = AboutDialog(self)
+
+        self._about_dialog.exec()
         logger.debug("About dialog shown")
 
     @Slot()
     def _on_check_for_updates(self) -> None:
-        """Check for updates in a background thread."""
+        """Check for updates in a background thread.
+
+        Only one check runs at a time: the shared UpdateChecker keeps one
+        HTTP connection, which must not be used from two threads at once.
+        """
         from core.update_checker import UpdateChecker, UpdateCheckResult
 
+        if self._update_thread is not None:
+            return  # A check is already in flight
+        self._check_updates_action.setEnabled(False)
+
         # Show checking message
-        self.status_label.setText("업데이트 확인 중...")
+        self._show_status("업데이트 확인 중...")
         logger.info("Checking for updates...")
 
+        if self._update_checker is None:
+            self._update_checker = UpdateChecker()
+
         # Create worker thread
         self._update_thread = QThread()
-        self._update_worker = UpdateCheckerWorker()
+        self._update_worker = UpdateCheckerWorker(self._update_checker)
         self._update_worker.moveToThread(self._update_thread)
 
         # Connect signals
@@ -745,17 +864,24 @@ class MainWindow(QMainWindow):
         self._update_worker.finished.connect(self._on_update_check_complete)
         self._update_worker.finished.connect(self._update_thread.quit)
         self._update_worker.finished.connect(self._update_worker.deleteLater)
+        self._update_thread.finished.connect(self._on_update_thread_finished)
         self._update_thread.finished.connect(self._update_thread.deleteLater)
 
         # Start thread
         self._update_thread.start()
 
+    @Slot()
+    def _on_update_thread_finished(self) -> None:
+        """Allow the next update check once the previous thread has exited."""
+        self._update_thread = None
+        self._check_updates_action.setEnabled(True)
+
     @Slot(object)
     def _on_update_check_complete(self, result) -> None:
         """Handle update check completion."""
         from ui.update_dialog import UpdateDialog
 
-        self.status_label.clear()
+        self._show_status("")
         logger.info(f"Update check complete: {result.status}")
 
         dialog = UpdateDialog(result, self)
@@ -8,6 +8,59 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Rules shared by both themes, for widgets addressed by object name instead
+# of per-widget style sheets
+_COMMON_CSS = """
+    QLabel#historyEmptyLabel, QLabel#historyNoResultsLabel {
+        color: palette(placeholderText);
+    }
+
+    QLabel#aboutIcon {
+        font-size: 48px;
+    }
+
+    QLabel#aboutName {
+        font-size: 24px;
+        font-weight: bold;
+    }
+
+    QLabel#aboutVersion {
+        font-size: 14px;
+        color: #666666;
+    }
+
+    QLabel#aboutCopyright, QLabel#aboutLicense {
+        font-size: 12px;
+        color: #888888;
+    }
+
+    QLabel#aboutLink {
+        font-size: 12px;
+    }
+
+    QPushButton#translateButton {
+        background-color: #007AFF;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 6px;
+        font-weight: bold;
+    }
+
+    QPushButton#translateButton:hover {
+        background-color: #0056CC;
+    }
+
+    QPushButton#translateButton:pressed {
+        background-color: #004499;
+    }
+
+    QPushButton#translateButton:disabled {
+        background-color: #CCCCCC;
+        color: #888888;
+    }
+"""
+
 
 class ThemeManager(QObject):
     """Manages application theme with dark/light mode support."""
@@ -249,52 +302,6 @@ class ThemeManager(QObject):
                     background-color: #3c3c3c;
                 }
 
-                QFrame[frameShape="6"] {
-                    background-color: #252525;
-                    border: 1px solid #3c3c3c;
-                    border-radius: 8px;
-                }
-
-                QFrame[frameShape="6"]:hover {
-                    border-color: #007aff;
-                    background-color: #2d2d2d;
-                }
-
-                QFrame[frameShape="6"] QLabel {
-                    background: transparent;
-                    color: #dcdcdc;
-                }
-
-                QFrame[frameShape="6"] QLabel#langLabel,
-                QFrame[frameShape="6"] QLabel#timeLabel {
-                    color: #888888;
-                    font-size: 11px;
-                }
-
-                QFrame[frameShape="6"] QPushButton {
-                    background-color: #3c3c3c;
-                    color: #dcdcdc;
-                    border: 1px solid #4c4c4c;
-                    border-radius: 4px;
-                    padding: 4px 8px;
-                    font-size: 11px;
-                }
-
-                QFrame[frameShape="6"] QPushButton:hover {
-                    background-color: #4c4c4c;
-                }
-
-                QFrame[frameShape="6"] QPushButton#deleteButton {
-                    color: #ff6b6b;
-                    border-color: #ff6b6b;
-                    background-color: transparent;
-                }
-
-                QFrame[frameShape="6"] QPushButton#deleteButton:hover {
-                    background-color: #ff6b6b;
-                    color: white;
-                }
-
                 /* History Panel Styles */
                 QWidget#historyPanel, QWidget#collapsedBar {
                     background-color: #1e1e1e;
@@ -347,6 +354,11 @@ class ThemeManager(QObject):
                 QLineEdit#historySearch:focus {
                     border-color: #007aff;
                 }
+
+                QListView#historyList {
+                    background: transparent;
+                    border: none;
+                }
             """
         else:
             custom_css = """
@@ -451,52 +463,6 @@ class ThemeManager(QObject):
                     background-color: #f0f0f0;
                 }
 
-                QFrame[frameShape="6"] {
-                    background-color: #ffffff;
-                    border: 1px solid #e0e0e0;
-                    border-radius: 8px;
-                }
-
-                QFrame[frameShape="6"]:hover {
-                    border-color: #007aff;
-                    background-color: #f8f8f8;
-                }
-
-                QFrame[frameShape="6"] QLabel {
-                    background: transparent;
-                    color: #1e1e1e;
-                }
-
-                QFrame[frameShape="6"] QLabel#langLabel,
-                QFrame[frameShape="6"] QLabel#timeLabel {
-                    color: #888888;
-                    font-size: 11px;
-                }
-
-                QFrame[frameShape="6"] QPushButton {
-                    background-color: #f0f0f0;
-                    color: #1e1e1e;
-                    border: 1px solid #d0d0d0;
-                    border-radius: 4px;
-                    padding: 4px 8px;
-                    font-size: 11px;
-                }
-
-                QFrame[frameShape="6"] QPushButton:hover {
-                    background-color: #e0e0e0;
-                }
-
-                QFrame[frameShape="6"] QPushButton#deleteButton {
-                    color: #dc3545;
-                    border-color: #dc3545;
-                    background-color: transparent;
-                }
-
-                QFrame[frameShape="6"] QPushButton#deleteButton:hover {
-                    background-color: #dc3545;
-                    color: white;
-                }
-
                 /* History Panel Styles */
                 QWidget#historyPanel, QWidget#collapsedBar {
                     background-color: #f5f5f5;
@@ -549,9 +515,14 @@ class ThemeManager(QObject):
                 QLineEdit#historySearch:focus {
                     border-color: #007aff;
                 }
+
+                QListView#historyList {
+                    background: transparent;
+                    border: none;
+                }
             """
 
-        self.app.setStyleSheet(custom_css)
+        self.app.setStyleSheet(custom_css + _COMMON_CSS)
 
     def toggle_theme(self) -> None:
         """Toggle between dark and light modes."""
@@ -2,7 +2,7 @@
 
 from PySide6.QtCore import QObject, QRunnable, Signal, Slot
 from typing import Any, Callable, Optional
-import traceback
+import threading
 import sys
 
 
@@ -15,7 +15,7 @@ class WorkerSignals(QObject):
     started = Signal(str)  # task_id
     progress = Signal(str, int, str)  # task_id, percentage, status_message
     result = Signal(str, object)  # task_id, result_data
-    error = Signal(str, str, str)  # task_id, error_message, traceback
+    error = Signal(str, object)  # task_id, classify_error result or exc_info tuple
     finished = Signal(str)  # task_id
 
 
@@ -47,19 +47,54 @@ class Worker(QRunnable):
         self.args = args
         self.kwargs = kwargs
         self.signals = WorkerSignals()
-        self._is_cancelled = False
+        # An Event rather than a flag so code running inside fn can observe it
+        self.cancel_event = threading.Event()
+        # Optional hook that turns a raised exception into the error signal
+        # payload, in the worker thread; without it the raw exc_info is sent
+        self.classify_error: Optional[Callable[[Exception], Any]] = None
+        # Event callbacks, called in the worker thread; each emits its signal
+        # by default, and receivers may swap in callables that deliver the
+        # event themselves instead
+        self.on_started: Callable[[str], None] = self.signals.started.emit
+        self.on_progress: Callable[[str, int, str], None] = self.signals.progress.emit
+        self.on_result: Callable[[str, Any], None] = self.signals.result.emit
+        self.on_error: Callable[[str, Any], None] = self.signals.error.emit
+        self.on_finished: Callable[[str], None] = self.signals.finished.emit
+        # Last (percentage, message) reported, so repeats are not re-sent
+        self._last_progress: Optional[tuple[int, str]] = None
 
         # Allow task to be auto-deleted after completion
         self.setAutoDelete(True)
 
+    def reset(self, task_id: str, fn: Callable, *args: Any, **kwargs: Any) -> None:
+        """
+        Rebind a finished worker to a new task.
+
+        Signal connections and callbacks are kept, so a pooled worker can be
+        reused without reconnecting them.
+
+        Args:
+            task_id: Unique task identifier
+            fn: Function to execute in background
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+        """
+        self.task_id = task_id
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        # A fresh event, since the previous task may still hold the old one
+        self.cancel_event = threading.Event()
+        self._last_progress = None
+
     def cancel(self) -> None:
         """Request cancellation of this task."""
-        self._is_cancelled = True
+        self.cancel_event.set()
 
     @property
     def is_cancelled(self) -> bool:
         """Check if task has been cancelled."""
-        return self._is_cancelled
+        return self.cancel_event.is_set()
 
     @Slot()
     def run(self) -> None:
@@ -68,47 +103,63 @@ class Worker(QRunnable):
         This runs in a background thread.
         """
         try:
-            self.signals.started.emit(self.task_id)
+            self.on_started(self.task_id)
 
             # Check cancellation before starting
-            if self._is_cancelled:
-                self.signals.finished.emit(self.task_id)
+            if self.is_cancelled:
+                self.on_finished(self.task_id)
                 return
 
-            # Add progress_callback to kwargs if function supports it
-            if "progress_callback" not in self.kwargs:
-                self.kwargs["progress_callback"] = self._progress_callback
+            # Add progress_callback to kwargs if function supports it; on a
+            # copy, as storing the bound method would make the worker a cycle
+            # left to the garbage collector of whichever thread runs next
+            kwargs = self.kwargs
+            if "progress_callback" not in kwargs:
+                kwargs = {**kwargs, "progress_callback": self._progress_callback}
 
             # Execute function
-            result = self.fn(*self.args, **self.kwargs)
+            result = self.fn(*self.args, **kwargs)
 
             # Check if cancelled during execution
-            if self._is_cancelled:
-                self.signals.finished.emit(self.task_id)
+            if self.is_cancelled:
+                self.on_finished(self.task_id)
                 return
 
             # Emit result
-            self.signals.result.emit(self.task_id, result)
+            self.on_result(self.task_id, result)
 
         except Exception as e:
-            # Capture full traceback for debugging
-            tb = traceback.format_exception(*sys.exc_info())
-            self.signals.error.emit(self.task_id, str(e), "".join(tb))
+            # Pass the raw exc_info unless classified; receivers format the
+            # traceback on demand
+            payload: Any = sys.exc_info()
+            if self.classify_error is not None:
+                try:
+                    payload = self.classify_error(e)
+                except Exception:
+                    pass  # Receivers still get exc_info to classify themselves
+            self.on_error(self.task_id, payload)
+            del payload  # Its traceback references this frame
 
         finally:
-            # Always emit finished signal
-            self.signals.finished.emit(self.task_id)
+            # Always report finished
+            self.on_finished(self.task_id)
 
     def _progress_callback(self, percentage: int, message: str) -> None:
         """
         Internal progress callback.
 
+        A report identical to the previous one is dropped, since it would
+        only cross threads to redraw the same progress bar and status.
+
         Args:
             percentage: Progress percentage (0-100)
             message: Status message
         """
-        if not self._is_cancelled:
-            self.signals.progress.emit(self.task_id, percentage, message)
+        progress = (percentage, message)
+        if self.is_cancelled or progress == self._last_progress:
+            return
+        self._last_progress = progress
+        self.on_progress(self.task_id, percentage, message)
 
 
 class TaskManager(QObject):
@@ -5,6 +5,7 @@ import pytest
 from src.core.config import (
     LanguageCode,
     Language,
+    SORTED_LANGUAGES,
     SUPPORTED_LANGUAGES,
     get_language,
     get_supported_languages,
@@ -80,6 +81,12 @@ class TestLanguage:
         with pytest.raises(Exception):  # FrozenInstanceError
             lang.name = "Modified"
 
+    def test_language_uses_slots(self):
+        """Test Language instances have no per-instance __dict__."""
+        lang = get_language(LanguageCode.ENGLISH)
+
+        assert not hasattr(lang, "__dict__")
+
 
 class TestSupportedLanguages:
     """Tests for SUPPORTED_LANGUAGES dictionary."""
@@ -123,20 +130,43 @@ class TestGetLanguage:
         assert isinstance(lang, Language)
         assert lang.code == LanguageCode.ENGLISH
 
+    def test_get_language_accepts_plain_code_string(self):
+        """Test get_language resolves a plain ISO code string."""
+        assert get_language("ko") is get_language(LanguageCode.KOREAN)
+
     def test_get_language_raises_for_unknown_code(self):
         """Test get_language raises KeyError for unknown code."""
         with pytest.raises(KeyError):
             get_language("unknown")  # type: ignore
 
 
+class TestSortedLanguages:
+    """Tests for the SORTED_LANGUAGES tuple."""
+
+    def test_sorted_languages_excludes_auto_and_sorts_by_display_name(self):
+        """Test SORTED_LANGUAGES lists every other language by display name."""
+        display_names = [lang.display_name for lang in SORTED_LANGUAGES]
+
+        assert LanguageCode.AUTO not in [lang.code for lang in SORTED_LANGUAGES]
+        assert len(SORTED_LANGUAGES) == len(SUPPORTED_LANGUAGES) - 1
+        assert display_names == sorted(display_names)
+
+
 class TestGetSupportedLanguages:
     """Tests for get_supported_languages function."""
 
-    def test_get_supported_languages_returns_list(self):
-        """Test get_supported_languages returns a list."""
+    def test_get_supported_languages_returns_tuple(self):
+        """Test get_supported_languages returns a tuple."""
         languages = get_supported_languages()
 
-        assert isinstance(languages, list)
+        assert isinstance(languages, tuple)
+
+    def test_get_supported_languages_returns_shared_result(self):
+        """Test repeated calls return the same prebuilt tuple."""
+        assert get_supported_languages() is get_supported_languages()
+        assert get_supported_languages(exclude_auto=True) is get_supported_languages(
+            exclude_auto=True
+        )
 
     def test_get_supported_languages_includes_auto(self):
         """Test get_supported_languages includes auto by default."""
@@ -170,7 +200,7 @@ class TestModelConfig:
 
         assert config.model_id == "yanolja/YanoljaNEXT-Rosetta-4B"
         assert config.device == "auto"
-        assert config.quantization == "none"
+        assert config.quantization == "auto"
         assert config.max_new_tokens == 512
         assert config.dtype == "bfloat16"
 
@@ -209,6 +239,7 @@ class TestPerformanceConfig:
         assert config.short_text_max == 500
         assert config.max_memory_usage == 500
         assert config.debounce_delay_ms == 500
+        assert config.text_changed_delay_ms == 80
         assert config.model_load_timeout == 30
 
     def test_performance_config_is_frozen(self):
@@ -251,6 +282,14 @@ class TestAppConfig:
         with pytest.raises(Exception):
             app_config.app_name = "NewName"
 
+    def test_app_config_sub_configs_use_slots(self):
+        """Test AppConfig and its sub-configs are slotted dataclasses."""
+        app_config = AppConfig()
+
+        assert not hasattr(app_config, "__dict__")
+        assert not hasattr(app_config.model, "__dict__")
+        assert not hasattr(app_config.performance, "__dict__")
+
 
 class TestGlobalConfig:
     """Tests for global config instance."""
@@ -0,0 +1,110 @@
+"""Unit tests for error classification."""
+
+import pytest
+
+from src.core.error_handler import (
+    ERROR_MESSAGES,
+    ErrorClassifier,
+    ErrorType,
+    TranslationError,
+    _determine_type,
+)
+
+
+class TestErrorClassifierDetermineType:
+    """Tests for ErrorClassifier type detection."""
+
+    @pytest.mark.parametrize(
+        "message, expected",
+        [
+            ("Request timed out", ErrorType.TIMEOUT),
+            ("deadline exceeded while waiting", ErrorType.TIMEOUT),
+            ("CUDA out of memory. Tried to allocate 2.00 GiB", ErrorType.MEMORY),
+            ("MPS backend OOM", ErrorType.MEMORY),
+            ("Connection reset by peer", ErrorType.NETWORK),
+            ("Socket closed", ErrorType.NETWORK),
+            ("Model not loaded. Call initialize() first.", ErrorType.MODEL),
+            ("failed to load the model weights", ErrorType.MODEL),
+            ("something odd happened", ErrorType.UNKNOWN),
+        ],
+    )
+    def test_classify_from_message(self, message: str, expected: ErrorType) -> None:
+        """Messages should be classified by pattern in priority order."""
+        error = ErrorClassifier.classify_from_message(message)
+
+        assert isinstance(error, TranslationError)
+        assert error.error_type == expected
+        assert error.message == message
+
+    def test_timeout_takes_priority_over_network(self) -> None:
+        """Timeout patterns should win over network patterns."""
+        error = ErrorClassifier.classify_from_message("connection timeout")
+
+        assert error.error_type == ErrorType.TIMEOUT
+
+    def test_exception_types_take_priority(self) -> None:
+        """Exception type checks should run before message patterns."""
+        assert (
+            ErrorClassifier.classify(ValueError("out of memory"), "out of memory").error_type
+            == ErrorType.VALIDATION
+        )
+        assert (
+            ErrorClassifier.classify(OSError("read timed out"), "read timed out").error_type
+            == ErrorType.TIMEOUT
+        )
+        assert (
+            ErrorClassifier.classify(OSError("broken pipe"), "broken pipe").error_type
+            == ErrorType.NETWORK
+        )
+
+    def test_classify_from_exception_uses_type_and_message(self) -> None:
+        """classify_from_exception() should keep the exception and its message."""
+        exception = MemoryError("allocation failed")
+
+        error = ErrorClassifier.classify_from_exception(exception)
+
+        assert error.error_type == ErrorType.MEMORY
+        assert error.message == "allocation failed"
+        assert error.original_exception is exception
+
+    def test_create_timeout_error(self) -> None:
+        """create_timeout_error() should build a retryable timeout error."""
+        error = ErrorClassifier.create_timeout_error()
+
+        assert error.error_type == ErrorType.TIMEOUT
+        assert error.is_retryable is True
+
+    def test_classification_is_memoized(self) -> None:
+        """Repeated messages should be served from the classification cache."""
+        _determine_type.cache_clear()
+
+        ErrorClassifier.classify_from_message("CUDA out of memory")
+        ErrorClassifier.classify_from_message("CUDA out of memory")
+
+        info = _determine_type.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
+
+class TestTranslationError:
+    """Tests for TranslationError construction."""
+
+    @pytest.mark.parametrize("error_type", list(ErrorType))
+    def test_error_info_matches_messages(self, monkeypatch, error_type: ErrorType) -> None:
+        """Classified errors should carry the texts from ERROR_MESSAGES."""
+        monkeypatch.setattr(
+            ErrorClassifier, "_determine_type", classmethod(lambda cls, e, m: error_type)
+        )
+
+        error = ErrorClassifier.classify(Exception("boom"), "boom")
+
+        info = ERROR_MESSAGES[error_type]
+        assert error.cause == info["cause"]
+        assert error.solution == info["solution"]
+        assert error.is_retryable == info["is_retryable"]
+
+    def test_translation_error_uses_slots(self) -> None:
+        """TranslationError should not carry a per-instance __dict__."""
+        error = ErrorClassifier.create_timeout_error()
+
+        assert not hasattr(error, "__dict__")
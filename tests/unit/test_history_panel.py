@@ -0,0 +1,206 @@
+"""Unit tests for HistoryListModel and HistoryPanel."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from PySide6.QtCore import QPoint, QSettings, Qt
+from PySide6.QtGui import QFont
+from PySide6.QtTest import QTest
+
+from core.history_store import HistoryEntry, HistoryStore
+from ui.history_item import HistoryItemDelegate
+from ui.history_model import HistoryListModel
+from ui.history_panel import HistoryPanel
+
+
+def _make_entry(entry_id: str, text: str = "Hello") -> HistoryEntry:
+    return HistoryEntry(
+        id=entry_id,
+        source_text=text,
+        translated_text=f"{text} 번역",
+        source_lang="en",
+        target_lang="ko",
+        created_at_ts=0.0,
+    )
+
+
+class TestHistoryListModel:
+    """Tests for HistoryListModel."""
+
+    def test_data_roles(self, qapp) -> None:
+        """Rows should expose the preview, entry, language pair and time."""
+        entry = _make_entry("a")
+        model = HistoryListModel()
+        model.set_entries([entry])
+
+        index = model.index(0)
+        assert model.rowCount() == 1
+        assert index.data(Qt.ItemDataRole.DisplayRole) == entry.preview()
+        assert index.data(HistoryListModel.EntryRole) is entry
+        assert index.data(HistoryListModel.LanguagesRole) == "en → ko"
+        assert index.data(HistoryListModel.TimeRole) == entry.formatted_time
+
+    def test_insert_and_remove_entries(self, qapp) -> None:
+        """insert_entry and remove_entry should update rows in place."""
+        model = HistoryListModel()
+        model.set_entries([_make_entry("a")])
+
+        model.insert_entry(0, _make_entry("b"))
+
+        assert [model.entry(row).id for row in range(model.rowCount())] == ["b", "a"]
+        assert model.remove_entry("a") is True
+        assert model.remove_entry("missing") is False
+        assert model.rowCount() == 1
+
+    def test_set_same_entries_skips_reset(self, qapp) -> None:
+        """set_entries should not reset the model for an unchanged listing."""
+        entries = [_make_entry("a"), _make_entry("b")]
+        model = HistoryListModel()
+        model.set_entries(entries)
+        resets: list[None] = []
+        model.modelReset.connect(lambda: resets.append(None))
+
+        model.set_entries(list(entries))
+        assert resets == []
+
+        model.set_entries(entries[:1])
+        assert len(resets) == 1
+
+
+class TestHistoryItemDelegate:
+    """Tests for HistoryItemDelegate."""
+
+    def test_preview_heights_are_cached(self, qapp) -> None:
+        """Wrapped preview heights should be measured once per text and width."""
+        delegate = HistoryItemDelegate()
+        font = QFont()
+        text = "word " * 40
+
+        narrow = delegate._preview_height(font, 100, text)
+        assert delegate._preview_height(font, 100, text) == narrow
+        assert len(delegate._preview_heights) == 1
+
+        assert delegate._preview_height(font, 400, text) < narrow
+        assert len(delegate._preview_heights) == 2
+
+
+class TestHistoryPanel:
+    """Tests for HistoryPanel."""
+
+    @pytest.fixture
+    def history_store(self, qapp) -> HistoryStore:
+        """Create a HistoryStore with mock settings."""
+        return HistoryStore(MagicMock(spec=QSettings))
+
+    @pytest.fixture
+    def panel(self, qtbot, history_store: HistoryStore) -> HistoryPanel:
+        """Create a shown HistoryPanel over the store."""
+        panel = HistoryPanel(history_store)
+        qtbot.addWidget(panel)
+        panel.resize(320, 600)
+        panel.show()
+        return panel
+
+    def _listed_ids(self, panel: HistoryPanel) -> list[str]:
+        model = panel._model
+        return [model.entry(row).id for row in range(model.rowCount())]
+
+    def test_new_entries_are_listed_first(self, panel, history_store) -> None:
+        """Added entries should appear at the top, like the store order."""
+        history_store.add(_make_entry("a"))
+        history_store.add(_make_entry("b"))
+
+        assert self._listed_ids(panel) == ["b", "a"]
+        assert panel._empty_label.isHidden()
+
+    def test_evicted_entries_are_dropped(self, panel, history_store) -> None:
+        """Entries the store evicts when full should leave the list."""
+        history_store.max_entries = 2
+        for entry_id in ("a", "b", "c"):
+            history_store.add(_make_entry(entry_id))
+
+        assert self._listed_ids(panel) == ["c", "b"]
+
+    def test_removed_entries_are_dropped(self, panel, history_store) -> None:
+        """Removing an entry from the store should remove its row."""
+        history_store.add(_make_entry("a"))
+        history_store.add(_make_entry("b"))
+
+        history_store.remove("a")
+
+        assert self._listed_ids(panel) == ["b"]
+
+    def test_search_filters_rows(self, panel, history_store) -> None:
+        """The search filter should list only matching entries."""
+        history_store.add(_make_entry("a", "apple"))
+        history_store.add(_make_entry("b", "banana"))
+
+        panel._search_input.setText("APP")
+        panel._refresh_list()
+        assert self._listed_ids(panel) == ["a"]
+
+        panel._search_input.setText("cherry")
+        panel._refresh_list()
+        assert self._listed_ids(panel) == []
+        assert not panel._no_results_label.isHidden()
+
+    def test_button_clicks_reach_store(self, panel, history_store, qtbot) -> None:
+        """Clicks on the painted buttons should copy, delete or select."""
+        history_store.add(_make_entry("a"))
+        history_store.add(_make_entry("b"))
+        qtbot.waitExposed(panel)
+
+        view = panel._list_view
+        rect = view.visualRect(panel._model.index(0))
+        copy_pos = QPoint(rect.right() - 30, rect.top() + 15)
+        delete_pos = QPoint(rect.right() - 30, rect.top() + 45)
+        card_pos = QPoint(rect.left() + 30, rect.top() + 15)
+        copied: list[str] = []
+        selected: list[HistoryEntry] = []
+        panel.copyRequested.connect(copied.append)
+        panel.entrySelected.connect(selected.append)
+
+        for pos in (copy_pos, card_pos, delete_pos):
+            QTest.mouseClick(view.viewport(), Qt.MouseButton.LeftButton, pos=pos)
+
+        assert copied == ["Hello 번역"]
+        assert panel._clipboard.text() == "Hello 번역"
+        assert [entry.id for entry in selected] == ["b"]
+        assert history_store.get("b") is None
+        assert self._listed_ids(panel) == ["a"]
+
+    def test_collapsed_panel_defers_list(self, qtbot, history_store) -> None:
+        """A panel shown collapsed should build its list on first expand."""
+        history_store.add(_make_entry("a"))
+        panel = HistoryPanel(history_store)
+        qtbot.addWidget(panel)
+        panel.set_collapsed(True)
+        panel.show()
+
+        assert panel._expanded_content is None
+
+        panel.set_collapsed(False)
+
+        assert self._listed_ids(panel) == ["a"]
+        history_store.add(_make_entry("b"))
+        assert self._listed_ids(panel) == ["b", "a"]
+
+    def test_clear_empties_list(self, panel, history_store) -> None:
+        """Clearing the store should empty the list and show the empty state."""
+        history_store.add(_make_entry("a"))
+
+        history_store.clear()
+
+        assert self._listed_ids(panel) == []
+        assert not panel._empty_label.isHidden()
+        assert panel._no_results_label.isHidden()
+
+    def test_expand_restores_width_range(self, panel) -> None:
+        """Expanding should lift the collapsed fixed width back to 280-400."""
+        panel.set_collapsed(True)
+        assert panel.minimumWidth() == panel.maximumWidth() == 36
+
+        panel.set_collapsed(False)
+
+        assert (panel.minimumWidth(), panel.maximumWidth()) == (280, 400)
+        assert panel.width() == 320
@@ -1,13 +1,19 @@
 """Unit tests for HistoryEntry and HistoryStore."""
 
+import time
+
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
 from PySide6.QtCore import QSettings
 
+from core.config import config
 from core.history_store import HistoryEntry, HistoryStore
 
+# 2025-12-27T10:30:00Z
+CREATED_AT_TS = datetime(2025, 12, 27, 10, 30, 0, tzinfo=timezone.utc).timestamp()
+
 
 class TestHistoryEntry:
     """Tests for HistoryEntry dataclass."""
@@ -22,12 +28,26 @@ class TestHistoryEntry:
         assert entry1.id != entry2.id
 
     def test_create_sets_timestamp(self) -> None:
-        """HistoryEntry.create() should set created_at to current UTC time."""
-        before = datetime.utcnow()
+        """HistoryEntry.create() should set created_at_ts to the current time."""
+        before = time.time()
         entry = HistoryEntry.create("Hello", "안녕", "en", "ko")
-        after = datetime.utcnow()
+        after = time.time()
+
+        assert before <= entry.created_at_ts <= after
+
+    def test_created_at_converts_timestamp(self) -> None:
+        """created_at should expose the timestamp as a local datetime."""
+        entry = HistoryEntry("abc12345", "Hello", "안녕", "en", "ko", CREATED_AT_TS)
 
-        assert before <= entry.created_at <= after
+        assert entry.created_at == datetime.fromtimestamp(CREATED_AT_TS)
+
+    def test_formatted_time_is_cached(self) -> None:
+        """formatted_time should format the local time once and reuse it."""
+        entry = HistoryEntry("abc12345", "Hello", "안녕", "en", "ko", CREATED_AT_TS)
+        expected = datetime.fromtimestamp(CREATED_AT_TS).strftime("%Y-%m-%d %H:%M")
+
+        assert entry.formatted_time == expected
+        assert entry.formatted_time is entry.formatted_time
 
     def test_create_stores_text_and_languages(self) -> None:
         """HistoryEntry.create() should store source/target text and languages."""
@@ -59,12 +79,30 @@ class TestHistoryEntry:
         assert preview.endswith("...")
         assert preview == "A" * 97 + "..."
 
-    def test_entry_is_immutable(self) -> None:
-        """HistoryEntry should be frozen (immutable)."""
+    def test_preview_default_uses_config_length(self) -> None:
+        """preview() without max_length should truncate to the configured length."""
+        entry = HistoryEntry.create("A" * 500, "B", "en", "ko")
+
+        preview = entry.preview()
+        assert len(preview) == config.history.preview_length
+        assert preview == entry.preview(config.history.preview_length)
+
+    def test_entry_is_hashable(self) -> None:
+        """Equal HistoryEntry instances should hash equally."""
+        entry1 = HistoryEntry("abc12345", "Hello", "안녕", "en", "ko", CREATED_AT_TS)
+        entry2 = HistoryEntry("abc12345", "Hello", "안녕", "en", "ko", CREATED_AT_TS)
+
+        assert entry1 == entry2
+        assert hash(entry1) == hash(entry2)
+        assert len({entry1, entry2}) == 1
+
+    def test_entry_uses_slots(self) -> None:
+        """HistoryEntry should not carry a per-instance __dict__."""
         entry = HistoryEntry.create("Hello", "안녕", "en", "ko")
 
+        assert not hasattr(entry, "__dict__")
         with pytest.raises(AttributeError):
-            entry.source_text = "Modified"  # type: ignore
+            entry.extra = "value"  # type: ignore
 
 
 class TestHistoryStoreSaveLoad:
@@ -74,127 +112,164 @@ class TestHistoryStoreSaveLoad:
     def mock_settings(self) -> MagicMock:
         """Create a mock QSettings object."""
         settings = MagicMock(spec=QSettings)
-        settings.beginWriteArray = MagicMock()
+        settings.beginGroup = MagicMock()
+        settings.endGroup = MagicMock()
+        settings.beginReadArray = MagicMock(return_value=0)
         settings.endArray = MagicMock()
-        settings.setArrayIndex = MagicMock()
         settings.setValue = MagicMock()
+        settings.remove = MagicMock()
         settings.sync = MagicMock()
-        settings.beginReadArray = MagicMock(return_value=0)
+        settings.contains = MagicMock(return_value=False)
         settings.value = MagicMock(return_value="")
         return settings
 
     @pytest.fixture
-    def history_store(self, mock_settings: MagicMock) -> HistoryStore:
+    def history_store(self, qapp, mock_settings: MagicMock) -> HistoryStore:
         """Create a HistoryStore with mock settings."""
         return HistoryStore(mock_settings)
 
+    @pytest.fixture
+    def ini_path(self, tmp_path) -> str:
+        """Path to a temporary INI file used as QSettings storage."""
+        return str(tmp_path / "history.ini")
+
+    def _make_entry(self, entry_id: str = "abc12345", text: str = "Hello") -> HistoryEntry:
+        return HistoryEntry(
+            id=entry_id,
+            source_text=text,
+            translated_text="안녕",
+            source_lang="en",
+            target_lang="ko",
+            created_at_ts=CREATED_AT_TS,
+        )
+
     def test_save_empty_store(
         self, history_store: HistoryStore, mock_settings: MagicMock
     ) -> None:
         """save() should handle empty store correctly."""
         history_store.save()
 
-        mock_settings.beginWriteArray.assert_called_once_with("history/entries")
-        mock_settings.endArray.assert_called_once()
+        mock_settings.setValue.assert_called_once_with("history/order", [])
+        mock_settings.beginGroup.assert_not_called()
         mock_settings.sync.assert_called_once()
 
     def test_save_with_entries(
         self, history_store: HistoryStore, mock_settings: MagicMock
     ) -> None:
-        """save() should persist all entry fields."""
-        entry = HistoryEntry(
-            id="abc12345",
-            source_text="Hello",
-            translated_text="안녕",
-            source_lang="en",
-            target_lang="ko",
-            created_at=datetime(2025, 12, 27, 10, 30, 0),
-        )
-        history_store._entries = [entry]
+        """save() should persist all entry fields under the entry's group."""
+        history_store.add(self._make_entry())
 
         history_store.save()
 
-        # Verify setArrayIndex was called
-        mock_settings.setArrayIndex.assert_called_with(0)
+        mock_settings.beginGroup.assert_called_once_with("history/items/abc12345")
+        mock_settings.endGroup.assert_called_once()
 
-        # Verify all fields were saved
         calls = mock_settings.setValue.call_args_list
         saved_data = {call[0][0]: call[0][1] for call in calls}
 
-        assert saved_data["id"] == "abc12345"
         assert saved_data["source_text"] == "Hello"
         assert saved_data["translated_text"] == "안녕"
         assert saved_data["source_lang"] == "en"
         assert saved_data["target_lang"] == "ko"
-        assert saved_data["created_at"] == "2025-12-27T10:30:00"
+        assert saved_data["created_at_ts"] == CREATED_AT_TS
+        assert saved_data["history/order"] == ["abc12345"]
+
+    def test_save_writes_only_new_entries(
+        self, history_store: HistoryStore, mock_settings: MagicMock
+    ) -> None:
+        """save() should not rewrite entries that were already saved."""
+        history_store.add(self._make_entry("first111"))
+        history_store.save()
+        mock_settings.beginGroup.reset_mock()
+
+        history_store.add(self._make_entry("second22"))
+        history_store.save()
+
+        mock_settings.beginGroup.assert_called_once_with("history/items/second22")
+
+    def test_save_removes_deleted_entries(
+        self, history_store: HistoryStore, mock_settings: MagicMock
+    ) -> None:
+        """save() should remove deleted entries without rewriting others."""
+        history_store.add(self._make_entry("first111"))
+        history_store.add(self._make_entry("second22"))
+        history_store.save()
+        mock_settings.beginGroup.reset_mock()
+
+        history_store.remove("first111")
+        history_store.save()
+
+        mock_settings.remove.assert_called_once_with("history/items/first111")
+        mock_settings.beginGroup.assert_not_called()
+        mock_settings.setValue.assert_called_with("history/order", ["second22"])
 
     def test_load_empty_store(
         self, history_store: HistoryStore, mock_settings: MagicMock
     ) -> None:
         """load() should handle empty store correctly."""
-        mock_settings.beginReadArray.return_value = 0
-
         history_store.load()
 
         assert history_store.count == 0
         mock_settings.beginReadArray.assert_called_once_with("history/entries")
         mock_settings.endArray.assert_called_once()
 
-    def test_load_with_entries(
-        self, history_store: HistoryStore, mock_settings: MagicMock
-    ) -> None:
-        """load() should restore all entry fields."""
-        mock_settings.beginReadArray.return_value = 1
-
-        def mock_value(key: str, default: str = "") -> str:
-            values = {
-                "id": "abc12345",
-                "source_text": "Hello",
-                "translated_text": "안녕",
-                "source_lang": "en",
-                "target_lang": "ko",
-                "created_at": "2025-12-27T10:30:00",
-            }
-            return values.get(key, default)
-
-        mock_settings.value = mock_value
+    def test_save_load_round_trip(self, qapp, ini_path: str) -> None:
+        """Entries saved by one store should be restored by another in order."""
+        store = HistoryStore(QSettings(ini_path, QSettings.Format.IniFormat))
+        store.add(self._make_entry("first111", "First"))
+        store.add(self._make_entry("second22", "Second"))
+        store.flush()
 
-        history_store.load()
+        restored = HistoryStore(QSettings(ini_path, QSettings.Format.IniFormat))
+        restored.load()
 
-        assert history_store.count == 1
-        entry = history_store.entries[0]
-        assert entry.id == "abc12345"
-        assert entry.source_text == "Hello"
-        assert entry.translated_text == "안녕"
-        assert entry.source_lang == "en"
-        assert entry.target_lang == "ko"
-        assert entry.created_at == datetime(2025, 12, 27, 10, 30, 0)
+        assert [e.id for e in restored.entries] == ["second22", "first111"]
+        entry = restored.get("first111")
+        assert entry == self._make_entry("first111", "First")
+        assert entry.created_at_ts == CREATED_AT_TS
 
-    def test_load_skips_invalid_entries(
-        self, history_store: HistoryStore, mock_settings: MagicMock
-    ) -> None:
+    def test_load_skips_invalid_entries(self, qapp, ini_path: str) -> None:
         """load() should skip entries with missing required fields."""
-        mock_settings.beginReadArray.return_value = 1
-
-        # Missing id
-        def mock_value(key: str, default: str = "") -> str:
-            values = {
-                "id": "",
-                "source_text": "Hello",
-            }
-            return values.get(key, default)
+        settings = QSettings(ini_path, QSettings.Format.IniFormat)
+        settings.setValue("history/order", ["missing1", "valid123"])
+        settings.setValue("history/items/valid123/source_text", "Hello")
+        settings.setValue("history/items/valid123/created_at_ts", CREATED_AT_TS)
+        settings.sync()
 
-        mock_settings.value = mock_value
+        history_store = HistoryStore(settings)
+        history_store.load()
 
+        assert [e.id for e in history_store.entries] == ["valid123"]
+
+    def test_load_migrates_legacy_array(self, qapp, ini_path: str) -> None:
+        """load() should read the legacy array layout and migrate it on flush."""
+        settings = QSettings(ini_path, QSettings.Format.IniFormat)
+        settings.beginWriteArray("history/entries")
+        settings.setArrayIndex(0)
+        settings.setValue("id", "abc12345")
+        settings.setValue("source_text", "Hello")
+        settings.setValue("translated_text", "안녕")
+        settings.setValue("source_lang", "en")
+        settings.setValue("target_lang", "ko")
+        settings.setValue("created_at", "2025-12-27T10:30:00")
+        settings.endArray()
+        settings.sync()
+
+        history_store = HistoryStore(settings)
         history_store.load()
 
-        assert history_store.count == 0
+        assert history_store.get("abc12345") == self._make_entry()
+        assert history_store.is_dirty
+
+        history_store.flush()
+
+        assert not settings.contains("history/entries/size")
+        assert settings.value("history/order", [], type=list) == ["abc12345"]
 
     def test_load_emits_signal(
         self, history_store: HistoryStore, mock_settings: MagicMock
     ) -> None:
         """load() should emit entriesLoaded signal."""
-        mock_settings.beginReadArray.return_value = 0
         signal_received = []
         history_store.entriesLoaded.connect(lambda: signal_received.append(True))
 
@@ -218,7 +293,7 @@ class TestHistoryStoreAdd:
         return settings
 
     @pytest.fixture
-    def history_store(self, mock_settings: MagicMock) -> HistoryStore:
+    def history_store(self, qapp, mock_settings: MagicMock) -> HistoryStore:
         """Create a HistoryStore with mock settings."""
         return HistoryStore(mock_settings)
 
@@ -247,7 +322,7 @@ class TestHistoryStoreAdd:
 
     def test_add_respects_max_entries(self, history_store: HistoryStore) -> None:
         """add() should remove oldest entry when exceeding max_entries."""
-        history_store._max_entries = 3
+        history_store.max_entries = 3
 
         entries = [
             HistoryEntry.create(f"Entry {i}", f"항목 {i}", "en", "ko") for i in range(5)
@@ -261,16 +336,103 @@ class TestHistoryStoreAdd:
         assert history_store.entries[0].source_text == "Entry 4"
         assert history_store.entries[2].source_text == "Entry 2"
 
-    def test_add_calls_save(
+    def test_add_evicted_entry_is_not_retrievable(self, history_store: HistoryStore) -> None:
+        """get() should not return entries evicted by max_entries."""
+        history_store.max_entries = 2
+
+        entries = [
+            HistoryEntry.create(f"Entry {i}", f"항목 {i}", "en", "ko") for i in range(3)
+        ]
+        for entry in entries:
+            history_store.add(entry)
+
+        assert history_store.get(entries[0].id) is None
+        assert history_store.get(entries[2].id) == entries[2]
+
+    def test_max_entries_shrink_drops_oldest(self, history_store: HistoryStore) -> None:
+        """Lowering max_entries should keep only the newest entries."""
+        entries = [
+            HistoryEntry.create(f"Entry {i}", f"항목 {i}", "en", "ko") for i in range(3)
+        ]
+        for entry in entries:
+            history_store.add(entry)
+
+        history_store.max_entries = 1
+
+        assert history_store.count == 1
+        assert history_store.entries[0] == entries[2]
+        assert history_store.get(entries[0].id) is None
+
+    def test_max_entries_shrink_saves_and_notifies(
         self, history_store: HistoryStore, mock_settings: MagicMock
     ) -> None:
-        """add() should automatically save to settings."""
+        """Lowering max_entries should persist the trim and refresh listeners."""
+        for i in range(3):
+            history_store.add(HistoryEntry.create(f"Entry {i}", f"항목 {i}", "en", "ko"))
+        history_store.flush()
+        mock_settings.sync.reset_mock()
+        handler = MagicMock()
+        history_store.entriesLoaded.connect(handler)
+
+        history_store.max_entries = 1
+
+        handler.assert_called_once()
+        assert history_store.is_dirty
+        history_store.flush()
+        mock_settings.sync.assert_called_once()
+
+    def test_add_with_zero_max_entries(self, history_store: HistoryStore) -> None:
+        """add() should not fail when history is disabled with max_entries 0."""
+        history_store.max_entries = 0
         entry = HistoryEntry.create("Hello", "안녕", "en", "ko")
 
         history_store.add(entry)
 
-        mock_settings.beginWriteArray.assert_called()
-        mock_settings.sync.assert_called()
+        assert history_store.count == 0
+        assert history_store.get(entry.id) is None
+        assert not history_store.is_dirty
+
+    def test_add_defers_save(
+        self, history_store: HistoryStore, mock_settings: MagicMock
+    ) -> None:
+        """add() should mark the store dirty and save on flush()."""
+        entry = HistoryEntry.create("Hello", "안녕", "en", "ko")
+
+        history_store.add(entry)
+
+        assert history_store.is_dirty
+        mock_settings.sync.assert_not_called()
+
+        history_store.flush()
+
+        assert not history_store.is_dirty
+        mock_settings.sync.assert_called_once()
+
+    def test_burst_of_adds_writes_once(
+        self, history_store: HistoryStore, mock_settings: MagicMock
+    ) -> None:
+        """Several adds before a flush should produce a single write."""
+        for i in range(3):
+            history_store.add(HistoryEntry.create(f"Entry {i}", f"항목 {i}", "en", "ko"))
+
+        history_store.flush()
+        history_store.flush()
+
+        mock_settings.sync.assert_called_once()
+
+    def test_save_timer_writes_in_background(self, qtbot, tmp_path) -> None:
+        """The deferred save timer should write pending changes off the GUI thread."""
+        ini_path = str(tmp_path / "history.ini")
+        store = HistoryStore(QSettings(ini_path, QSettings.Format.IniFormat))
+        entry = HistoryEntry.create("Hello", "안녕", "en", "ko")
+        store.add(entry)
+
+        qtbot.waitUntil(lambda: not store.is_dirty, timeout=2000)
+        store.flush()  # Waits for the background write
+
+        restored = HistoryStore(QSettings(ini_path, QSettings.Format.IniFormat))
+        restored.load()
+        assert [e.id for e in restored.entries] == [entry.id]
 
 
 class TestHistoryStoreGet:
@@ -286,7 +448,7 @@ class TestHistoryStoreGet:
         return settings
 
     @pytest.fixture
-    def history_store(self, mock_settings: MagicMock) -> HistoryStore:
+    def history_store(self, qapp, mock_settings: MagicMock) -> HistoryStore:
         """Create a HistoryStore with mock settings."""
         return HistoryStore(mock_settings)
 
@@ -298,9 +460,9 @@ class TestHistoryStoreGet:
             translated_text="안녕",
             source_lang="en",
             target_lang="ko",
-            created_at=datetime.utcnow(),
+            created_at_ts=time.time(),
         )
-        history_store._entries = [entry]
+        history_store.add(entry)
 
         result = history_store.get("test1234")
 
@@ -326,7 +488,7 @@ class TestHistoryStoreRemove:
         return settings
 
     @pytest.fixture
-    def history_store(self, mock_settings: MagicMock) -> HistoryStore:
+    def history_store(self, qapp, mock_settings: MagicMock) -> HistoryStore:
         """Create a HistoryStore with mock settings."""
         return HistoryStore(mock_settings)
 
@@ -338,9 +500,9 @@ class TestHistoryStoreRemove:
             translated_text="안녕",
             source_lang="en",
             target_lang="ko",
-            created_at=datetime.utcnow(),
+            created_at_ts=time.time(),
         )
-        history_store._entries = [entry]
+        history_store.add(entry)
 
         result = history_store.remove("test1234")
 
@@ -361,9 +523,9 @@ class TestHistoryStoreRemove:
             translated_text="안녕",
             source_lang="en",
             target_lang="ko",
-            created_at=datetime.utcnow(),
+            created_at_ts=time.time(),
         )
-        history_store._entries = [entry]
+        history_store.add(entry)
 
         removed_ids: list[str] = []
         history_store.entryRemoved.connect(lambda id: removed_ids.append(id))
@@ -386,16 +548,14 @@ class TestHistoryStoreClear:
         return settings
 
     @pytest.fixture
-    def history_store(self, mock_settings: MagicMock) -> HistoryStore:
+    def history_store(self, qapp, mock_settings: MagicMock) -> HistoryStore:
         """Create a HistoryStore with mock settings."""
         return HistoryStore(mock_settings)
 
     def test_clear_removes_all_entries(self, history_store: HistoryStore) -> None:
         """clear() should remove all entries."""
-        history_store._entries = [
-            HistoryEntry.create("Hello", "안녕", "en", "ko"),
-            HistoryEntry.create("World", "세계", "en", "ko"),
-        ]
+        history_store.add(HistoryEntry.create("Hello", "안녕", "en", "ko"))
+        history_store.add(HistoryEntry.create("World", "세계", "en", "ko"))
 
         history_store.clear()
 
@@ -420,17 +580,17 @@ class TestHistoryStoreSearch:
         return MagicMock(spec=QSettings)
 
     @pytest.fixture
-    def history_store(self, mock_settings: MagicMock) -> HistoryStore:
+    def history_store(self, qapp, mock_settings: MagicMock) -> HistoryStore:
         """Create a HistoryStore with test entries."""
         store = HistoryStore(mock_settings)
-        store._entries = [
+        entries = [
             HistoryEntry(
                 id="1",
                 source_text="Hello world",
                 translated_text="안녕하세요 세계",
                 source_lang="en",
                 target_lang="ko",
-                created_at=datetime.utcnow(),
+                created_at_ts=time.time(),
             ),
             HistoryEntry(
                 id="2",
@@ -438,7 +598,7 @@ class TestHistoryStoreSearch:
                 translated_text="좋은 아침",
                 source_lang="en",
                 target_lang="ko",
-                created_at=datetime.utcnow(),
+                created_at_ts=time.time(),
             ),
             HistoryEntry(
                 id="3",
@@ -446,9 +606,11 @@ class TestHistoryStoreSearch:
                 translated_text="Hello",
                 source_lang="ko",
                 target_lang="en",
-                created_at=datetime.utcnow(),
+                created_at_ts=time.time(),
             ),
         ]
+        for entry in reversed(entries):
+            store.add(entry)
         return store
 
     def test_search_empty_query_returns_all(
@@ -481,6 +643,20 @@ class TestHistoryStoreSearch:
 
         assert len(results) == 2
 
+    def test_search_uses_casefold(self, history_store: HistoryStore) -> None:
+        """search() should match using Unicode case folding."""
+        history_store.add(HistoryEntry.create("Straße", "거리", "de", "ko"))
+
+        results = history_store.search("STRASSE")
+
+        assert [e.source_text for e in results] == ["Straße"]
+
+    def test_search_does_not_span_texts(self, history_store: HistoryStore) -> None:
+        """search() should not match across the source and translated text."""
+        history_store.add(HistoryEntry.create("abc", "def", "en", "ko"))
+
+        assert history_store.search("cd") == []
+
     def test_search_no_matches(self, history_store: HistoryStore) -> None:
         """search() should return empty list when no matches."""
         results = history_store.search("xyz123")
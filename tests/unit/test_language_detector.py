@@ -3,7 +3,7 @@
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
-from src.core.language_detector import LanguageDetector, get_language_detector
+from src.core.language_detector import _CODE_TABLE, LanguageDetector, get_language_detector
 from src.core.config import LanguageCode
 
 
@@ -16,6 +16,17 @@ class TestLanguageDetectorInit:
 
         assert detector.detector is not None
 
+    def test_init_defers_lingua_build(self):
+        """Test that the lingua detector is only built on first use."""
+        with patch("src.core.language_detector.LanguageDetectorBuilder") as builder:
+            detector = LanguageDetector()
+            builder.from_languages.assert_not_called()
+
+            _ = detector.detector
+            _ = detector.detector
+
+        builder.from_languages.assert_called_once()
+
     def test_lingua_to_code_mapping_complete(self):
         """Test that all supported languages have mappings."""
         detector = LanguageDetector()
@@ -23,6 +34,14 @@ class TestLanguageDetectorInit:
         # Should have 10 language mappings
         assert len(detector.LINGUA_TO_CODE) == 10
 
+    def test_code_table_matches_mapping(self):
+        """Test that the ordinal lookup table mirrors LINGUA_TO_CODE."""
+        for lingua_lang, code in LanguageDetector.LINGUA_TO_CODE.items():
+            assert _CODE_TABLE[int(lingua_lang)] == code.value
+
+        mapped = [code for code in _CODE_TABLE if code is not None]
+        assert len(mapped) == 10
+
 
 class TestLanguageDetectorDetect:
     """Tests for detect method."""
@@ -108,6 +127,71 @@ class TestLanguageDetectorDetect:
         assert result == "de"
 
 
+class TestLanguageDetectorCache:
+    """Tests for memoized detection."""
+
+    def test_detect_caches_repeated_text(self):
+        """Test that detecting the same text twice runs lingua once."""
+        detector = LanguageDetector()
+        detector.detector = Mock(wraps=detector.detector)
+        text = "Hello, this is a test sentence in English."
+
+        assert detector.detect(text) == "en"
+        assert detector.detect(text) == "en"
+
+        detector.detector.detect_language_of.assert_called_once_with(text)
+
+    def test_detect_with_confidence_caches_repeated_text(self):
+        """Test that confidence lookups for the same text run lingua once."""
+        detector = LanguageDetector()
+        detector.detector = Mock(wraps=detector.detector)
+        text = "Hello, this is a test sentence in English."
+
+        first = detector.detect_with_confidence(text)
+        second = detector.detect_with_confidence(text)
+
+        assert first == second
+        detector.detector.compute_language_confidence_values.assert_called_once_with(text)
+
+
+class TestLanguageDetectorScriptFastPath:
+    """Tests for the Unicode script fast path in detect."""
+
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("안녕하세요, 이것은 한국어 테스트 문장입니다.", "ko"),
+            ("こんにちは、これは日本語のテスト文です。", "ja"),
+            ("你好，这是中文。", "zh"),
+            ("Привет, это русский.", "ru"),
+        ],
+    )
+    def test_dominant_script_skips_lingua(self, text, expected):
+        """Test that single-script texts are detected without lingua."""
+        detector = LanguageDetector()
+        detector.detector = Mock(wraps=detector.detector)
+
+        assert detector.detect(text) == expected
+        detector.detector.detect_language_of.assert_not_called()
+
+    def test_latin_text_uses_lingua(self):
+        """Test that Latin-script texts fall through to lingua."""
+        detector = LanguageDetector()
+        detector.detector = Mock(wraps=detector.detector)
+
+        assert detector.detect("Bonjour, c'est français.") == "fr"
+        detector.detector.detect_language_of.assert_called_once()
+
+    def test_mixed_script_uses_lingua(self):
+        """Test that texts without a dominant script fall through to lingua."""
+        detector = LanguageDetector()
+        detector.detector = Mock(wraps=detector.detector)
+
+        detector.detect("Hello 안녕하세요 World 세계")
+
+        detector.detector.detect_language_of.assert_called_once()
+
+
 class TestLanguageDetectorDetectWithConfidence:
     """Tests for detect_with_confidence method."""
 
@@ -200,6 +284,22 @@ class TestLanguageDetectorIsLanguage:
 
         # Result depends on actual confidence, but should not error
 
+    def test_is_language_scores_only_expected_language(self):
+        """Test is_language skips the full confidence ranking."""
+        detector = LanguageDetector()
+        detector.detector = Mock(wraps=detector.detector)
+
+        assert detector.is_language("This is clearly English text.", "en") is True
+
+        detector.detector.compute_language_confidence_values.assert_not_called()
+        detector.detector.compute_language_confidence.assert_called_once()
+
+    def test_is_language_returns_false_for_unsupported_code(self):
+        """Test is_language returns False for an unmapped language code."""
+        detector = LanguageDetector()
+
+        assert detector.is_language("This is clearly English text.", "xx") is False
+
 
 class TestGetLanguageDetector:
     """Tests for get_language_detector singleton."""
@@ -0,0 +1,40 @@
+"""Unit tests for LanguageSelector."""
+
+import pytest
+
+from core.config import SORTED_LANGUAGES, LanguageCode
+from ui.language_selector import LanguageSelector
+
+
+class TestLanguageSelector:
+    """Test suite for LanguageSelector."""
+
+    def test_items_follow_display_name_order(self, qapp):
+        """Test items list auto detect first, then languages by display name."""
+        selector = LanguageSelector(auto_label="Auto")
+
+        items = [(selector.itemText(i), selector.itemData(i)) for i in range(selector.count())]
+
+        assert items[0] == ("Auto", LanguageCode.AUTO.value)
+        assert items[1:] == [(lang.display_name, lang.code.value) for lang in SORTED_LANGUAGES]
+
+    @pytest.mark.parametrize("include_auto", [True, False])
+    def test_set_language_selects_matching_item(self, qapp, include_auto):
+        """Test set_language selects the item with the given code."""
+        selector = LanguageSelector(include_auto=include_auto)
+
+        for index in range(selector.count()):
+            code = selector.itemData(index)
+            assert selector.set_language(code) is True
+            assert selector.currentIndex() == index
+            assert selector.get_selected_language() == code
+
+        assert selector.set_language("xx") is False
+
+    def test_get_language_display_name(self, qapp):
+        """Test display names for languages, auto detect and unknown codes."""
+        selector = LanguageSelector(auto_label="Auto")
+
+        assert selector.get_language_display_name("ko") == "한국어"
+        assert selector.get_language_display_name(LanguageCode.AUTO.value) == "Auto"
+        assert selector.get_language_display_name("xx") == "xx"
@@ -0,0 +1,279 @@
+"""Unit tests for MainWindow."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PySide6.QtCore import QObject, QSettings, Signal
+from PySide6.QtWidgets import QPlainTextEdit
+
+from core.error_handler import ErrorType, TranslationError
+from core.history_store import HistoryEntry, HistoryStore
+from ui.main_window import MainWindow
+
+
+class _FakeTranslationService(QObject):
+    """TranslationService stand-in exposing the signals MainWindow uses."""
+
+    translationStarted = Signal(str)
+    translationProgress = Signal(str, int, str)
+    translationComplete = Signal(str, str, str)
+    translationError = Signal(str, object)
+    translationRetrying = Signal(str, int, int, int)
+
+    def __init__(self):
+        super().__init__()
+        self.translate = MagicMock(return_value="task-1")
+
+
+@pytest.fixture
+def translation_service(qapp) -> _FakeTranslationService:
+    """Create a fake translation service."""
+    return _FakeTranslationService()
+
+
+@pytest.fixture
+def history_store(qapp) -> HistoryStore:
+    """Create a HistoryStore with mock settings."""
+    return HistoryStore(MagicMock(spec=QSettings))
+
+
+@pytest.fixture
+def window(qtbot, translation_service, mock_preferences, history_store) -> MainWindow:
+    """Create a MainWindow over fake services."""
+    mock_preferences.get = MagicMock(side_effect=lambda key, default=None: default)
+    window = MainWindow(translation_service, mock_preferences, history_store)
+    qtbot.addWidget(window)
+    return window
+
+
+class TestHistoryPanelStartup:
+    """Tests for how MainWindow sets up the history panel."""
+
+    def test_hidden_panel_builds_list_when_shown(
+        self, qtbot, translation_service, mock_preferences, history_store
+    ) -> None:
+        """A panel hidden by preference should not build its list until shown."""
+        prefs = {"history_panel_visible": False}
+        mock_preferences.get = MagicMock(side_effect=prefs.get)
+        window = MainWindow(translation_service, mock_preferences, history_store)
+        qtbot.addWidget(window)
+        window.show()
+
+        assert window._history_panel._expanded_content is None
+
+        window._on_toggle_history_panel(True)
+
+        assert window._history_panel._expanded_content is not None
+
+
+class TestMainWindow:
+    """Tests for MainWindow."""
+
+    def test_text_panes_are_plain_text(self, window: MainWindow) -> None:
+        """Source and result panes should be plain-text editors."""
+        assert isinstance(window.source_text, QPlainTextEdit)
+        assert isinstance(window.result_text, QPlainTextEdit)
+        assert window.result_text.isReadOnly()
+
+    def test_text_changes_are_debounced(self, window: MainWindow, qtbot) -> None:
+        """Edits should update the counter and button once typing pauses."""
+        for text in ("H", "He", "Hello"):
+            window.source_text.setPlainText(text)
+
+        assert not window.translate_button.isEnabled()
+
+        qtbot.waitUntil(window.translate_button.isEnabled, timeout=1000)
+        assert window.char_counter_label.text() == "5 / 2,000"
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("", 0),
+            ("  \n\t ", 0),
+            ("  Hello \n", 5),
+            ("a\n\nb", 4),
+            ("\u3000안녕\u3000", 2),
+            ("😀 x😀\n𠀀", 6),
+        ],
+    )
+    def test_source_length_ignores_surrounding_whitespace(
+        self, window: MainWindow, text: str, expected: int
+    ) -> None:
+        """The counted length should match the stripped source text."""
+        window.source_text.setPlainText(text)
+        window._apply_text_changed_now()
+
+        assert window._source_text_length() == expected
+        assert window.translate_button.isEnabled() == bool(expected)
+
+    def test_char_counter_restyles_only_on_threshold(self, window: MainWindow) -> None:
+        """The counter style sheet should only be set when its color changes."""
+        label = window.char_counter_label
+        label.setStyleSheet = MagicMock(wraps=label.setStyleSheet)
+
+        window._update_char_counter(10, 100)
+        window._update_char_counter(85, 100)
+        window._update_char_counter(90, 100)
+        window._update_char_counter(101, 100)
+
+        assert label.text() == "101 / 100"
+        assert [c.args[0] for c in label.setStyleSheet.call_args_list] == [
+            "color: #FF9500; font-size: 12px;",
+            "color: #FF3B30; font-size: 12px;",
+        ]
+
+    def test_history_selection_updates_immediately(self, window: MainWindow) -> None:
+        """Loading a history entry should update the input state once, at once."""
+        entry = HistoryEntry.create("Hello", "안녕", "en", "ko")
+        changes: list[None] = []
+        window.source_text.textChanged.connect(lambda: changes.append(None))
+
+        window._on_history_entry_selected(entry)
+
+        assert changes == []
+
+        assert window.translate_button.isEnabled()
+        assert window.result_text.toPlainText() == "안녕"
+        assert window.status_label.text() == "✓ 기록에서 불러옴"
+        assert not window._text_changed_timer.isActive()
+
+    def test_translate_clicks_submit_immediately(
+        self, window: MainWindow, translation_service
+    ) -> None:
+        """Each explicit click should submit at once, without debouncing."""
+        window.source_text.setPlainText("Hello")
+        window._on_translate_clicked()
+        window.source_text.setPlainText("Hello world")
+        window._on_translate_clicked()
+
+        assert [c.kwargs["text"] for c in translation_service.translate.call_args_list] == [
+            "Hello",
+            "Hello world",
+        ]
+        assert all(
+            c.kwargs["debounce"] is False for c in translation_service.translate.call_args_list
+        )
+
+    def test_translation_error_shows_type_icon(
+        self, window: MainWindow, translation_service
+    ) -> None:
+        """A structured error should be shown with its type's icon."""
+        window.source_text.setPlainText("Hello")
+        window._on_translate_clicked()
+        error = TranslationError(
+            error_type=ErrorType.MEMORY,
+            message="CUDA out of memory",
+            cause="메모리 부족",
+            solution="다시 시도",
+            is_retryable=False,
+        )
+
+        translation_service.translationError.emit("task-1", error)
+
+        assert window.status_label.text() == "💾 번역 실패 - 메모리 부족"
+        assert window.result_text.toPlainText().startswith("💾 번역 오류")
+
+    @pytest.mark.parametrize(
+        ("message", "expected_start"),
+        [
+            ("CUDA Out Of Memory during model load", "메모리가 부족합니다"),
+            ("Request TIMEOUT", "번역 시간이 초과되었습니다"),
+            ("Failed to load the model", "번역 모델을 불러올 수 없습니다"),
+            ("Model not found", "Model not found"),
+            ("Input is empty", "번역할 텍스트를 입력해 주세요"),
+            ("Text too long", "텍스트가 너무 깁니다"),
+        ],
+    )
+    def test_user_friendly_error(
+        self, window: MainWindow, message: str, expected_start: str
+    ) -> None:
+        """Error keywords should map to friendly messages by priority."""
+        assert window._get_user_friendly_error(message).startswith(expected_start)
+
+    def test_swap_languages_swaps_texts(self, window: MainWindow) -> None:
+        """Swapping should exchange languages and texts, repeatedly."""
+        window.source_lang_selector.set_language("en")
+        window.target_lang_selector.set_language("ko")
+        window.source_text.setPlainText("Hello")
+        window.result_text.setPlainText("안녕하세요")
+
+        window._on_swap_languages()
+
+        assert window.source_lang_selector.get_selected_language() == "ko"
+        assert window.source_text.toPlainText() == "안녕하세요"
+        assert window.result_text.toPlainText() == "Hello"
+        assert window.result_text.isReadOnly()
+        assert window.char_counter_label.text() == "5 / 2,000"
+
+        window.source_text.setPlainText("반가워요")
+        window._on_swap_languages()
+
+        assert window.source_text.toPlainText() == "Hello"
+        assert window.result_text.toPlainText() == "반가워요"
+
+    def test_swap_keeps_source_without_result(self, window: MainWindow) -> None:
+        """Without a result, swapping should only exchange the languages."""
+        window.source_lang_selector.set_language("en")
+        window.source_text.setPlainText("Hello")
+
+        window._on_swap_languages()
+
+        assert window.source_text.toPlainText() == "Hello"
+        assert window.result_text.toPlainText() == ""
+
+    def test_expiring_status_does_not_clear_newer_message(
+        self, window: MainWindow, translation_service
+    ) -> None:
+        """A message shown after a timed one should outlive its timeout."""
+        window.result_text.setPlainText("안녕")
+        window._on_copy_clicked()
+        assert window.status_timer.isActive()
+
+        window.source_text.setPlainText("Hello")
+        window._on_translate_clicked()
+        translation_service.translationStarted.emit("task-1")
+
+        assert not window.status_timer.isActive()
+        assert window.status_label.text() == "번역 중..."
+
+    def test_translation_complete_shows_result(
+        self, window: MainWindow, translation_service, history_store
+    ) -> None:
+        """A completed translation should fill the result pane and history."""
+        window.source_text.setPlainText("Hello")
+        window._on_translate_clicked()
+
+        translation_service.translationComplete.emit("task-1", "en", "안녕")
+
+        assert window.result_text.toPlainText() == "안녕"
+        assert window.copy_button.isEnabled()
+        assert [e.source_text for e in history_store.entries] == ["Hello"]
+
+
+class TestUpdateCheck:
+    """Tests for the background update check."""
+
+    def test_overlapping_checks_are_ignored(self, window: MainWindow, qtbot) -> None:
+        """A second check while one is in flight should not start another thread."""
+        release = threading.Event()
+        checker = MagicMock()
+        checker.check.side_effect = lambda: release.wait(5) and MagicMock(status="latest")
+
+        with (
+            patch("core.update_checker.UpdateChecker", return_value=checker),
+            patch("ui.update_dialog.UpdateDialog") as dialog_class,
+        ):
+            window._on_check_for_updates()
+            thread = window._update_thread
+            window._on_check_for_updates()
+
+            assert window._update_thread is thread
+            assert not window._check_updates_action.isEnabled()
+
+            release.set()
+            qtbot.waitUntil(window._check_updates_action.isEnabled, timeout=5000)
+
+        assert checker.check.call_count == 1
+        dialog_class.return_value.exec.assert_called_once()
+        assert window._update_thread is None
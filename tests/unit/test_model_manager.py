@@ -1,9 +1,14 @@
 """Unit tests for ModelManager."""
 
+import threading
+
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 
-from src.core.model_manager import ModelManager
+import torch
+from transformers import BatchEncoding, LlamaConfig, LlamaForCausalLM
+
+from src.core.model_manager import ModelManager, _prompt_bucket
 from src.core.config import ModelConfig
 
 
@@ -151,6 +156,16 @@ class TestModelManagerTranslate:
         with pytest.raises(ValueError, match="Text too long"):
             manager.translate(long_text)
 
+    def test_translate_length_limit_follows_config(self):
+        """Test the length limit comes from config.performance.max_text_length."""
+        manager = ModelManager()
+        manager._is_loaded = True
+
+        with patch("src.core.model_manager.config") as mock_config:
+            mock_config.performance.max_text_length = 10
+            with pytest.raises(ValueError, match=r"11 chars \(max 10\)"):
+                manager.translate("a" * 11)
+
     def test_translate_accepts_max_length_text(self):
         """Test translate accepts text at max length (2000 chars)."""
         manager = ModelManager()
@@ -277,6 +292,25 @@ class TestModelManagerInitialize:
         assert result is True
         assert manager._is_loaded is True
         assert manager.device == "cpu"
+        assert manager.effective_quantization == "none"
+
+    @patch("src.core.model_manager.AutoTokenizer")
+    @patch("src.core.model_manager.AutoModelForCausalLM")
+    def test_initialize_records_resolved_quantization(
+        self, mock_model_class, mock_tokenizer_class
+    ):
+        """Test initialization records the quantization mode actually applied."""
+        manager = ModelManager(
+            model_config=ModelConfig(
+                device="cpu", quantization="int8", force_quantization=True
+            )
+        )
+        mock_tokenizer_class.from_pretrained.return_value = Mock()
+        mock_model_class.from_pretrained.return_value = Mock()
+
+        manager.initialize()
+
+        assert manager.effective_quantization == "int8"
 
     @patch("src.core.model_manager.AutoTokenizer")
     def test_initialize_failure_raises_runtime_error(self, mock_tokenizer_class):
@@ -308,3 +342,743 @@ class TestModelManagerInitialize:
 
         # Should have called progress multiple times
         assert callback.call_count >= 5
+
+
+def _mock_loaded_manager() -> ModelManager:
+    """Create a manager with a mock model and a tokenizer returning real tensors."""
+    manager = ModelManager()
+    manager.model = MagicMock()
+    manager.tokenizer = MagicMock(pad_token_id=0, eos_token_id=2)
+    manager.tokenizer.return_value = BatchEncoding(
+        {
+            "input_ids": torch.ones(1, 5, dtype=torch.long),
+            "attention_mask": torch.ones(1, 5, dtype=torch.long),
+        }
+    )
+    return manager
+
+
+class TestModelManagerCompile:
+    """Tests for torch.compile integration."""
+
+    @patch("src.core.model_manager.AutoTokenizer")
+    @patch("src.core.model_manager.AutoModelForCausalLM")
+    @patch("src.core.model_manager.torch.compile")
+    def test_initialize_skips_compile_on_cpu(
+        self, mock_compile, mock_model_class, mock_tokenizer_class
+    ):
+        """Test that the model is not compiled on CPU."""
+        manager = ModelManager(model_config=ModelConfig(device="cpu"))
+        mock_tokenizer_class.from_pretrained.return_value = Mock()
+        mock_model_class.from_pretrained.return_value = Mock()
+
+        manager.initialize()
+
+        mock_compile.assert_not_called()
+
+    @patch("src.core.model_manager.torch.compile")
+    def test_compile_model_wraps_forward_and_warms_up(self, mock_compile):
+        """Test that _compile_model replaces forward and runs a warm-up generate."""
+        manager = _mock_loaded_manager()
+        compiled = Mock()
+        mock_compile.return_value = compiled
+        shapes = manager._warmup_shapes()
+
+        manager._compile_model()
+
+        assert manager.model.forward is compiled
+        assert manager.model.generate.call_count == len(shapes)
+
+    @patch("src.core.model_manager.torch.compile")
+    def test_compile_model_warms_up_common_shapes(self, mock_compile):
+        """Test that paragraph-sized prompt buckets are warmed up with their budgets."""
+        manager = _mock_loaded_manager()
+        progress = []
+        manager.set_progress_callback(lambda p, m: progress.append(m))
+
+        manager._compile_model()
+
+        warmed = [
+            (c.kwargs["input_ids"].shape[1], c.kwargs["max_new_tokens"])
+            for c in manager.model.generate.call_args_list
+        ]
+        # The 5-token template plus 200 text tokens ends in the 256 bucket
+        assert warmed == [(32, 128), (64, 512), (128, 512), (256, 512)]
+        for prompt_bucket, max_new_tokens in warmed:
+            assert manager._max_new_tokens(prompt_bucket) == max_new_tokens
+        assert progress == [f"Compiling model ({i}/4)..." for i in range(1, 5)]
+
+    @patch("src.core.model_manager.torch.compile", side_effect=RuntimeError("unsupported"))
+    def test_compile_model_falls_back_to_eager(self, mock_compile):
+        """Test that a compile failure keeps the eager forward and cache setting."""
+        manager = _mock_loaded_manager()
+        manager.model.generation_config.cache_implementation = "offloaded"
+        eager_forward = manager.model.forward
+
+        manager._compile_model()
+
+        assert manager.model.forward is eager_forward
+        assert manager._use_static_cache is False
+        assert manager.model.generation_config.cache_implementation == "offloaded"
+
+    @patch("src.core.model_manager.torch.compile")
+    def test_compile_model_enables_static_cache(self, mock_compile):
+        """Test that a successful compile switches generation to a static cache."""
+        manager = _mock_loaded_manager()
+
+        manager._compile_model()
+
+        assert manager._use_static_cache is True
+        assert manager.model.generation_config.cache_implementation == "static"
+
+
+class TestModelManagerPromptBuckets:
+    """Tests for static-shape prompt padding."""
+
+    @pytest.mark.parametrize(
+        "length, bucket",
+        [(1, 32), (32, 32), (33, 64), (100, 128), (512, 512), (513, 1024)],
+    )
+    def test_prompt_bucket(self, length, bucket):
+        """Test prompt lengths round up to power-of-two buckets."""
+        assert _prompt_bucket(length) == bucket
+
+    def test_pad_to_bucket_left_pads_inputs(self):
+        """Test inputs are left-padded with the pad token and a zero mask."""
+        manager = ModelManager()
+        manager.tokenizer = Mock(pad_token_id=0, eos_token_id=2)
+        inputs = {
+            "input_ids": torch.ones(1, 40, dtype=torch.long),
+            "attention_mask": torch.ones(1, 40, dtype=torch.long),
+        }
+
+        padded = manager._pad_to_bucket(inputs)
+
+        assert padded["input_ids"].shape == (1, 64)
+        assert padded["input_ids"][0, :24].eq(0).all()
+        assert padded["attention_mask"][0, :24].eq(0).all()
+        assert padded["attention_mask"][0, 24:].eq(1).all()
+
+
+class TestModelManagerNewTokenBuckets:
+    """Tests for bucketed max_new_tokens."""
+
+    @pytest.mark.parametrize(
+        "input_length, expected",
+        [(1, 128), (42, 128), (43, 512), (170, 512), (171, 512), (1000, 512)],
+    )
+    def test_budget_is_bucketed_and_capped(self, input_length, expected):
+        """Test budgets snap to a bucket and never exceed the config limit."""
+        manager = ModelManager()
+
+        assert manager._max_new_tokens(input_length) == expected
+
+    def test_budget_uses_larger_bucket_when_allowed(self):
+        """Test long prompts get the next bucket when the config allows it."""
+        manager = ModelManager(model_config=ModelConfig(max_new_tokens=4096))
+
+        assert manager._max_new_tokens(171) == 2048
+        assert manager._max_new_tokens(1000) == 4096
+
+    def test_generate_receives_bucketed_budget(self):
+        """Test translate() passes the bucketed budget to generate()."""
+        manager = _tiny_loaded_manager()
+
+        with patch.object(
+            manager.model, "generate", wraps=manager.model.generate
+        ) as mock_generate:
+            manager.translate("hello there", target_lang="Korean")
+
+        assert mock_generate.call_args.kwargs["max_new_tokens"] in (128, 512)
+
+
+class TestModelManagerAttention:
+    """Tests for attention kernel selection."""
+
+    def test_attn_implementation_is_sdpa_on_cpu(self):
+        """Test CPU uses PyTorch SDPA attention."""
+        manager = ModelManager()
+        manager.device = "cpu"
+
+        assert manager._get_attn_implementation() == "sdpa"
+
+    @patch("src.core.model_manager.importlib.util.find_spec", return_value=Mock())
+    def test_attn_implementation_is_flash_on_cuda(self, mock_find_spec):
+        """Test CUDA uses FlashAttention-2 when flash-attn is installed."""
+        manager = ModelManager()
+        manager.device = "cuda"
+
+        assert manager._get_attn_implementation() == "flash_attention_2"
+
+    @patch("src.core.model_manager.importlib.util.find_spec", return_value=None)
+    def test_attn_implementation_without_flash_attn(self, mock_find_spec):
+        """Test CUDA falls back to SDPA without flash-attn."""
+        manager = ModelManager()
+        manager.device = "cuda"
+
+        assert manager._get_attn_implementation() == "sdpa"
+
+    @patch("src.core.model_manager.AutoTokenizer")
+    @patch("src.core.model_manager.AutoModelForCausalLM")
+    def test_initialize_falls_back_to_eager_attention(
+        self, mock_model_class, mock_tokenizer_class
+    ):
+        """Test loading retries with eager attention when SDPA is rejected."""
+        manager = ModelManager(model_config=ModelConfig(device="cpu"))
+        mock_tokenizer_class.from_pretrained.return_value = Mock()
+        mock_model_class.from_pretrained.side_effect = [ValueError("no sdpa"), Mock()]
+
+        assert manager.initialize() is True
+
+        calls = mock_model_class.from_pretrained.call_args_list
+        assert calls[0].kwargs["attn_implementation"] == "sdpa"
+        assert calls[1].kwargs["attn_implementation"] == "eager"
+
+
+class TestModelManagerDtype:
+    """Tests for dtype selection."""
+
+    @patch("torch.cuda.is_bf16_supported", return_value=True)
+    def test_dtype_is_bfloat16_on_ampere_cuda(self, mock_bf16):
+        """Test CUDA with bf16 support loads in bfloat16."""
+        manager = ModelManager()
+        manager.device = "cuda"
+
+        assert manager._get_dtype() is torch.bfloat16
+
+    @patch("torch.cuda.is_bf16_supported", return_value=False)
+    def test_dtype_is_float16_on_pre_ampere_cuda(self, mock_bf16):
+        """Test CUDA without bf16 support loads in float16."""
+        manager = ModelManager()
+        manager.device = "cuda"
+
+        assert manager._get_dtype() is torch.float16
+
+    def test_dtype_is_float16_on_mps(self):
+        """Test MPS loads in float16."""
+        manager = ModelManager()
+        manager.device = "mps"
+
+        assert manager._get_dtype() is torch.float16
+
+    def test_dtype_uses_config_on_cpu(self):
+        """Test CPU keeps the configured dtype."""
+        manager = ModelManager(model_config=ModelConfig(dtype="float32"))
+        manager.device = "cpu"
+
+        assert manager._get_dtype() is torch.float32
+
+
+class TestModelManagerQuantization:
+    """Tests for quantization selection."""
+
+    @patch("torch.cuda.get_device_properties")
+    def test_auto_uses_int4_on_small_cuda_gpu(self, mock_props):
+        """Test auto quantization picks int4 on CUDA GPUs under 16 GB."""
+        mock_props.return_value = Mock(total_memory=8 * 1024**3)
+        manager = ModelManager(model_config=ModelConfig(quantization="auto"))
+        manager.device = "cuda"
+
+        quantization_config = manager._get_quantization_config()
+
+        assert quantization_config.weights == "int4"
+        assert quantization_config.modules_to_not_convert == ["lm_head"]
+
+    @patch("torch.cuda.get_device_properties")
+    def test_auto_keeps_full_precision_on_large_cuda_gpu(self, mock_props):
+        """Test auto quantization leaves large GPUs unquantized."""
+        mock_props.return_value = Mock(total_memory=24 * 1024**3)
+        manager = ModelManager(model_config=ModelConfig(quantization="auto"))
+        manager.device = "cuda"
+
+        assert manager._get_quantization_config() is None
+
+    def test_auto_keeps_full_precision_on_cpu(self):
+        """Test auto quantization is disabled off CUDA."""
+        manager = ModelManager(model_config=ModelConfig(quantization="auto"))
+        manager.device = "cpu"
+
+        assert manager._get_quantization_config() is None
+
+    def test_explicit_int8_is_honored(self):
+        """Test an explicit quantization setting is used as-is."""
+        manager = ModelManager(model_config=ModelConfig(quantization="int8"))
+        manager.device = "cuda"
+
+        assert manager._get_quantization_config().weights == "int8"
+
+    @pytest.mark.parametrize("device", ["mps", "cpu"])
+    def test_explicit_quantization_disabled_off_cuda(self, device):
+        """Test int8 is skipped on devices without accelerated kernels."""
+        manager = ModelManager(model_config=ModelConfig(quantization="int8"))
+        manager.device = device
+
+        assert manager._get_quantization_config() is None
+
+    def test_force_quantization_overrides_device_check(self):
+        """Test force_quantization keeps int8 on CPU."""
+        manager = ModelManager(
+            model_config=ModelConfig(quantization="int8", force_quantization=True)
+        )
+        manager.device = "cpu"
+
+        assert manager._get_quantization_config().weights == "int8"
+
+
+class TestModelManagerFastLoad:
+    """Tests for the direct-to-device safetensors loader."""
+
+    @patch("src.core.model_manager.AutoTokenizer")
+    @patch("src.core.model_manager.AutoModelForCausalLM")
+    def test_initialize_uses_fast_loader_on_gpu(self, mock_model_class, mock_tokenizer_class):
+        """Test unquantized GPU loads go through the fast loader when enabled."""
+        manager = ModelManager(
+            model_config=ModelConfig(
+                device="mps", quantization="none", compile_model=False, fast_load=True
+            )
+        )
+        mock_tokenizer_class.from_pretrained.return_value = Mock()
+        fast_model = Mock()
+
+        with patch.object(manager, "_fast_load_model", return_value=fast_model) as fast_load:
+            manager.initialize()
+
+        fast_load.assert_called_once()
+        assert manager.model is fast_model
+        mock_model_class.from_pretrained.assert_not_called()
+
+    @patch("src.core.model_manager.AutoTokenizer")
+    @patch("src.core.model_manager.AutoModelForCausalLM")
+    def test_initialize_falls_back_when_fast_load_fails(
+        self, mock_model_class, mock_tokenizer_class
+    ):
+        """Test from_pretrained is used when the fast loader gives up."""
+        manager = ModelManager(
+            model_config=ModelConfig(
+                device="mps", quantization="none", compile_model=False, fast_load=True
+            )
+        )
+        mock_tokenizer_class.from_pretrained.return_value = Mock()
+
+        with patch.object(manager, "_fast_load_model", return_value=None):
+            manager.initialize()
+
+        mock_model_class.from_pretrained.assert_called_once()
+
+    @patch("src.core.model_manager.AutoTokenizer")
+    @patch("src.core.model_manager.AutoModelForCausalLM")
+    def test_initialize_skips_fast_loader_on_cpu(self, mock_model_class, mock_tokenizer_class):
+        """Test CPU loads keep using from_pretrained."""
+        manager = ModelManager(model_config=ModelConfig(device="cpu"))
+        mock_tokenizer_class.from_pretrained.return_value = Mock()
+
+        with patch.object(manager, "_fast_load_model") as fast_load:
+            manager.initialize()
+
+        fast_load.assert_not_called()
+
+    @patch("src.core.model_manager.AutoTokenizer")
+    @patch("src.core.model_manager.AutoModelForCausalLM")
+    def test_fast_loader_is_opt_in(self, mock_model_class, mock_tokenizer_class):
+        """Test GPU loads use from_pretrained unless fast_load is enabled."""
+        manager = ModelManager(
+            model_config=ModelConfig(device="mps", quantization="none", compile_model=False)
+        )
+        mock_tokenizer_class.from_pretrained.return_value = Mock()
+
+        with patch.object(manager, "_fast_load_model") as fast_load:
+            manager.initialize()
+
+        fast_load.assert_not_called()
+        mock_model_class.from_pretrained.assert_called_once()
+
+    def test_tensors_off_device_lists_unloaded_params_and_buffers(self):
+        """Test meta parameters and buffers on another device are reported."""
+        manager = ModelManager(model_config=ModelConfig())
+        manager.device = "cpu"
+        model = torch.nn.Module()
+        model.loaded = torch.nn.Linear(2, 2)
+        with torch.device("meta"):
+            model.missing = torch.nn.Linear(2, 2)
+        model.register_buffer("inv_freq", torch.ones(2, device="meta"), persistent=False)
+
+        assert manager._tensors_off_device(model) == [
+            "missing.weight",
+            "missing.bias",
+            "inv_freq",
+        ]
+        assert manager._tensors_off_device(model.loaded) == []
+
+    def test_fast_load_model_returns_none_on_error(self):
+        """Test the fast loader reports failure instead of raising."""
+        manager = ModelManager(model_config=ModelConfig(model_id="missing/model"))
+        manager.device = "cuda"
+
+        with patch("huggingface_hub.snapshot_download", side_effect=OSError("offline")):
+            assert manager._fast_load_model("sdpa") is None
+
+
+class _CharTokenizer:
+    """Minimal tokenizer mapping each character to its code point."""
+
+    eos_token_id = 1
+    pad_token_id = 0
+
+    def __init__(self, merge_boundary: bool = False):
+        self.merge_boundary = merge_boundary
+        self.render_count = 0
+
+    def apply_chat_template(self, messages, tokenize=False, add_generation_prompt=True):
+        self.render_count += 1
+        system, user = messages[0]["content"], messages[1]["content"]
+        return f"<user>{system}\n{user}<end><model>"
+
+    def __call__(self, text, return_tensors="pt", add_special_tokens=True):
+        ids = [ord(ch) for ch in text]
+        if self.merge_boundary and "\nHello" in text:
+            # Simulate a merge across the prefix/user-text boundary
+            ids = ids[:1]
+        if add_special_tokens:
+            ids = [2] + ids
+        input_ids = torch.tensor([ids], dtype=torch.long)
+        attention_mask = torch.ones_like(input_ids)
+        return BatchEncoding({"input_ids": input_ids, "attention_mask": attention_mask})
+
+    def decode(self, ids, skip_special_tokens=True):
+        return "".join(chr(int(i)) for i in ids if not skip_special_tokens or int(i) > 2)
+
+
+class TestModelManagerPromptCache:
+    """Tests for the per-language chat-template prefix cache."""
+
+    def test_cached_prompt_matches_full_tokenization(self):
+        """Test prefix + user tokens equal tokenizing the whole prompt."""
+        manager = ModelManager()
+        manager.tokenizer = _CharTokenizer()
+
+        manager._tokenize_prompt("First text", "Korean")
+        cached = manager._tokenize_prompt("Second text", "Korean")
+        full = manager.tokenizer(manager._render_prompt("Second text", "Korean"))
+
+        assert torch.equal(cached["input_ids"], full["input_ids"])
+        assert torch.equal(cached["attention_mask"], full["attention_mask"])
+
+    def test_prompt_template_rendered_once_per_language(self):
+        """Test repeated translations skip the chat template render."""
+        manager = ModelManager()
+        manager.tokenizer = _CharTokenizer()
+
+        manager._tokenize_prompt("First text", "Korean")
+        renders = manager.tokenizer.render_count
+        manager._tokenize_prompt("Second text", "Korean")
+        manager._tokenize_prompt("Third text", "Korean")
+
+        assert manager.tokenizer.render_count == renders
+        assert manager._prompt_parts["Korean"] is not None
+
+    def test_prompt_cache_disabled_on_token_mismatch(self):
+        """Test a split that changes tokenization falls back to full prompts."""
+        manager = ModelManager()
+        manager.tokenizer = _CharTokenizer(merge_boundary=True)
+
+        manager._tokenize_prompt("Hello", "Korean")
+
+        assert manager._prompt_parts["Korean"] is None
+
+    def test_unload_clears_prompt_cache(self):
+        """Test unload drops prefixes tied to the old tokenizer."""
+        manager = ModelManager()
+        manager.model = Mock()
+        manager.tokenizer = _CharTokenizer()
+        manager._tokenize_prompt("First text", "Korean")
+
+        manager.unload()
+
+        assert manager._prompt_parts == {}
+
+
+def _tiny_loaded_manager() -> ModelManager:
+    """Create a manager around a tiny random Llama model and the char tokenizer."""
+    torch.manual_seed(0)
+    model_config = LlamaConfig(
+        vocab_size=256,
+        hidden_size=32,
+        intermediate_size=64,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        num_key_value_heads=2,
+    )
+    manager = ModelManager()
+    manager.model = LlamaForCausalLM(model_config).eval()
+    manager.tokenizer = _CharTokenizer()
+    manager._is_loaded = True
+    return manager
+
+
+class TestModelManagerPrefixKV:
+    """Tests for reusing the prompt-prefix KV cache across translations."""
+
+    def test_prefix_kv_matches_full_prefill(self):
+        """Test decoding from the cached prefix gives the same translation."""
+        manager = _tiny_loaded_manager()
+        manager.translate("hello there", target_lang="Korean")
+        assert "Korean" in manager._prefix_kv
+
+        with_prefix = manager.translate("hello world", target_lang="Korean")
+        with patch.object(manager, "_get_prefix_kv", return_value=None):
+            without_prefix = manager.translate("hello world", target_lang="Korean")
+
+        assert with_prefix == without_prefix
+
+    def test_prefix_kv_not_mutated_by_generate(self):
+        """Test generation works on a copy of the stored prefix cache."""
+        manager = _tiny_loaded_manager()
+        manager.translate("hello there", target_lang="Korean")
+        cached_length = manager._prefix_kv["Korean"].get_seq_length()
+
+        manager.translate("hello world", target_lang="Korean")
+
+        assert manager._prefix_kv["Korean"].get_seq_length() == cached_length
+
+    def test_prefix_kv_skipped_with_static_cache(self):
+        """Test padded static-cache prompts do not reuse the prefix cache."""
+        manager = _tiny_loaded_manager()
+        manager._tokenize_prompt("hello there", "Korean")
+        manager._use_static_cache = True
+
+        assert manager._get_prefix_kv("Korean") is None
+
+    def test_unload_clears_prefix_kv(self):
+        """Test unload drops cached prefix KV tensors."""
+        manager = _tiny_loaded_manager()
+        manager.translate("hello there", target_lang="Korean")
+
+        manager.unload()
+
+        assert manager._prefix_kv == {}
+
+
+class TestModelManagerPromptLookup:
+    """Tests for prompt lookup (n-gram speculative) decoding."""
+
+    def test_prompt_lookup_matches_greedy_output(self):
+        """Test prompt lookup decoding leaves greedy translations unchanged."""
+        manager = _tiny_loaded_manager()
+        with patch.object(manager, "_get_prefix_kv", return_value=None):
+            greedy = manager.translate("hello hello hello", target_lang="Korean")
+
+        manager.config = ModelConfig(prompt_lookup_num_tokens=5)
+        with patch.object(
+            manager.model, "generate", wraps=manager.model.generate
+        ) as mock_generate:
+            assisted = manager.translate("hello hello hello", target_lang="Korean")
+
+        assert assisted == greedy
+        assert mock_generate.call_args.kwargs["prompt_lookup_num_tokens"] == 5
+        assert "past_key_values" not in mock_generate.call_args.kwargs
+
+    def test_prompt_lookup_disabled_by_default(self):
+        """Test the default config decodes without prompt lookup."""
+        manager = _tiny_loaded_manager()
+
+        with patch.object(
+            manager.model, "generate", wraps=manager.model.generate
+        ) as mock_generate:
+            manager.translate("hello there", target_lang="Korean")
+
+        assert "prompt_lookup_num_tokens" not in mock_generate.call_args.kwargs
+
+
+class TestModelManagerRepetitionControls:
+    """Tests for optional repetition penalty and n-gram blocking."""
+
+    def test_repetition_controls_disabled_by_default(self):
+        """Test the default config adds no repetition logits processors."""
+        manager = _tiny_loaded_manager()
+
+        with patch.object(
+            manager.model, "generate", wraps=manager.model.generate
+        ) as mock_generate:
+            manager.translate("hello there", target_lang="Korean")
+
+        assert "repetition_penalty" not in mock_generate.call_args.kwargs
+        assert "no_repeat_ngram_size" not in mock_generate.call_args.kwargs
+
+    def test_repetition_controls_passed_when_enabled(self):
+        """Test non-default repetition settings reach generate()."""
+        manager = _tiny_loaded_manager()
+        manager.config = ModelConfig(repetition_penalty=1.2, no_repeat_ngram_size=3)
+
+        with patch.object(
+            manager.model, "generate", wraps=manager.model.generate
+        ) as mock_generate:
+            manager.translate("hello there", target_lang="Korean")
+
+        assert mock_generate.call_args.kwargs["repetition_penalty"] == 1.2
+        assert mock_generate.call_args.kwargs["no_repeat_ngram_size"] == 3
+
+
+class TestModelManagerExecuTorch:
+    """Tests for the optional ExecuTorch backend."""
+
+    @patch("src.core.model_manager.AutoTokenizer")
+    @patch("src.core.model_manager.AutoModelForCausalLM")
+    def test_initialize_uses_executorch_when_available(
+        self, mock_model_class, mock_tokenizer_class
+    ):
+        """Test a successful export skips loading the PyTorch model."""
+        manager = ModelManager(model_config=ModelConfig(device="cpu", use_executorch=True))
+        mock_tokenizer_class.from_pretrained.return_value = Mock()
+        et_model = Mock()
+
+        with patch.object(manager, "_load_executorch_model", return_value=et_model):
+            assert manager.initialize() is True
+
+        assert manager._et_model is et_model
+        mock_model_class.from_pretrained.assert_not_called()
+
+    @patch("src.core.model_manager.AutoTokenizer")
+    @patch("src.core.model_manager.AutoModelForCausalLM")
+    def test_initialize_falls_back_without_executorch(
+        self, mock_model_class, mock_tokenizer_class
+    ):
+        """Test a missing ExecuTorch backend loads the PyTorch model."""
+        manager = ModelManager(model_config=ModelConfig(device="cpu", use_executorch=True))
+        mock_tokenizer_class.from_pretrained.return_value = Mock()
+
+        with patch.dict("sys.modules", {"optimum.executorch": None}):
+            manager.initialize()
+
+        assert manager._et_model is None
+        mock_model_class.from_pretrained.assert_called_once()
+
+    def test_translate_uses_executorch_program(self):
+        """Test translate decodes the tokens produced by the ExecuTorch program."""
+        manager = ModelManager()
+        manager.tokenizer = _CharTokenizer()
+        manager._et_model = Mock()
+        manager._et_model.generate.return_value = [ord(ch) for ch in "안녕"]
+        manager._is_loaded = True
+
+        assert manager.translate("Hello", target_lang="Korean") == "안녕"
+        assert manager._et_model.generate.call_args.kwargs["echo"] is False
+
+
+class TestModelManagerToDevice:
+    """Tests for host-to-device input transfer."""
+
+    def test_to_device_on_cpu_skips_pinning(self):
+        """Test CPU inputs are moved without pinned staging."""
+        manager = _tiny_loaded_manager()
+        inputs = manager.tokenizer("hello")
+
+        with patch("torch.Tensor.pin_memory") as mock_pin:
+            moved = manager._to_device(inputs)
+
+        mock_pin.assert_not_called()
+        assert moved["input_ids"].device.type == "cpu"
+        assert manager._copy_stream is None
+
+    @pytest.mark.skipif(not torch.cuda.is_available(), reason="requires CUDA")
+    def test_to_device_on_cuda_uses_side_stream(self):
+        """Test CUDA inputs are copied on the persistent side stream."""
+        manager = _tiny_loaded_manager()
+        manager.model.to("cuda")
+        inputs = manager.tokenizer("hello")
+
+        moved = manager._to_device(inputs)
+        stream = manager._copy_stream
+        manager._to_device(inputs)
+
+        assert moved["input_ids"].device.type == "cuda"
+        assert torch.equal(moved["input_ids"].cpu(), inputs["input_ids"])
+        assert manager._copy_stream is stream
+
+
+class TestModelManagerCancellation:
+    """Tests for stopping generation through a cancel event."""
+
+    def test_set_cancel_event_stops_decoding(self):
+        """Test a cancelled request stops after the first decoding step."""
+        manager = _tiny_loaded_manager()
+        cancel_event = threading.Event()
+        cancel_event.set()
+
+        cancelled = manager.translate(
+            "hello there", target_lang="Korean", cancel_event=cancel_event
+        )
+        full = manager.translate("hello there", target_lang="Korean")
+
+        assert len(cancelled) <= 1
+        assert len(full) > len(cancelled)
+
+    def test_unset_cancel_event_does_not_change_output(self):
+        """Test an unset cancel event leaves the translation untouched."""
+        manager = _tiny_loaded_manager()
+
+        with_event = manager.translate(
+            "hello there", target_lang="Korean", cancel_event=threading.Event()
+        )
+        without_event = manager.translate("hello there", target_lang="Korean")
+
+        assert with_event == without_event
+
+
+class TestModelManagerChatTemplate:
+    """Tests for the pre-rendered chat template."""
+
+    def test_rendered_prompt_matches_jinja_template(self):
+        """Test prefix + text + suffix equals the full template render."""
+        manager = ModelManager()
+        manager.tokenizer = _CharTokenizer()
+
+        prompt = manager._render_prompt("Some text", "Korean")
+
+        assert prompt == manager._render_chat_template("Some text", "Korean")
+
+    def test_chat_template_rendered_once_per_language(self):
+        """Test later prompts are built without rendering the template."""
+        manager = ModelManager()
+        manager.tokenizer = _CharTokenizer()
+        manager._render_prompt("First", "Korean")
+        renders = manager.tokenizer.render_count
+
+        manager._render_prompt("Second", "Korean")
+        manager._render_prompt("Third", "Korean")
+
+        assert manager.tokenizer.render_count == renders
+
+    def test_unsplittable_template_renders_per_call(self):
+        """Test a template that transforms the user text falls back to Jinja."""
+        manager = ModelManager()
+        manager.tokenizer = _CharTokenizer()
+        render = manager.tokenizer.apply_chat_template
+
+        def upper_user(messages, **kwargs):
+            messages = [messages[0], {**messages[1], "content": messages[1]["content"].upper()}]
+            return render(messages, **kwargs)
+
+        manager.tokenizer.apply_chat_template = upper_user
+
+        assert manager._chat_template("Korean") is None
+        assert "SOME TEXT" in manager._render_prompt("some text", "Korean")
+
+    def test_initialize_prerenders_supported_languages(self):
+        """Test initialize renders templates for every target language."""
+        manager = ModelManager()
+        manager.tokenizer = _CharTokenizer()
+
+        manager._prerender_chat_templates()
+
+        assert "한국어" in manager._chat_templates
+        assert len(manager._chat_templates) == 10
+
+    def test_prerender_failure_is_not_fatal(self):
+        """Test a failing template render leaves rendering lazy."""
+        manager = ModelManager()
+        manager.tokenizer = Mock()
+        manager.tokenizer.apply_chat_template.side_effect = ValueError("no chat template")
+
+        manager._prerender_chat_templates()
+
+        assert manager._chat_templates == {}
@@ -0,0 +1,118 @@
+"""Unit tests for UserPreferences."""
+
+from unittest.mock import patch
+
+import pytest
+from PySide6.QtCore import QSettings
+
+from core.preferences import Theme, UserPreferences
+
+
+@pytest.fixture
+def preferences(qapp, tmp_path, monkeypatch) -> UserPreferences:
+    """Create UserPreferences backed by a temporary INI file."""
+    ini_path = str(tmp_path / "preferences.ini")
+    monkeypatch.setattr(
+        "core.preferences.QSettings",
+        lambda organization, application: QSettings(ini_path, QSettings.Format.IniFormat),
+    )
+    return UserPreferences()
+
+
+class TestUserPreferencesDebouncedSync:
+    """Tests for coalescing preference writes."""
+
+    def test_setter_does_not_sync_immediately(self, preferences: UserPreferences) -> None:
+        """Setting a value should defer the disk sync."""
+        with patch.object(preferences._settings, "sync") as mock_sync:
+            preferences.dark_mode = True
+            preferences.theme = Theme.DARK
+
+        mock_sync.assert_not_called()
+        assert preferences._flush_timer.isActive()
+
+    def test_burst_of_writes_syncs_once(self, preferences: UserPreferences, qtbot) -> None:
+        """Rapid writes should be flushed with a single sync."""
+        with patch.object(preferences._settings, "sync") as mock_sync:
+            for i in range(10):
+                preferences.set("counter", i)
+            qtbot.waitUntil(lambda: not preferences._flush_timer.isActive(), timeout=2000)
+
+        mock_sync.assert_called_once()
+
+    def test_unchanged_value_is_not_rewritten(self, preferences: UserPreferences) -> None:
+        """Setting a key to its current value should not schedule a sync."""
+        preferences.source_language = "en"
+        preferences.sync()
+
+        with patch.object(preferences._settings, "setValue") as mock_set_value:
+            preferences.source_language = "en"
+            preferences.set("history_panel_visible", True)
+
+        assert [c.args for c in mock_set_value.call_args_list] == [
+            ("preferences/history_panel_visible", True)
+        ]
+
+    def test_value_readable_before_flush(self, preferences: UserPreferences) -> None:
+        """Pending values should be visible to getters immediately."""
+        preferences.source_language = "en"
+
+        assert preferences.source_language == "en"
+
+    def test_sync_flushes_pending_writes(self, preferences: UserPreferences) -> None:
+        """An explicit sync should write now and cancel the pending flush."""
+        preferences.dark_mode = True
+
+        preferences.sync()
+
+        assert not preferences._flush_timer.isActive()
+        assert preferences._dirty is False
+
+
+class TestUserPreferencesReadCache:
+    """Tests for the in-memory read cache."""
+
+    def test_repeated_reads_hit_settings_once(self, preferences: UserPreferences) -> None:
+        """Reading a property twice should query QSettings once."""
+        preferences.invalidate()
+        with patch.object(
+            preferences._settings, "value", wraps=preferences._settings.value
+        ) as mock_value:
+            first = preferences.theme
+            second = preferences.theme
+
+        assert first == second == Theme.AUTO
+        mock_value.assert_called_once()
+
+    def test_setter_updates_cache(self, preferences: UserPreferences) -> None:
+        """A written value should be read back without querying QSettings."""
+        preferences.dark_mode = True
+
+        with patch.object(preferences._settings, "value") as mock_value:
+            assert preferences.dark_mode is True
+
+        mock_value.assert_not_called()
+
+    def test_missing_key_returns_each_callers_default(
+        self, preferences: UserPreferences
+    ) -> None:
+        """Absent generic keys should honour the default passed on every read."""
+        assert preferences.get("missing", 1) == 1
+        assert preferences.get("missing", 2) == 2
+
+    def test_invalidate_rereads_external_changes(self, preferences: UserPreferences) -> None:
+        """invalidate() should pick up values written behind the cache."""
+        assert preferences.source_language == "auto"
+        preferences._settings.setValue("language/source", "ja")
+
+        assert preferences.source_language == "auto"
+        preferences.invalidate()
+        assert preferences.source_language == "ja"
+
+    def test_clear_drops_cached_values(self, preferences: UserPreferences) -> None:
+        """clear() should not leave stale values in the cache."""
+        preferences.target_language = "en"
+
+        preferences.clear()
+
+        assert preferences.target_language == "ko"
@@ -1,10 +1,17 @@
 """Unit tests for TranslationService."""
 
+import heapq
+import logging
+import sys
+import threading
+
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 from PySide6.QtCore import QCoreApplication
 
-from src.core.translator import TranslationService
+from src.core.error_handler import ErrorClassifier
+from src.core import translator as translator_module
+from src.core.translator import RetryState, TranslationService
 
 
 class TestTranslationServiceInit:
@@ -37,14 +44,25 @@ class TestTranslationServiceTranslate:
         task_id = service.translate("Hello, world!", debounce=False)
 
         assert task_id is not None
-        assert len(task_id) == 8  # UUID first 8 chars
+        assert len(task_id) == 9  # "t" + 8 hex digits
+
+    def test_translate_task_ids_are_unique_and_increasing(
+        self, mock_model_manager, mock_language_detector, qapp
+    ):
+        """Test that task IDs come from a per-service counter."""
+        service = TranslationService(mock_model_manager, mock_language_detector)
+
+        ids = [service.translate(text, debounce=True) for text in ("a", "b", "c")]
+
+        assert ids == ["t00000000", "t00000001", "t00000002"]
 
     def test_translate_with_debounce_sets_pending_task(
         self, mock_model_manager, mock_language_detector, qapp
     ):
-        """Test that translate with debounce sets pending task."""
+        """Test that input following a leading-edge request is left pending."""
         service = TranslationService(mock_model_manager, mock_language_detector)
 
+        service.translate("Hell", debounce=True)
         task_id = service.translate("Hello", debounce=True)
 
         assert service.pending_task is not None
@@ -61,6 +79,68 @@ class TestTranslationServiceTranslate:
         # Task should be in active_tasks
         assert task_id in service.active_tasks
 
+    def test_translate_joins_identical_pending_task(
+        self, mock_model_manager, mock_language_detector, qapp
+    ):
+        """Test that an identical request keeps the pending task and its deadline."""
+        service = TranslationService(mock_model_manager, mock_language_detector)
+
+        service.translate("Hell", debounce=True)
+        task_id = service.translate("Hello", debounce=True)
+        with patch.object(service.debounce_timer, "start") as mock_start:
+            again = service.translate("Hello", debounce=True)
+
+        assert again == task_id
+        assert service.pending_task[0] == task_id
+        mock_start.assert_not_called()
+
+    def test_translate_runs_first_request_on_leading_edge(
+        self, mock_model_manager, mock_language_detector, qapp
+    ):
+        """Test that the first request after a quiet period runs without waiting."""
+        service = TranslationService(mock_model_manager, mock_language_detector)
+
+        task_id = service.translate("Hello", debounce=True)
+
+        assert task_id in service.active_tasks
+        assert service.pending_task is None
+        assert service.debounce_timer.isActive()
+        service.shutdown()
+
+    def test_translate_returning_to_running_text_drops_pending_task(
+        self, mock_model_manager, mock_language_detector, qapp
+    ):
+        """Test that input edited back to the running text drops stale pending input."""
+        service = TranslationService(mock_model_manager, mock_language_detector)
+
+        task_id = service.translate("Hello", debounce=True)
+        service.translate("Hello!", debounce=True)
+        again = service.translate("Hello", debounce=True)
+
+        assert again == task_id
+        assert service.pending_task is None
+        service.shutdown()
+
+    def test_translate_joins_identical_running_task(
+        self, mock_model_manager, mock_language_detector, qapp
+    ):
+        """Test that an identical request does not cancel the running task."""
+        service = TranslationService(mock_model_manager, mock_language_detector)
+
+        task_id = service.translate("Hello", debounce=False)
+        worker = service.active_tasks[task_id]
+        again = service.translate("Hello", debounce=True)
+
+        assert again == task_id
+        assert service.pending_task is None
+        assert not worker.is_cancelled
+        # A repeated click on the same text joins the running task too
+        assert service.translate("Hello", debounce=False) == task_id
+        assert not worker.is_cancelled
+        assert service.translate("Hello", target_lang="English", debounce=False) != task_id
+        assert worker.is_cancelled
+        service.shutdown()
+
     def test_translate_cancels_previous_pending_task(
         self, mock_model_manager, mock_language_detector, qapp
     ):
@@ -229,3 +309,415 @@ class TestTranslationServiceSignals:
 
         # Signal should be emitted
         # Note: In real test environment, would need to wait for thread
+
+
+class TestTranslationServiceConcurrentDetection:
+    """Tests for running language detection beside the model call."""
+
+    def test_detection_overlaps_model_translate(self, mock_language_detector, qapp):
+        """Test the model call starts before language detection finishes."""
+        detect_started = threading.Event()
+        release_detect = threading.Event()
+
+        def slow_detect(text):
+            detect_started.set()
+            release_detect.wait(5)
+            return "en"
+
+        def translate(text, source_lang, target_lang, **kwargs):
+            # Runs while detection is still blocked
+            assert detect_started.wait(5)
+            release_detect.set()
+            return "안녕"
+
+        mock_language_detector.detect = Mock(side_effect=slow_detect)
+        model_manager = Mock()
+        model_manager.translate = Mock(side_effect=translate)
+        service = TranslationService(model_manager, mock_language_detector)
+
+        result = service._translate_worker("Hello world", "auto", "Korean")
+
+        assert result == ("en", "안녕")
+
+    def test_detection_failure_defaults_to_english(self, mock_language_detector, qapp):
+        """Test an undetected language falls back to English."""
+        mock_language_detector.detect = Mock(return_value=None)
+        model_manager = Mock()
+        model_manager.translate = Mock(return_value="안녕")
+        service = TranslationService(model_manager, mock_language_detector)
+
+        result = service._translate_worker("Hello world", "auto", "Korean")
+
+        assert result == ("en", "안녕")
+
+
+class TestTranslationServiceCancellation:
+    """Tests for forwarding cancellation into model decoding."""
+
+    def test_worker_receives_cancel_event(self, mock_model_manager, mock_language_detector, qapp):
+        """Test the submitted worker passes its cancel event to the model call."""
+        service = TranslationService(mock_model_manager, mock_language_detector)
+
+        task_id = service.translate("Hello", source_lang="en", debounce=False)
+        worker = service.active_tasks[task_id]
+        service.cancel_task(task_id)
+
+        assert worker.kwargs["cancel_event"] is worker.cancel_event
+        assert worker.cancel_event.is_set()
+        service.shutdown()
+
+    def test_translate_worker_forwards_cancel_event(self, mock_language_detector, qapp):
+        """Test _translate_worker hands the cancel event to ModelManager.translate."""
+        model_manager = Mock()
+        model_manager.translate = Mock(return_value="안녕")
+        service = TranslationService(model_manager, mock_language_detector)
+        cancel_event = threading.Event()
+
+        service._translate_worker("Hello", "en", "Korean", cancel_event=cancel_event)
+
+        assert model_manager.translate.call_args.kwargs["cancel_event"] is cancel_event
+
+
+class TestTranslationServiceGeneratorThread:
+    """Tests for running model calls on one persistent thread."""
+
+    def test_tasks_run_on_the_same_thread(self, mock_language_detector, qtbot):
+        """Test successive translations all run on the generator thread."""
+        threads = []
+        model_manager = Mock()
+        model_manager.translate = Mock(
+            side_effect=lambda **kwargs: threads.append(threading.current_thread()) or "안녕"
+        )
+        service = TranslationService(model_manager, mock_language_detector)
+        completed = []
+        service.translationComplete.connect(lambda task_id, *_: completed.append(task_id))
+
+        for i in range(3):
+            service.translate("Hello", source_lang="en", debounce=False)
+            qtbot.waitUntil(lambda: len(completed) == i + 1, timeout=5000)
+
+        assert len(set(threads)) == 1
+        assert threads[0] is service._generator_thread
+        service.shutdown()
+
+    def test_task_cancelled_while_queued_is_skipped(self, mock_language_detector, qtbot):
+        """Test a superseded task waiting in the queue never reaches the model."""
+        release = threading.Event()
+        texts = []
+
+        def translate(**kwargs):
+            texts.append(kwargs["text"])
+            release.wait(5)
+            return "안녕"
+
+        model_manager = Mock()
+        model_manager.translate = Mock(side_effect=translate)
+        service = TranslationService(model_manager, mock_language_detector)
+        completed = []
+        service.translationComplete.connect(lambda task_id, *_: completed.append(task_id))
+
+        service.translate("first", source_lang="en", debounce=False)
+        qtbot.waitUntil(lambda: texts == ["first"], timeout=5000)
+        service.translate("second", source_lang="en", debounce=False)
+        last = service.translate("third", source_lang="en", debounce=False)
+        release.set()
+        qtbot.waitUntil(lambda: completed == [last], timeout=5000)
+
+        assert texts == ["first", "third"]
+        service.shutdown()
+
+    def test_shutdown_stops_generator_thread(
+        self, mock_model_manager, mock_language_detector, qapp
+    ):
+        """Test shutdown ends the generator thread."""
+        service = TranslationService(mock_model_manager, mock_language_detector)
+
+        service.shutdown()
+
+        assert not service._generator_thread.is_alive()
+
+
+class TestTranslationServiceRetryDelay:
+    """Tests for retry backoff."""
+
+    def test_retry_delay_backs_off_exponentially_up_to_cap(
+        self, mock_model_manager, mock_language_detector, qapp
+    ):
+        """Test delays double per attempt and stop at the configured maximum."""
+        service = TranslationService(mock_model_manager, mock_language_detector)
+
+        delays = [service._calculate_retry_delay(attempt) for attempt in range(1, 7)]
+
+        assert delays == [1000, 2000, 4000, 8000, 10000, 10000]
+        service.shutdown()
+
+
+class TestTranslationServiceRetryScheduling:
+    """Tests for the shared retry timer."""
+
+    def test_due_retries_run_in_deadline_order(
+        self, mock_model_manager, mock_language_detector, qapp
+    ):
+        """Test scheduled retries run once due, earliest first."""
+        service = TranslationService(mock_model_manager, mock_language_detector)
+        for task_id in ("t1", "t2"):
+            service.retry_states[task_id] = RetryState(task_id, "Hello", "en", "Korean", attempt=1)
+        service._retry_heap = [(2.0, "t2"), (1.0, "t1")]
+        heapq.heapify(service._retry_heap)
+
+        with patch.object(service, "_execute_attempt") as mock_execute:
+            service._fire_retries()
+
+        assert [c.args[0].task_id for c in mock_execute.call_args_list] == ["t1", "t2"]
+        assert not service._retry_timer.isActive()
+        service.shutdown()
+
+    def test_retry_is_scheduled_on_shared_timer(
+        self, mock_model_manager, mock_language_detector, qapp
+    ):
+        """Test a retryable error queues the retry instead of a one-off timer."""
+        service = TranslationService(mock_model_manager, mock_language_detector)
+        service.retry_states["t1"] = RetryState("t1", "Hello", "en", "Korean", attempt=1)
+
+        with patch("src.core.translator.QTimer.singleShot") as mock_single_shot:
+            service._handle_error_with_retry("t1", ErrorClassifier.create_timeout_error())
+
+        mock_single_shot.assert_not_called()
+        assert [task_id for _, task_id in service._retry_heap] == ["t1"]
+        assert service._retry_timer.isActive()
+        service.shutdown()
+
+    def test_cancelled_task_is_not_retried(
+        self, mock_model_manager, mock_language_detector, qapp
+    ):
+        """Test retries scheduled before cancellation are dropped."""
+        service = TranslationService(mock_model_manager, mock_language_detector)
+        service.retry_states["t1"] = RetryState("t1", "Hello", "en", "Korean", attempt=1)
+        service._handle_error_with_retry("t1", ErrorClassifier.create_timeout_error())
+
+        service.cancel_all_tasks()
+
+        assert service._retry_heap == []
+        assert not service._retry_timer.isActive()
+        service.shutdown()
+
+    def test_memory_errors_get_fewer_attempts(
+        self, mock_model_manager, mock_language_detector, qapp
+    ):
+        """Test a memory error stops retrying at its own attempt limit."""
+        service = TranslationService(mock_model_manager, mock_language_detector)
+        # Built with the translator's own error module, whose ErrorType it keys on
+        memory_error = translator_module.ErrorClassifier.classify_from_exception(
+            MemoryError("CUDA out of memory")
+        )
+        retrying, failed = [], []
+        service.translationRetrying.connect(lambda *args: retrying.append(args))
+        service.translationError.connect(lambda task_id, error: failed.append(task_id))
+
+        for task_id in ("t1", "t2"):
+            service.retry_states[task_id] = RetryState(task_id, "Hello", "en", "Korean")
+        service.retry_states["t1"].attempt = 1
+        service.retry_states["t2"].attempt = 2
+        service._handle_error_with_retry("t1", memory_error)
+        service._handle_error_with_retry("t2", memory_error)
+
+        assert [args[:3] for args in retrying] == [("t1", 1, 2)]
+        assert failed == ["t2"]
+        service.shutdown()
+
+
+class TestTranslationServiceErrorTraceback:
+    """Tests for lazy traceback formatting on worker errors."""
+
+    def _exc_info(self):
+        """Capture exc_info for a raised error."""
+        try:
+            raise RuntimeError("CUDA out of memory")
+        except RuntimeError:
+            return sys.exc_info()
+
+    def test_traceback_not_formatted_above_debug(
+        self, mock_model_manager, mock_language_detector, qapp
+    ):
+        """Test errors are classified without formatting the traceback at INFO."""
+        service = TranslationService(mock_model_manager, mock_language_detector)
+        errors = []
+        service.translationError.connect(lambda task_id, error: errors.append(error))
+
+        with patch("src.core.translator.traceback.format_exception") as mock_format:
+            service._on_worker_error_with_retry("t1", self._exc_info())
+
+        mock_format.assert_not_called()
+        assert errors[0].message == "CUDA out of memory"
+        service.shutdown()
+
+    def test_traceback_logged_at_debug(
+        self, mock_model_manager, mock_language_detector, qapp, caplog
+    ):
+        """Test the traceback is formatted when DEBUG logging is enabled."""
+        service = TranslationService(mock_model_manager, mock_language_detector)
+
+        with caplog.at_level(logging.DEBUG, logger="src.core.translator"):
+            service._on_worker_error_with_retry("t1", self._exc_info())
+
+        assert "raise RuntimeError" in caplog.text
+        service.shutdown()
+
+
+class TestTranslationServiceErrorClassification:
+    """Tests for classifying worker errors in the worker thread."""
+
+    def test_worker_emits_classified_error(self, mock_language_detector, qtbot):
+        """Test worker errors arrive as a TranslationError built by the worker."""
+        model_manager = Mock()
+        model_manager.translate = Mock(side_effect=ValueError("Text cannot be empty"))
+        service = TranslationService(model_manager, mock_language_detector)
+        errors = []
+        service.translationError.connect(lambda task_id, error: errors.append(error))
+
+        service.translate("Hello", source_lang="en", debounce=False)
+        qtbot.waitUntil(lambda: len(errors) > 0, timeout=5000)
+
+        # Classified by exception type, which a message-only pass can't see
+        assert errors[0].error_type.name == "VALIDATION"
+        assert isinstance(errors[0].original_exception, ValueError)
+        service.shutdown()
+
+
+class TestTranslationServiceTimeouts:
+    """Tests for the shared timeout tick."""
+
+    def test_setup_timeout_records_deadline(
+        self, mock_model_manager, mock_language_detector, qapp
+    ):
+        """Test a timeout is a deadline entry rather than its own timer."""
+        service = TranslationService(mock_model_manager, mock_language_detector)
+
+        service._setup_timeout("t1")
+        service._setup_timeout("t2")
+
+        assert set(service._deadlines) == {"t1", "t2"}
+        assert service._timeout_tick.isActive()
+        service._cancel_timeout("t1")
+        assert set(service._deadlines) == {"t2"}
+        service.shutdown()
+
+    def test_expired_deadline_fires_timeout(
+        self, mock_model_manager, mock_language_detector, qapp
+    ):
+        """Test the scan times out expired tasks and stops once idle."""
+        service = TranslationService(mock_model_manager, mock_language_detector)
+        service._setup_timeout("t1")
+        service._setup_timeout("t2")
+        service._deadlines["t1"] = 0.0
+
+        with patch.object(service, "_on_timeout") as mock_on_timeout:
+            service._scan_deadlines()
+            mock_on_timeout.assert_called_once_with("t1")
+            assert service._timeout_tick.isActive()
+
+            service._deadlines["t2"] = 0.0
+            service._scan_deadlines()
+
+        assert service._deadlines == {}
+        assert not service._timeout_tick.isActive()
+        service.shutdown()
+
+
+class TestTranslationServiceWorkerPool:
+    """Tests for reusing translation workers."""
+
+    def test_finished_worker_is_reused(self, mock_language_detector, qtbot):
+        """Test a finished worker is recycled for the next translation."""
+        model_manager = Mock()
+        model_manager.translate = Mock(return_value="안녕")
+        service = TranslationService(model_manager, mock_language_detector)
+        completed = []
+        service.translationComplete.connect(lambda task_id, *_: completed.append(task_id))
+
+        first_id = service.translate("one", source_lang="en", debounce=False)
+        first = service.active_tasks[first_id]
+        qtbot.waitUntil(lambda: first_id not in service.active_tasks, timeout=5000)
+        second_id = service.translate("two", source_lang="en", debounce=False)
+        second = service.active_tasks[second_id]
+        qtbot.waitUntil(lambda: second_id not in service.active_tasks, timeout=5000)
+
+        assert second is first
+        assert completed == [first_id, second_id]
+        assert model_manager.translate.call_args.kwargs["text"] == "two"
+        assert model_manager.translate.call_args.kwargs["cancel_event"] is second.cancel_event
+        service.shutdown()
+
+    def test_stale_finish_keeps_current_worker(
+        self, mock_model_manager, mock_language_detector, qapp
+    ):
+        """Test a superseded attempt finishing does not release the current worker."""
+        service = TranslationService(mock_model_manager, mock_language_detector)
+        current = Mock(task_id="t1")
+        service._active, service._active_id = current, "t1"
+
+        service._on_worker_retired(Mock(task_id="t1"))
+
+        assert service.active_tasks["t1"] is current
+        assert service._worker_pool == []
+
+        service._on_worker_retired(current)
+
+        assert service.active_tasks == {}
+        assert service._worker_pool == [current]
+        service.shutdown()
+
+    def test_pool_size_is_capped(self, mock_model_manager, mock_language_detector, qapp):
+        """Test released workers beyond the pool size are dropped."""
+        service = TranslationService(mock_model_manager, mock_language_detector)
+
+        for _ in range(service.WORKER_POOL_SIZE + 2):
+            service._release_worker(Mock())
+
+        assert len(service._worker_pool) == service.WORKER_POOL_SIZE
+        service.shutdown()
+
+
+class TestTranslationServiceWorkerCallbacks:
+    """Tests for the direct started/progress callbacks."""
+
+    def test_progress_reaches_listeners_in_order(self, mock_language_detector, qtbot):
+        """Test progress reported from the generator thread arrives before the result."""
+        model_manager = Mock()
+        model_manager.translate = Mock(return_value="안녕")
+        service = TranslationService(model_manager, mock_language_detector)
+        events = []
+        service.translationStarted.connect(lambda task_id: events.append("started"))
+        service.translationProgress.connect(lambda task_id, p, m: events.append(p))
+        service.translationComplete.connect(lambda task_id, *_: events.append("complete"))
+
+        task_id = service.translate("Hello", source_lang="en", debounce=False)
+        worker = service.active_tasks[task_id]
+        qtbot.waitUntil(lambda: "complete" in events, timeout=5000)
+
+        assert worker.on_progress == service._on_worker_progress
+        assert events == ["started", 20, "complete"]
+        service.shutdown()
+
+    def test_repeated_progress_is_reported_once(self, mock_language_detector, qtbot):
+        """Test identical consecutive progress reports are emitted only once."""
+
+        reports = [(50, "Translating..."), (50, "Translating..."), (90, "Done")]
+
+        def translate(progress_callback, **kwargs):
+            for percentage, message in reports:
+                progress_callback(percentage, message)
+            return "안녕"
+
+        model_manager = Mock()
+        model_manager.translate = Mock(side_effect=translate)
+        service = TranslationService(model_manager, mock_language_detector)
+        events = []
+        service.translationProgress.connect(lambda task_id, p, m: events.append(p))
+        service.translationComplete.connect(lambda task_id, *_: events.append("complete"))
+
+        service.translate("Hello", source_lang="en", debounce=False)
+        qtbot.waitUntil(lambda: "complete" in events, timeout=5000)
+
+        assert events == [20, 50, 90, "complete"]
+        service.shutdown()